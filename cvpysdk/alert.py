@@ -129,6 +129,7 @@ from __future__ import unicode_literals
 import xml.etree.ElementTree as ET
 from past.builtins import basestring
 from .exception import SDKException
+from .lookup_table import LookupTable
 
 
 class Alerts(object):
@@ -149,6 +150,7 @@ class Alerts(object):
         self._services = commcell_object._services
         self._update_response_ = commcell_object._update_response_
         self._alerts = None
+        self._alerts_lookup = None
 
         self._notification_types = {
             'email': 1,
@@ -217,11 +219,13 @@ class Alerts(object):
 
         if value in self.all_alerts:
             return self.all_alerts[value]
-        else:
-            try:
-                return list(filter(lambda x: x[1]['id'] == value, self.all_alerts.items()))[0][0]
-            except IndexError:
-                raise IndexError('No alert exists with the given Name / Id')
+
+        alert_name = self._alerts_lookup.get('id', value)
+
+        if alert_name is None:
+            raise IndexError('No alert exists with the given Name / Id')
+
+        return alert_name
 
     def _get_alerts(self):
         """Gets all the alerts associated with the commcell
@@ -708,6 +712,7 @@ class Alerts(object):
     def refresh(self):
         """Refresh the alerts associated with the Commcell."""
         self._alerts = self._get_alerts()
+        self._alerts_lookup = LookupTable.from_dict(self._alerts, 'id')
 
 
 class Alert(object):
@@ -0,0 +1,429 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for running the read operations of the Commcell concurrently via asyncio.
+
+AsyncCommcell is the only class defined in this file.
+
+AsyncCommcell:  Async mirror of an already logged in Commcell, which fans out the REST API
+calls of the Commcell over a bounded pool of worker threads.
+
+The login, Authtoken renewal, and the connection pool are shared with the Commcell object,
+as all the requests are still run via **CVPySDK.make_request**.
+
+Usage:
+
+    >>> import asyncio
+    >>> from cvpysdk.commcell import Commcell
+    >>> from cvpysdk.async_commcell import AsyncCommcell
+
+    >>> commcell = Commcell('webconsole_hostname', 'username', 'password')
+
+    >>> async def main():
+    ...     async with AsyncCommcell(commcell, max_concurrency=32) as async_commcell:
+    ...         return await async_commcell.inventory()
+
+    >>> estate = asyncio.get_event_loop().run_until_complete(main())
+
+
+AsyncCommcell:
+==============
+
+    __init__(commcell_object, max_concurrency)  --  initialize the instance of the AsyncCommcell
+    class for the given commcell
+
+    __repr__()                      --  returns the string representation of the instance
+
+    __aenter__()                    --  returns the current instance, using the "async with"
+    context manager
+
+    __aexit__()                     --  shuts down the worker threads of the instance
+
+    _run()                          --  runs the given function on a worker thread, bounded by
+    the concurrency semaphore
+
+    make_request()                  --  coroutine to run the HTTP request on the URL specified
+
+    get_client()                    --  coroutine to get the Client class instance for a client
+
+    get_clients()                   --  coroutine to get the Client class instances for multiple
+    clients concurrently
+
+    get_agents()                    --  coroutine to get the Agent class instances of a client
+
+    get_backupsets()                --  coroutine to get the Backupset class instances of an agent
+
+    get_subclients()                --  coroutine to get the Subclient class instances of a
+    backupset
+
+    get_job_status()                --  coroutine to get the status of a job
+
+    get_jobs_status()               --  coroutine to get the status of multiple jobs concurrently
+
+    inventory()                     --  coroutine to walk the client / agent / backupset /
+    subclient tree of the commcell concurrently
+
+    close()                         --  shuts down the worker threads of the instance
+
+AsyncCommcell Attributes
+------------------------
+
+    **commcell**                    --  returns the instance of the Commcell class
+
+    **max_concurrency**             --  returns the maximum number of requests run concurrently
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import asyncio
+import functools
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .exception import SDKException
+from .job import get_job_summary
+
+
+class AsyncCommcell(object):
+    """Class for running the read operations on a Commcell concurrently via asyncio."""
+
+    def __init__(self, commcell_object, max_concurrency=16):
+        """Initialize the instance of the AsyncCommcell class.
+
+            Args:
+                commcell_object     (object)    --  instance of the Commcell class, the user is
+                already logged in to
+
+                max_concurrency     (int)       --  maximum number of REST API calls to run
+                concurrently
+
+                    default: 16
+
+            Returns:
+                object  -   instance of the AsyncCommcell class
+
+            Raises:
+                SDKException:
+                    if max concurrency is not a positive integer
+
+        """
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise SDKException('Commcell', '107')
+
+        self._commcell_object = commcell_object
+        self._cvpysdk_object = commcell_object._cvpysdk_object
+        self._services = commcell_object._services
+        self._update_response_ = commcell_object._update_response_
+
+        self._max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+        # semaphore is created on first use, so that it binds to the running event loop
+        self._semaphore = None
+
+    def __repr__(self):
+        """String representation of the instance of this class."""
+        return 'AsyncCommcell class instance for Commcell: "{0}"'.format(
+            self._commcell_object.commserv_name
+        )
+
+    async def __aenter__(self):
+        """Returns the current instance.
+
+            Returns:
+                object  -   the initialized instance referred by self
+
+        """
+        return self
+
+    async def __aexit__(self, exception_type, exception_value, traceback):
+        """Shuts down the worker threads of the current instance."""
+        self.close()
+
+    @property
+    def _bounded(self):
+        """Returns the semaphore bounding the number of concurrent calls."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        return self._semaphore
+
+    async def _run(self, function, *args, **kwargs):
+        """Runs the function on a worker thread, without blocking the event loop.
+
+            Args:
+                function    (callable)  --  function to run
+
+                *args                   --  positional arguments for the function
+
+                **kwargs                --  keyword arguments for the function
+
+            Returns:
+                object  -   value returned by the function
+
+        """
+        async with self._bounded:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(function, *args, **kwargs)
+            )
+
+    async def make_request(self, method, url, payload=None, headers=None, stream=False):
+        """Coroutine to run the HTTP request on the URL specified.
+
+            Args:
+                method      (str)           --  HTTP operation to perform
+
+                url         (str)           --  the web url or service to run the HTTP request on
+
+                payload     (dict / str)    --  data to be passed along with the request
+
+                    default: None
+
+                headers     (dict)          --  dict of request headers for the request
+
+                    default: None
+
+                stream      (bool)          --  boolean specifying whether the request should get
+                data via stream or normal get
+
+                    default: False
+
+            Returns:
+                tuple:
+                    (True, response)    -   in case of success
+
+                    (False, response)   -   in case of failure
+
+        """
+        async with self._bounded:
+            return await self._cvpysdk_object.make_request_async(
+                method, url, payload, headers=headers, stream=stream, executor=self._executor
+            )
+
+    async def get_client(self, client_name):
+        """Coroutine to get the Client class instance for the given client.
+
+            Args:
+                client_name     (str / int)     --  name / hostname / ID of the client
+
+            Returns:
+                object  -   instance of the Client class
+
+        """
+        clients = self._commcell_object.clients
+        return await self._run(clients.get, client_name)
+
+    async def get_clients(self, client_names=None):
+        """Coroutine to get the Client class instances for the given clients concurrently.
+
+            Args:
+                client_names    (list)  --  list of names of the clients
+
+                    default: None, all the clients of the commcell
+
+            Returns:
+                dict    -   dictionary with the client name as key, and the instance of the
+                Client class as value
+
+        """
+        # initialize the clients collection once, before fanning out to the worker threads
+        clients = self._commcell_object.clients
+
+        if client_names is None:
+            client_names = list(clients.all_clients)
+
+        client_objects = await asyncio.gather(
+            *[self.get_client(client_name) for client_name in client_names]
+        )
+
+        return dict(zip(client_names, client_objects))
+
+    async def get_agents(self, client_object):
+        """Coroutine to get the Agent class instances of the given client concurrently.
+
+            Args:
+                client_object   (object)    --  instance of the Client class
+
+            Returns:
+                dict    -   dictionary with the agent name as key, and the instance of the
+                Agent class as value
+
+        """
+        agents = await self._run(lambda: client_object.agents)
+        agent_names = list(agents.all_agents or {})
+
+        agent_objects = await asyncio.gather(
+            *[self._run(agents.get, agent_name) for agent_name in agent_names]
+        )
+
+        return dict(zip(agent_names, agent_objects))
+
+    async def get_backupsets(self, agent_object):
+        """Coroutine to get the Backupset class instances of the given agent concurrently.
+
+            Args:
+                agent_object    (object)    --  instance of the Agent class
+
+            Returns:
+                dict    -   dictionary with the backupset name as key, and the instance of the
+                Backupset class as value
+
+        """
+        # instances are required to resolve the backupset names, fetch them on the worker once
+        await self._run(lambda: agent_object.instances)
+        backupsets = await self._run(lambda: agent_object.backupsets)
+        backupset_names = list(backupsets.all_backupsets)
+
+        backupset_objects = await asyncio.gather(
+            *[self._run(backupsets.get, backupset_name) for backupset_name in backupset_names]
+        )
+
+        return dict(zip(backupset_names, backupset_objects))
+
+    async def get_subclients(self, backupset_object):
+        """Coroutine to get the Subclient class instances of the given backupset concurrently.
+
+            Args:
+                backupset_object    (object)    --  instance of the Backupset class
+
+            Returns:
+                dict    -   dictionary with the subclient name as key, and the instance of the
+                Subclient class as value
+
+        """
+        # subclients are fetched on the worker, as the first access runs the REST API call
+        subclients = await self._run(lambda: backupset_object.subclients)
+        subclient_names = list(await self._run(lambda: subclients.all_subclients))
+
+        subclient_objects = await asyncio.gather(
+            *[self._run(subclients.get, subclient_name) for subclient_name in subclient_names]
+        )
+
+        return dict(zip(subclient_names, subclient_objects))
+
+    async def get_job_status(self, job_id):
+        """Coroutine to get the status of the given job, without initializing the Job object.
+
+            Args:
+                job_id  (int / str)     --  id of the job
+
+            Returns:
+                str     -   status of the job
+
+            Raises:
+                SDKException:
+                    if no job exists with the given job id
+
+                    if response is not success
+
+        """
+        summary = await self._run(get_job_summary, self._commcell_object, job_id)
+
+        if summary is None:
+            raise SDKException('Job', '103', 'Job ID: {0}'.format(job_id))
+
+        return summary['status']
+
+    async def get_jobs_status(self, job_ids):
+        """Coroutine to get the status of the given jobs concurrently.
+
+            Args:
+                job_ids     (list)  --  list of ids of the jobs
+
+            Returns:
+                dict    -   dictionary with the job id as key, and the status as value
+
+                    if failed to get the status of a job, the SDKException raised is returned
+                    as its value
+
+        """
+        statuses = await asyncio.gather(
+            *[self.get_job_status(job_id) for job_id in job_ids], return_exceptions=True
+        )
+
+        return dict(zip(job_ids, statuses))
+
+    async def inventory(self, client_names=None):
+        """Coroutine to walk the client / agent / backupset / subclient tree concurrently.
+
+            Args:
+                client_names    (list)  --  list of names of the clients to walk
+
+                    default: None, all the clients of the commcell
+
+            Returns:
+                dict    -   nested dictionary of the commcell entities
+
+                    {
+                        "client1_name": {
+                            "agent1_name": {
+                                "backupset1_name": {
+                                    "subclient1_name": {
+                                        "id": subclient1_id,
+
+                                        "backupset": backupset
+                                    }
+                                }
+                            }
+                        }
+                    }
+
+                    if failed to walk a client, the exception raised is returned as its value
+
+        """
+        async def _walk_agent(agent_object):
+            backupsets = await self.get_backupsets(agent_object)
+            subclients = await asyncio.gather(*[
+                self._run(lambda backupset=backupset: backupset.subclients.all_subclients)
+                for backupset in backupsets.values()
+            ])
+            return dict(zip(backupsets, subclients))
+
+        async def _walk_client(client_name):
+            client_object = await self.get_client(client_name)
+            agents = await self.get_agents(client_object)
+            backupsets = await asyncio.gather(*[_walk_agent(agent) for agent in agents.values()])
+            return dict(zip(agents, backupsets))
+
+        clients = self._commcell_object.clients
+
+        if client_names is None:
+            client_names = list(clients.all_clients)
+
+        estate = await asyncio.gather(
+            *[_walk_client(client_name) for client_name in client_names], return_exceptions=True
+        )
+
+        return dict(zip(client_names, estate))
+
+    def close(self):
+        """Shuts down the worker threads of the current instance."""
+        self._executor.shutdown(wait=False)
+
+    @property
+    def commcell(self):
+        """Returns the instance of the Commcell class."""
+        return self._commcell_object
+
+    @property
+    def max_concurrency(self):
+        """Returns the maximum number of REST API calls run concurrently."""
+        return self._max_concurrency
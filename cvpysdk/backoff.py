@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for retrying the operations which are not ready yet on the commcell, like a browse
+while the index is still being restored.
+
+Backoff:    Class for the retry policy, with capped exponential backoff, jitter, and an
+overall deadline
+
+run_async():    runs the given function on the shared background executor, and returns the
+future for its result
+
+Usage:
+
+    >>> backoff = Backoff(initial_delay=2, max_delay=30, deadline=120, callback=print)
+
+    >>> paths, paths_dict = backupset.browse(path='c:\\\\data', backoff=backoff)
+
+    >>> future = backupset.browse_async(path='c:\\\\data', backoff=backoff)
+
+    >>> backoff.cancel()      # stop waiting for the browse to be ready
+
+
+Backoff:
+========
+
+    __init__()                  --  initialize the instance of the Backoff class
+
+    __repr__()                  --  returns the string representation of the instance
+
+    delays()                    --  generator to yield the attempt number and the delay before
+    each retry, till the attempts or the deadline are exhausted
+
+    sleep()                     --  waits for the given delay, unless the backoff is cancelled
+
+    retry()                     --  runs the function, and retries it till the result is ready
+
+    cancel()                    --  cancels all the waits and retries of the backoff
+
+Backoff Attributes
+------------------
+
+    **is_cancelled**            --  returns whether the backoff was cancelled
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import random
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+"""object:  Executor shared by the operations run in the background by the SDK."""
+
+
+def run_async(function, *args, **kwargs):
+    """Runs the function on the shared background executor.
+
+        Args:
+            function    (callable)  --  function to run
+
+            *args                   --  positional arguments for the function
+
+            **kwargs                --  keyword arguments for the function
+
+        Returns:
+            object  -   instance of the **concurrent.futures.Future** class for the result
+
+    """
+    return _EXECUTOR.submit(function, *args, **kwargs)
+
+
+class Backoff(object):
+    """Class for the retry policy with capped exponential backoff, jitter, and a deadline."""
+
+    def __init__(
+            self,
+            initial_delay=2,
+            max_delay=60,
+            factor=2,
+            jitter=0.5,
+            max_attempts=10,
+            deadline=300,
+            callback=None):
+        """Initialize the instance of the Backoff class.
+
+            Args:
+                initial_delay   (float)     --  seconds to wait before the first retry
+
+                    default: 2
+
+                max_delay       (float)     --  maximum seconds to wait before any retry
+
+                    default: 60
+
+                factor          (float)     --  factor to increase the delay by, after every retry
+
+                    default: 2
+
+                jitter          (float)     --  fraction of the delay to randomize, so that the
+                retries of multiple callers are spread out
+
+                    default: 0.5
+
+                max_attempts    (int)       --  maximum number of retries
+
+                    default: 10
+
+                deadline        (float)     --  maximum seconds to spend on the retries, in total
+
+                    default: 300
+
+                callback        (callable)  --  function to be called before every wait, with the
+                attempt number, delay in seconds, and the reason of the retry as arguments
+
+                    default: None
+
+            Returns:
+                object  -   instance of the Backoff class
+
+        """
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+        self._factor = factor
+        self._jitter = jitter
+        self._max_attempts = max_attempts
+        self._deadline = deadline
+        self._callback = callback
+
+        self._cancelled = threading.Event()
+
+    def __repr__(self):
+        """String representation of the instance of this class."""
+        return 'Backoff class instance with max attempts: {0}, and deadline: {1}s'.format(
+            self._max_attempts, self._deadline
+        )
+
+    def delays(self):
+        """Generator to yield the delay to wait for, before each retry.
+
+            The generator is exhausted once the maximum attempts are made, the deadline has
+            passed, or the backoff is cancelled. The last delay is trimmed to the deadline.
+
+            Yields:
+                tuple   -   (attempt number, delay in seconds)
+
+        """
+        end_time = time.time() + self._deadline
+        delay = self._initial_delay
+
+        for attempt in range(1, self._max_attempts + 1):
+            remaining = end_time - time.time()
+
+            if remaining <= 0 or self.is_cancelled:
+                return
+
+            jittered = delay * (1 - self._jitter * random.random())
+
+            yield attempt, min(jittered, remaining)
+
+            delay = min(delay * self._factor, self._max_delay)
+
+    def sleep(self, attempt, delay, reason=None):
+        """Waits for the given delay, unless the backoff is cancelled.
+
+            Args:
+                attempt     (int)   --  number of the attempt, the wait is for
+
+                delay       (float) --  seconds to wait for
+
+                reason      (str)   --  reason of the retry, passed to the callback
+
+                    default: None
+
+            Returns:
+                bool    -   False if the backoff was cancelled, True otherwise
+
+        """
+        if self._callback is not None:
+            self._callback(attempt, delay, reason)
+
+        return not self._cancelled.wait(delay)
+
+    def retry(self, function, is_ready, reason=None):
+        """Runs the function, and retries it with backoff till its result is ready.
+
+            Args:
+                function    (callable)  --  function to run, without any arguments
+
+                is_ready    (callable)  --  function to check whether the result is ready,
+                with the result of the function as argument
+
+                reason      (str)       --  reason of the retry, passed to the callback
+
+                    default: None
+
+            Returns:
+                object  -   result of the last run of the function
+
+        """
+        result = function()
+
+        for attempt, delay in self.delays():
+            if is_ready(result):
+                break
+
+            if not self.sleep(attempt, delay, reason):
+                break
+
+            result = function()
+
+        return result
+
+    def cancel(self):
+        """Cancels all the waits and the retries of the backoff."""
+        self._cancelled.set()
+
+    @property
+    def is_cancelled(self):
+        """Returns whether the backoff was cancelled or not."""
+        return self._cancelled.is_set()
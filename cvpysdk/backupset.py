@@ -78,8 +78,8 @@ Backupset:
 
     _get_backupset_properties()     -- get the properties of this backupset
 
-    _run_backup()                   -- runs full backup for the specified subclient,
-    and appends the job object to the return list
+    _run_backup()                   -- runs backup for the specified subclient,
+    and returns the job object
 
     _update()                       -- updates the properties of the backupset
 
@@ -91,14 +91,26 @@ Backupset:
 
     _prepare_browse_options()       -- prepares the options for the Browse/find operation
 
+    _prepare_find_options()         -- prepares the options for the find operation
+
     _prepare_browse_json()          -- prepares the JSON object for the browse request
 
+    _get_browse_result_set()        -- retrieves the result set of items from browse response
+
+    _process_browse_item()          -- retrieves the path and metadata of an item from browse
+    response
+
     _process_browse_response()      -- retrieves the items from browse response
 
     _process_update_request()       --  to process the request using API call
 
+    _browse_request()               -- runs the browse request, retrying with backoff on empty
+    response
+
     _do_browse()                    -- performs a browse operation with the given options
 
+    _iter_browse()                  -- generator to page through the items of browse operation
+
     update_properties()             -- updates the backupset properties
 
     set_default_backupset()         -- sets the backupset as the default backup set for the agent,
@@ -107,10 +119,19 @@ Backupset:
     backup()                        -- runs full backup for all subclients
     associated with this backupset
 
+    backup_async()                  -- submits backup for all subclients associated with this
+    backupset over a bounded worker pool, and returns the futures of the jobs
+
     browse()                        -- browse the content of the backupset
 
+    browse_async()                  -- browse the content of the backupset in the background
+
     find()                          -- find content in the backupset
 
+    iter_browse()                   -- generator to browse the content of the backupset page by page
+
+    iter_find()                     -- generator to find content in the backupset page by page
+
     refresh()                       -- refresh the properties of the backupset
 
     delete_data()                   -- deletes items from the backupset and makes then unavailable
@@ -136,11 +157,17 @@ import time
 import copy
 
 from base64 import b64encode
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from past.builtins import basestring
 
+from .backoff import Backoff
+from .backoff import run_async
+from .job_submitter import JobSubmitter
 from .subclient import Subclients
 from .schedules import Schedules
 from .exception import SDKException
+from .lookup_table import LookupTable
 
 
 class Backupsets(object):
@@ -212,6 +239,7 @@ class Backupsets(object):
             self._BACKUPSETS += '&excludeHidden=0'
 
         self._backupsets = None
+        self._backupsets_lookup = None
         self._default_backup_set = None
         self.refresh()
 
@@ -266,13 +294,13 @@ class Backupsets(object):
 
         if value in self.all_backupsets:
             return self.all_backupsets[value]
-        else:
-            try:
-                return list(
-                    filter(lambda x: x[1]['id'] == value, self.all_backupsets.items())
-                )[0][0]
-            except IndexError:
-                raise IndexError('No backupset exists with the given Name / Id')
+
+        backupset_name = self._backupsets_lookup.get('id', value)
+
+        if backupset_name is None:
+            raise IndexError('No backupset exists with the given Name / Id')
+
+        return backupset_name
 
     def _get_backupsets(self):
         """Gets all the backupsets associated to the agent specified by agent_object.
@@ -911,6 +939,7 @@ request_json['backupSetInfo'].update({
     def refresh(self):
         """Refresh the backupsets associated with the Agent / Instance."""
         self._backupsets = self._get_backupsets()
+        self._backupsets_lookup = LookupTable.from_dict(self._backupsets, 'id')
 
     @property
     def default_backup_set(self):
@@ -1012,6 +1041,7 @@ class Backupset(object):
             'include_running_jobs': False,
             'vs_volume_browse': False,
             'browse_view_name': 'VOLUMEVIEW',
+            'backoff': None,  # instance of the Backoff class, to wait for the index with
 
             '_subclient_id': 0,
             '_raw_response': False
@@ -1085,18 +1115,16 @@ class Backupset(object):
         else:
             raise SDKException('Response', '101', self._update_response_(response.text))
 
-    def _run_backup(self, subclient_name, return_list, **kwargs):
-        """Triggers backup job for the given subclient, and appends its Job object to the list.
+    def _run_backup(self, subclient_name, **kwargs):
+        """Triggers backup job for the given subclient, and returns its Job object.
             Backup job is started only when backup activity is enabled and storage policy is set for it.
 
-            The SDKException class instance is appended to the list,
-            if any exception is raised while running the backup job for the Subclient.
+            The subclient is initialized from the properties already fetched with the list of
+            subclients, and is checked against the same properties.
 
             Args:
                 subclient_name (str)   --  name of the subclient to trigger the backup for
 
-                return_list    (list)  --  list to append the job object to
-
             Kwargs:
                 All arguments used by subclient.backup() can be used here. Commonly used arguments are
 
@@ -1106,17 +1134,15 @@ class Backupset(object):
                                     making the request
 
             Returns:
-                None
+                object  -   instance of the Job class for the backup job
+
+                None    -   if backup is not enabled, or storage policy is not set for the subclient
 
         """
-        try:
-            subclient = self.subclients.get(subclient_name)
-            if subclient.is_backup_enabled and subclient.storage_policy is not None:
-                job = subclient.backup(**kwargs)
-                return_list.append(job)
-                time.sleep(2)  # Staggering the next backup job to be started
-        except SDKException as excp:
-            return_list.append(excp)
+        subclient = self.subclients._get_prefetched(subclient_name)
+
+        if subclient.is_backup_enabled and subclient.storage_policy is not None:
+            return subclient.backup(**kwargs)
 
     def _process_update_reponse(self, request_json):
         """Runs the Backupset update API with the request JSON provided,
@@ -1274,6 +1300,37 @@ class Backupset(object):
         self._set_defaults(options, self._default_browse_options)
         return options
 
+    def _prepare_find_options(self, options):
+        """Prepares the options for the find operation, from the additional find options.
+
+            Args:
+                options     (dict)  --  a dictionary of find options
+
+            Returns:
+                dict - The browse options with the filters for the find operation set
+        """
+        options['operation'] = 'find'
+
+        if 'path' not in options:
+            options['path'] = '\\**\\*'
+
+        if 'filters' not in options:
+            options['filters'] = []
+
+        if 'file_name' in options:
+            options['filters'].append(('FileName', options['file_name']))
+
+        if 'file_size_gt' in options:
+            options['filters'].append(('FileSize', options['file_size_gt'], 'GTE'))
+
+        if 'file_size_lt' in options:
+            options['filters'].append(('FileSize', options['file_size_lt'], 'LTE'))
+
+        if 'file_size_et' in options:
+            options['filters'].append(('FileSize', options['file_size_et'], 'EQUALSBLAH'))
+
+        return options
+
     def _prepare_browse_json(self, options):
         """Prepares the JSON object for the browse request.
 
@@ -1474,8 +1531,8 @@ class Backupset(object):
 
         return all_versions_dict
 
-    def _process_browse_response(self, flag, response, options):
-        """Retrieves the items from browse response.
+    def _get_browse_result_set(self, flag, response, options, allow_empty=False):
+        """Retrieves the result set of the items from browse response.
 
         Args:
             flag        (bool)  --  boolean, whether the response was success or not
@@ -1484,10 +1541,15 @@ class Backupset(object):
 
             options     (dict)  --  The browse options dictionary
 
+            allow_empty (bool)  --  boolean specifying whether to return an empty list,
+            instead of raising an exception, if the response has no items
+
+                default: False
+
         Returns:
-            list - List of only the file / folder paths from the browse response
+            list - List of the items in the browse response
 
-            dict - Dictionary of all the paths with additional metadata retrieved from browse
+            None - if the browse response has neither result, nor any error message
 
         Raises:
             SDKException:
@@ -1515,15 +1577,9 @@ class Backupset(object):
         if flag:
 
             response_json = response.json()
-            paths_dict = {}
-            paths = []
             result_set = None
             browse_result = None
 
-            # Send raw result as browse response for advanced use cases
-            if options['_raw_response']:
-                return [], response_json
-
             if response_json and 'browseResponses' in response_json:
                 _browse_responses = response_json['browseResponses']
                 for browse_response in _browse_responses:
@@ -1541,62 +1597,147 @@ class Backupset(object):
                         o_str = exception_message
                         raise SDKException('Subclient', '102', o_str.format(error_message))
                     except KeyError:
-                        return [], {}
+                        return None
 
                 if not result_set:
+                    if allow_empty:
+                        return []
+
                     raise SDKException('Subclient', exception_code)
 
                 if not isinstance(result_set, list):
                     result_set = [result_set]
 
-                if 'all_versions' in options['operation']:
-                    return self._process_browse_all_versions_response(result_set)
+                return result_set
+            else:
+                raise SDKException('Response', '102')
+        else:
+            raise SDKException('Response', '101', self._update_response_(response.text))
 
-                for result in result_set:
-                    name = result.get('displayName')
-                    snap_display_name = result.get('name')
+    def _process_browse_item(self, result, options):
+        """Retrieves the path and the metadata of an item from browse response.
 
-                    if 'path' in result:
-                        path = result['path']
-                    else:
-                        path = '\\'.join([options['path'], name])
+        Args:
+            result      (dict)  --  item in the result set of the browse response
 
-                    if 'modificationTime' in result and int(result['modificationTime']) > 0:
-                        mod_time = time.localtime(int(result['modificationTime']))
-                        mod_time = time.strftime('%d/%m/%Y %H:%M:%S', mod_time)
-                    else:
-                        mod_time = None
+            options     (dict)  --  The browse options dictionary
 
-                    if 'file' in result['flags']:
-                        if result['flags']['file'] in (True, '1'):
-                            file_or_folder = 'File'
-                        else:
-                            file_or_folder = 'Folder'
-                    else:
-                        file_or_folder = 'Folder'
+        Returns:
+            str  - path of the file / folder
 
-                    if 'size' in result:
-                        size = result['size']
-                    else:
-                        size = None
-
-                    paths_dict[path] = {
-                        'name': name,
-                        'snap_display_name': snap_display_name,
-                        'size': size,
-                        'modified_time': mod_time,
-                        'type': file_or_folder,
-                        'advanced_data': result['advancedData']
-                    }
+            dict - metadata of the file / folder retrieved from browse
+        """
+        name = result.get('displayName')
+        snap_display_name = result.get('name')
 
-                    paths.append(path)
+        if 'path' in result:
+            path = result['path']
+        else:
+            path = '\\'.join([options['path'], name])
+
+        if 'modificationTime' in result and int(result['modificationTime']) > 0:
+            mod_time = time.localtime(int(result['modificationTime']))
+            mod_time = time.strftime('%d/%m/%Y %H:%M:%S', mod_time)
+        else:
+            mod_time = None
 
-                return paths, paths_dict
+        if 'file' in result['flags']:
+            if result['flags']['file'] in (True, '1'):
+                file_or_folder = 'File'
             else:
-                raise SDKException('Response', '102')
+                file_or_folder = 'Folder'
         else:
-            raise SDKException('Response', '101', self._update_response_(response.text))
+            file_or_folder = 'Folder'
+
+        if 'size' in result:
+            size = result['size']
+        else:
+            size = None
+
+        return path, {
+            'name': name,
+            'snap_display_name': snap_display_name,
+            'size': size,
+            'modified_time': mod_time,
+            'type': file_or_folder,
+            'advanced_data': result['advancedData']
+        }
+
+    def _process_browse_response(self, flag, response, options):
+        """Retrieves the items from browse response.
+
+        Args:
+            flag        (bool)  --  boolean, whether the response was success or not
+
+            response    (dict)  --  JSON response received for the request from the Server
+
+            options     (dict)  --  The browse options dictionary
+
+        Returns:
+            list - List of only the file / folder paths from the browse response
+
+            dict - Dictionary of all the paths with additional metadata retrieved from browse
+
+        Raises:
+            SDKException:
+                if failed to browse/search for content
+
+                if response is empty
+
+                if response is not success
+        """
+        # Send raw result as browse response for advanced use cases
+        if flag and options['_raw_response']:
+            return [], response.json()
+
+        result_set = self._get_browse_result_set(flag, response, options)
+
+        if result_set is None:
+            return [], {}
+
+        if 'all_versions' in options['operation']:
+            return self._process_browse_all_versions_response(result_set)
+
+        paths_dict = {}
+        paths = []
+
+        for result in result_set:
+            path, item = self._process_browse_item(result, options)
+            paths_dict[path] = item
+            paths.append(path)
+
+        return paths, paths_dict
+
+    def _browse_request(self, request_json, retry=10, backoff=None):
+        """Runs the browse request, retrying while the server returns an empty response,
+            i.e., the index is not ready yet.
+
+        Args:
+            request_json    (dict)      --  JSON request for the browse operation
+
+            retry           (int)       --  Number of times to retry for browse
+
+            backoff         (object)    --  instance of the Backoff class, to wait between
+            the retries with
+
+                default: None, exponential backoff of up to 120 seconds between the retries,
+                within 120 seconds per retry in total
+
+        Returns:
+            tuple - (flag, response) as returned by **CVPySDK.make_request**
+        """
+        if backoff is None:
+            # keep the budget of the fixed 120 seconds wait per retry, used earlier
+            backoff = Backoff(max_delay=120, max_attempts=retry, deadline=retry * 120)
+
+        def _request():
+            return self._cvpysdk_object.make_request('POST', self._BROWSE, request_json)
 
+        def _is_ready(result):
+            flag, response = result
+            return not flag or response.json() != {}
+
+        return backoff.retry(_request, _is_ready, 'Browse response is empty, index is not ready')
 
     def _do_browse(self, options=None, retry=10):
         """Performs a browse operation with the given options.
@@ -1617,20 +1758,100 @@ class Backupset(object):
         options = self._prepare_browse_options(options)
         request_json = self._prepare_browse_json(options)
 
-        flag, response = self._cvpysdk_object.make_request('POST', self._BROWSE, request_json)
+        flag, response = self._browse_request(request_json, retry, options['backoff'])
 
-        attempt = 1
-        while attempt <= retry:
-            if response.json() == {}:
-                time.sleep(120)
-                flag, response = self._cvpysdk_object.make_request('POST', self._BROWSE, request_json)
-            else:
-                break
-            attempt += 1
         return self._process_browse_response(flag, response, options)
-    
-    
 
+    def _iter_browse(self, options, prefetch=2, retry=10):
+        """Generator to page through the items of a browse / find operation.
+
+        Args:
+            options     (dict)  --  dictionary of browse options
+
+                page_size is the number of items fetched in a single request
+
+            prefetch    (int)   --  number of pages to fetch concurrently, ahead of the page
+            being consumed
+
+                default: 2
+
+            retry       (int)   --  Number of times to retry for browse
+
+        Yields:
+            tuple - (path, metadata) of each file / folder retrieved from browse
+        """
+        options['_raw_response'] = False
+        options = self._prepare_browse_options(options)
+
+        if options['operation'].lower() not in ('browse', 'find'):
+            raise SDKException('Backupset', '102', 'Only browse and find can be iterated')
+
+        page_size = int(options['page_size'])
+        first_node = int(options['skip_node'])
+        prefetch = max(prefetch, 1)
+        last_page_fetched = threading.Event()
+
+        # number of pages as per the total items reported with the first page, if any
+        total_pages = []
+
+        def _get_page(page_number):
+            page_options = dict(options, skip_node=first_node + page_number * page_size)
+            request_json = self._prepare_browse_json(page_options)
+
+            if page_number:
+                # the index is ready once the first page is fetched, an empty response for the
+                # next pages is past the last item, and is not retried
+                flag, response = self._cvpysdk_object.make_request(
+                    'POST', self._BROWSE, request_json
+                )
+            else:
+                flag, response = self._browse_request(request_json, retry, options['backoff'])
+
+                if flag:
+                    for browse_response in (response.json() or {}).get('browseResponses', []):
+                        total = browse_response.get('browseResult', {}).get('totalItemsFound')
+
+                        if total is not None:
+                            total_pages.append(-(-(int(total) - first_node) // page_size))
+                            break
+
+            result_set = self._get_browse_result_set(
+                flag, response, page_options, allow_empty=True
+            )
+
+            # a page shorter than the page size is the last page
+            if not result_set or len(result_set) < page_size:
+                last_page_fetched.set()
+
+            return result_set
+
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        pages = deque([executor.submit(_get_page, 0)])
+        next_page = 1
+
+        try:
+            while pages:
+                result_set = pages.popleft().result()
+
+                # fetch the next pages while this page is consumed, till the last page is seen,
+                # and not beyond the total items, other than the page right after this one
+                while len(pages) < prefetch and not last_page_fetched.is_set():
+                    if pages and total_pages and next_page >= total_pages[0]:
+                        break
+
+                    pages.append(executor.submit(_get_page, next_page))
+                    next_page += 1
+
+                for result in result_set or []:
+                    yield self._process_browse_item(result, options)
+
+                if not result_set or len(result_set) < page_size:
+                    break
+        finally:
+            for page in pages:
+                page.cancel()
+
+            executor.shutdown(wait=False)
 
     def update_properties(self, properties_dict):
         """Updates the backupset properties
@@ -1908,27 +2129,107 @@ class Backupset(object):
                 common_backup_options      (dict)  --  advanced job options to be included while
                                                         making request
 
+                submitter           (object)    --  instance of the JobSubmitter class, to
+                throttle the submission of the backup jobs with
+
+                    default: None, refer **backup_async()**
+
+                max_workers         (int)       --  maximum number of backup jobs to submit
+                concurrently, if no submitter is given
+
+                    default: JobSubmitter.DEFAULT_MAX_WORKERS
+
+                rate                (float)     --  maximum number of backup jobs to submit per
+                second, if no submitter is given
+
+                    default: JobSubmitter.DEFAULT_RATE
+
             Returns:
                 list    -   list consisting of the job objects for the backup jobs started for
                 the subclients in the backupset
 
         """
         return_list = []
-        thread_list = []
 
-        if self.subclients.all_subclients:
-            for subclient in self.subclients.all_subclients:
-                thread = threading.Thread(
-                    target=self._run_backup, args=(subclient, return_list), kwargs=kwargs
-                )
-                thread_list.append(thread)
-                thread.start()
+        for future in self.backup_async(**kwargs).values():
+            try:
+                job = future.result()
 
-        for thread in thread_list:
-            thread.join()
+                if job is not None:
+                    return_list.append(job)
+            except SDKException as excp:
+                return_list.append(excp)
 
         return return_list
 
+    def backup_async(self, submitter=None, max_workers=None, rate=None, **kwargs):
+        """Submits backup jobs for all subclients in this backupset, over a bounded pool of
+            worker threads, throttled by the submission rate of the submitter, if given.
+
+            The subclients for which backup activity is disabled, as per the properties already
+            fetched with the list of subclients, are skipped without initializing them.
+
+            Args:
+                submitter           (object)    --  instance of the JobSubmitter class, to submit
+                the backup jobs with
+
+                    default: None, the jobs are submitted on the worker threads of this call,
+                    bounded by the max workers, and throttled by the rate
+
+                max_workers         (int)       --  maximum number of backup jobs to submit
+                concurrently, if no submitter is given
+
+                    default: None, JobSubmitter.DEFAULT_MAX_WORKERS
+
+                rate                (float)     --  maximum number of backup jobs to submit per
+                second, if no submitter is given
+
+                    default: None, JobSubmitter.DEFAULT_RATE
+
+            kwargs:
+                Please refer subclient.backup() for all the supported arguments.
+
+            Returns:
+                dict    -   dictionary with the subclient name as key, and the future for the
+                Job class instance of its backup job as value
+
+                    the future is resolved with None, if backup was not started for the subclient
+
+        """
+        subclients = self.subclients
+        subclient_names = [
+            subclient_name
+            for subclient_name in subclients.all_subclients
+            if subclients._can_run_backup(subclient_name) is not False
+        ]
+
+        if not subclient_names:
+            return {}
+
+        # the workers are not shared with the other calls, as a job submitted from the worker
+        # of a shared pool could wait for a worker of the same pool forever
+        own_submitter = submitter is None
+
+        if own_submitter:
+            max_workers = max_workers or JobSubmitter.DEFAULT_MAX_WORKERS
+            submitter = JobSubmitter(
+                max_workers=min(len(subclient_names), max_workers),
+                rate=rate or JobSubmitter.DEFAULT_RATE
+            )
+
+        futures = {}
+
+        try:
+            for subclient_name in subclient_names:
+                futures[subclient_name] = submitter.submit(
+                    self._run_backup, subclient_name, **kwargs
+                )
+        finally:
+            if own_submitter:
+                submitter.shutdown(wait=False)
+
+        return futures
+
 
 
     def browse(self, *args, **kwargs):
@@ -1984,6 +2285,25 @@ class Backupset(object):
 
         return self._do_browse(options)
 
+    def browse_async(self, *args, **kwargs):
+        """Browses the content of the Backupset in the background.
+
+            Args:
+                Dictionary of browse options, same as browse
+
+            Kwargs:
+                Keyword argument of browse options, same as browse
+
+                    backoff     (object)    --  instance of the Backoff class, to wait for the
+                    index to be ready with, and to cancel the wait via **Backoff.cancel()**
+
+            Returns:
+                object  -   instance of the **concurrent.futures.Future** class, resolved with
+                the (list, dict) returned by browse
+
+        """
+        return run_async(self.browse, *args, **kwargs)
+
     def find(self, *args, **kwargs):
         """Searches a file/folder in the backed up content of the backupset,
             and returns all the files matching the filters given.
@@ -2043,27 +2363,93 @@ class Backupset(object):
         else:
             options = kwargs
 
-        options['operation'] = 'find'
+        return self._do_browse(self._prepare_find_options(options))
 
-        if 'path' not in options:
-            options['path'] = '\\**\\*'
+    def iter_browse(self, *args, **kwargs):
+        """Generator to browse the content of the Backupset, one page at a time.
 
-        if 'filters' not in options:
-            options['filters'] = []
+            Unlike browse, the items are yielded as the pages are received, and only the
+            pages being fetched are held in memory.
 
-        if 'file_name' in options:
-            options['filters'].append(('FileName', options['file_name']))
+            Args:
+                Dictionary of browse options, same as browse
 
-        if 'file_size_gt' in options:
-            options['filters'].append(('FileSize', options['file_size_gt'], 'GTE'))
+            Kwargs:
+                Keyword argument of browse options, same as browse
 
-        if 'file_size_lt' in options:
-            options['filters'].append(('FileSize', options['file_size_lt'], 'LTE'))
+                Additional options supported:
+                    page_size       (int)   --  number of items to fetch in a single request
 
-        if 'file_size_et' in options:
-            options['filters'].append(('FileSize', options['file_size_et'], 'EQUALSBLAH'))
+                        default: 1000
 
-        return self._do_browse(options)
+                    prefetch        (int)   --  number of pages to fetch concurrently, ahead of
+                    the page being consumed
+
+                        default: 2
+
+            Yields:
+                tuple   -   (path, metadata) of each file / folder retrieved from browse
+
+            Refer `default_browse_options`_ for all the supported options.
+
+            .. _default_browse_options: https://github.com/CommvaultEngg/cvpysdk/blob/master/cvpysdk/backupset.py#L565
+
+        """
+        if args and isinstance(args[0], dict):
+            options = dict(args[0])
+        else:
+            options = kwargs
+
+        options['operation'] = 'browse'
+        options.setdefault('page_size', 1000)
+        prefetch = options.pop('prefetch', 2)
+
+        return self._iter_browse(options, prefetch)
+
+    def iter_find(self, *args, **kwargs):
+        """Generator to search a file/folder in the backed up content of the backupset,
+            one page at a time.
+
+            Unlike find, the items are yielded as the pages are received, and only the
+            pages being fetched are held in memory.
+
+            Args:
+                Dictionary of browse options, same as find
+
+            Kwargs:
+                Keyword argument of browse options, same as find
+
+                Additional options supported:
+                    page_size       (int)   --  number of items to fetch in a single request
+
+                        default: 1000
+
+                    prefetch        (int)   --  number of pages to fetch concurrently, ahead of
+                    the page being consumed
+
+                        default: 2
+
+            Yields:
+                tuple   -   (path, metadata) of each file / folder matching the filters given
+
+            Refer `default_browse_options`_ for all the supported options.
+
+            .. _default_browse_options: https://github.com/CommvaultEngg/cvpysdk/blob/master/cvpysdk/backupset.py#L565
+
+        """
+        if args and isinstance(args[0], dict):
+            options = dict(args[0])
+        else:
+            options = kwargs
+
+        # the filters of the find are appended to the list, which is not the caller's
+        if 'filters' in options:
+            options['filters'] = list(options['filters'])
+
+        options.setdefault('page_size', 1000)
+        prefetch = options.pop('prefetch', 2)
+
+        return self._iter_browse(self._prepare_find_options(options), prefetch)
     
     def create_subclient(self, subclient, storagepolicyname, description):
 
@@ -2118,5 +2504,9 @@ class Backupset(object):
         """Refresh the properties of the Backupset."""
         self._get_backupset_properties()
 
+        if self.subclients is not None:
+            # fetch the subclients created / deleted outside of the SDK since the last refresh
+            self.subclients.refresh()
+
         self.subclients = Subclients(self)
         self.schedules = Schedules(self)
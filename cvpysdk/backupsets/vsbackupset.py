@@ -23,6 +23,8 @@ VSBackupset is the only class defined in this file.
 VSBackupset:
 
     browse()                        -- browse the content of the backupset
+    _do_browse()                    -- performs a browse operation, waiting for the index to be
+    rebuilt, if required
     _process_browse_response()      -- retrieves the items from browse response
 
     To add a new Virtual Backupset, create a class in a new module under _virtual_server sub package
@@ -46,6 +48,7 @@ import time
 from importlib import import_module
 from inspect import isabstract, isclass, getmembers
 
+from ..backoff import Backoff
 from ..backupset import Backupset
 from ..client import Client
 from ..exception import SDKException
@@ -114,9 +117,47 @@ class VSBackupset(Backupset):
         else:
             options = kwargs
 
-        options['retry_count'] = 0
         return self._do_browse(options)
 
+    def _do_browse(self, options=None, retry=10):
+        """Performs a browse operation with the given options, and retries it with backoff
+            while the index is being rebuilt.
+
+            Args:
+                options     (dict)  --  dictionary of browse options
+
+                retry       (int)   --  Number of times to retry for browse
+
+            Returns:
+                list - List of only the file, folder paths from the browse response
+
+                dict - Dictionary of all the paths with additional metadata retrieved from browse
+
+            Raises:
+                Exception:
+                    if the index is not rebuilt within the retries of the backoff
+        """
+        if options is None:
+            options = {}
+
+        # wait for the index to be rebuilt, with a longer backoff by default
+        backoff = options.get('backoff') or Backoff(
+            initial_delay=30, max_delay=180, max_attempts=3, deadline=900
+        )
+        delays = backoff.delays()
+
+        while True:
+            result = super(VSBackupset, self)._do_browse(options, retry)
+
+            if result is not None:
+                return result
+
+            delay = next(delays, None)
+
+            if delay is None or not backoff.sleep(*delay, reason='Index is being rebuilt'):
+                err = "Maximum browse attemps exhausted. Browse did not give full results"
+                raise Exception(err)
+
     def _process_browse_response(self, flag, response, options):
         """Retrieves the items from browse response.
 
@@ -132,6 +173,8 @@ class VSBackupset(Backupset):
 
                     dict - Dictionary of all the paths with additional metadata retrieved from browse
 
+                    None - if the index is being rebuilt, and the browse has to be retried
+
                 Raises:
                     SDKException:
                         if failed to browse/search for content
@@ -145,7 +188,6 @@ class VSBackupset(Backupset):
         result_set = None
         browse_result = None
         error_message = None
-        options['retry_count'] = options['retry_count'] + 1
 
         if flag:
             response_json = response.json()
@@ -158,12 +200,7 @@ class VSBackupset(Backupset):
                         error_message = message['errorMessage']
                         if resp_type == 2 or resp_type == 3 and 'No items found in the index, possibly index is being rebuilt' in \
                                 error_message:
-                            if options['retry_count'] <= 3:
-                                time.sleep(180)
-                                return self._do_browse(options)
-                            else:
-                                err = "Maximum browse attemps exhausted. Browse did not give full results"
-                                raise Exception(err)
+                            return None
                     if "browseResult" in browse_response:
                         browse_result = browse_response['browseResult']
                         if 'dataResultSet' in browse_result:
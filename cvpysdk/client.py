@@ -43,6 +43,9 @@ Clients
     __getitem__()                         --  returns the name of the client at the given index
     or the details for the given client name
 
+    _lazy_init()                          --  returns the value of the attribute, initializing
+    it on the first access
+
     _get_clients()                        --  gets all the clients associated with the commcell
 
     _get_office_365_clients()             --  get all office365 clients in the commcell
@@ -65,6 +68,9 @@ Clients
     _get_hidden_client_from_hostname()    --  returns the client name if associated with specified
     hostname if exists
 
+    _get_client_from_display_name()       --  returns the client name if associated with specified
+    display name if exists
+
     has_client(client_name)               --  checks if a client exists with the given name or not
 
     has_hidden_client(client_name)        --  checks if a hidden client exists with the given name
@@ -101,9 +107,20 @@ Clients
 
     add_onedrive_client()                 --  adds a new onedrive client
 
+    _resolve_client()                     --  returns the name and id of the client matching the
+    input name / hostname / ID
+
+    _get_client_properties_json()         --  gets the properties JSON of the client with given id
+
     get(client_name)                      --  returns the Client class object of the input client
     name
 
+    get_many()                            --  returns the Client class objects of the input clients,
+    fetching their properties in parallel
+
+    iter_objects()                        --  yields the Client class objects of the input clients,
+    as soon as their properties are fetched in parallel
+
     delete(client_name)                   --  deletes the client specified by the client name from
     the commcell
 
@@ -137,8 +154,14 @@ Client
 
     _get_client_id()             --  method to get the client id, if not specified in __init__
 
+    _lazy_init()                 --  returns the value of the attribute, initializing it on
+    the first access
+
     _get_client_properties()     --  get the properties of this client
 
+    _initialize_client_properties() --  initializes the attributes of this client from the
+    properties JSON
+
     _get_instance_of_client()    --  get the instance associated with the client
 
     _get_log_directory()         --  get the log directory path on the client
@@ -292,6 +315,9 @@ Client Attributes
     **agents**                      --  returns the instance of the Agents class representing
     the list of agents installed on the Client
 
+    **subclient_index**             --  returns the instance of the SubclientIndex class, for the
+    subclients of all the agents installed on the Client
+
     **schedules**                   --  returns the instance of the Schedules class representing
     the list of schedules configured for the Client
 
@@ -323,14 +349,22 @@ import os
 import re
 import time
 import copy
+import mmap
+import threading
 
 from base64 import b64encode
+from itertools import islice
 from past.builtins import basestring
 
 import requests
 
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
 from .job import Job
 from .agent import Agents
+from .subclient import SubclientIndex
 from .schedules import Schedules
 from .exception import SDKException
 from .deployment.install import Install
@@ -342,6 +376,11 @@ from .network_throttle import NetworkThrottle
 from .security.user import Users
 
 from .name_change import NameChange
+from .lookup_table import LookupTable
+from .backoff import Backoff
+
+UPLOAD_CHUNK_SIZE = 1024 ** 2 * 2
+"""int:     default size of the chunks the files are uploaded to the client machine in, in bytes"""
 
 
 class Clients(object):
@@ -378,6 +417,11 @@ class Clients(object):
         self._hidden_clients = None
         self._virtualization_clients = None
         self._office_365_clients = None
+        self._clients_lookup = None
+        self._hidden_clients_lookup = None
+
+        # guards the lazy attributes, and the clients replaced together by refresh()
+        self._lock = threading.RLock()
 
         self.refresh()
 
@@ -424,18 +468,53 @@ class Clients(object):
         """
         value = str(value).lower()
 
-        if value in self.all_clients:
-            return self.all_clients[value]
-        else:
-            try:
-                return list(filter(lambda x: x[1]['id'] == value, self.all_clients.items()))[0][0]
-            except IndexError:
-                raise IndexError('No client exists with the given Name / Id')
+        with self._lock:
+            if value in self.all_clients:
+                return self.all_clients[value]
+
+            client_name = self._clients_lookup.get('id', value)
+
+        if client_name is None:
+            raise IndexError('No client exists with the given Name / Id')
+
+        return client_name
+
+    def _lazy_init(self, attribute, factory, *args):
+        """Returns the value of the attribute, initializing it on the first access.
+
+            The attribute is initialized only once under the lock, even if it is accessed by
+            multiple threads at the same time.
+
+            Args:
+                attribute   (str)       --  name of the attribute of this instance
+
+                factory     (callable)  --  function / class to get the value of the attribute
+
+                *args                   --  arguments to call the factory with
+
+            Returns:
+                object  -   value of the attribute
+
+        """
+        value = getattr(self, attribute)
+
+        if value is None:
+            with self._lock:
+                value = getattr(self, attribute)
+
+                if value is None:
+                    value = factory(*args)
+                    setattr(self, attribute, value)
+
+        return value
 
     def _get_clients(self):
-        """Gets all the clients associated with the commcell
+        """Gets all the clients associated with the commcell, and builds the lookup table of
+            the clients by their id, hostname and display name
 
             Returns:
+                tuple   -   (dict of the clients, LookupTable of the clients)
+
                 dict    -   consists of all clients in the commcell
 
                     {
@@ -464,6 +543,8 @@ class Clients(object):
         flag, response = self._cvpysdk_object.make_request('GET', self._CLIENTS)
 
         if flag:
+            clients_lookup = LookupTable('id', 'hostname', 'display_name')
+
             if response.json() and 'clientProperties' in response.json():
                 clients_dict = {}
 
@@ -475,10 +556,17 @@ class Clients(object):
                         'id': temp_id,
                         'hostname': temp_hostname
                     }
+                    clients_lookup.add(
+                        temp_name,
+                        id=temp_id,
+                        hostname=temp_hostname,
+                        display_name=dictionary['client']['clientEntity'].get('displayName')
+                    )
 
-                return clients_dict
+                return clients_dict, clients_lookup
             else:
-                return {} # logged in user might not have privileges on any client
+                # logged in user might not have privileges on any client
+                return {}, clients_lookup
         else:
             raise SDKException('Response', '101', self._update_response_(response.text))
 
@@ -529,14 +617,20 @@ class Clients(object):
     @property
     def office_365_clients(self):
         """Returns the dict of all office 365 clients in the commcell"""
-        if self._office_365_clients is None:
-            self._office_365_clients = self._get_office_365_clients()
-        return self._office_365_clients
+        return self._lazy_init('_office_365_clients', self._get_office_365_clients)
+
+    def _get_hidden_clients(self, clients=None):
+        """Gets all the clients associated with the commcell, including all VM's and hidden clients,
+            and builds the lookup table of the hidden clients by their id and hostname
 
-    def _get_hidden_clients(self):
-        """Gets all the clients associated with the commcell, including all VM's and hidden clients
+            Args:
+                clients     (dict)  --  clients of the commcell, to exclude from the hidden clients
+
+                    default: None, the clients already loaded
 
             Returns:
+                tuple   -   (dict of the hidden clients, LookupTable of the hidden clients)
+
                 dict    -   consists of all clients (including hidden clients) in the commcell
 
                     {
@@ -577,16 +671,23 @@ class Clients(object):
                         'hostname': temp_hostname
                     }
 
+                if clients is None:
+                    clients = self.all_clients
+
                 # hidden clients = all clients - true clients
                 hidden_clients_dict = {
                     client: all_clients_dict.get(
-                        client, client in all_clients_dict or self.all_clients[client]
+                        client, client in all_clients_dict or clients[client]
                     )
-                    for client in set(all_clients_dict) - set(self.all_clients)
+                    for client in set(all_clients_dict) - set(clients)
                 }
-                return hidden_clients_dict
+                hidden_clients_lookup = LookupTable.from_dict(
+                    hidden_clients_dict, 'id', 'hostname'
+                )
+                return hidden_clients_dict, hidden_clients_lookup
             else:
-                return {} # logged in user might not have privileges on any client
+                # logged in user might not have privileges on any client
+                return {}, LookupTable('id', 'hostname')
         else:
             raise SDKException('Response', '101', self._update_response_(response.text))
 
@@ -711,10 +812,9 @@ class Clients(object):
         """
         # verify there is no client in the Commcell with the same name as the given hostname
         # for multi-instance clients
-        if self.all_clients and hostname not in self.all_clients:
-            for client in self.all_clients:
-                if hostname.lower() == self.all_clients[client]['hostname']:
-                    return client
+        with self._lock:
+            if self.all_clients and hostname not in self.all_clients:
+                return self._clients_lookup.get('hostname', hostname)
 
     def _get_hidden_client_from_hostname(self, hostname):
         """Checks if hidden client associated given hostname exists and returns the hidden client
@@ -731,10 +831,23 @@ class Clients(object):
         """
         # verify there is no client in the Commcell with the same name as the given hostname
         # for multi-instance clients
-        if self.hidden_clients and hostname not in self.hidden_clients:
-            for hidden_client in self.hidden_clients:
-                if hostname.lower() == self.hidden_clients[hidden_client]['hostname']:
-                    return hidden_client
+        with self._lock:
+            if self.hidden_clients and hostname not in self.hidden_clients:
+                return self._hidden_clients_lookup.get('hostname', hostname)
+
+    def _get_client_from_display_name(self, display_name):
+        """Checks if a client is associated with the given display name.
+
+            Args:
+                display_name    (str)   --  display name of the client on this commcell
+
+            Returns:
+                str     -   name of the client associated with this display name
+
+                None    -   if no client has the same display name as the given input
+
+        """
+        return self._clients_lookup.get('display_name', display_name)
 
     @property
     def all_clients(self):
@@ -927,15 +1040,17 @@ class Clients(object):
         """
         if not isinstance(client_name, basestring):
             raise SDKException('Client', '101')
-        if self.all_clients and client_name.lower() in self.all_clients:
-            return True
-        elif self._get_client_from_hostname(client_name) is not None:
-            return True
-        elif self.hidden_clients and client_name.lower() in self.hidden_clients:
-            return True
-        elif self._get_hidden_client_from_hostname(client_name) is not None:
-            return True
-        return False
+
+        with self._lock:
+            if self.all_clients and client_name.lower() in self.all_clients:
+                return True
+            elif self._get_client_from_hostname(client_name) is not None:
+                return True
+            elif self.hidden_clients and client_name.lower() in self.hidden_clients:
+                return True
+            elif self._get_hidden_client_from_hostname(client_name) is not None:
+                return True
+            return False
 
     def has_hidden_client(self, client_name):
         """Checks if a client exists in the commcell with the input client name as a hidden client.
@@ -954,8 +1069,9 @@ class Clients(object):
         if not isinstance(client_name, basestring):
             raise SDKException('Client', '101')
 
-        return ((self.hidden_clients and client_name.lower() in self.hidden_clients) or
-                self._get_hidden_client_from_hostname(client_name) is not None)
+        with self._lock:
+            return ((self.hidden_clients and client_name.lower() in self.hidden_clients) or
+                    self._get_hidden_client_from_hostname(client_name) is not None)
 
     def _process_add_response(self, request_json):
         """Runs the Client Add API with the request JSON provided,
@@ -2662,16 +2778,15 @@ class Clients(object):
         else:
             raise SDKException('Response', '101', self._update_response_(response.text))
 
-    def get(self, name):
-        """Returns a client object if client name or host name or ID matches the client attribute
-            We check if specified name matches any of the existing client names else
-            compare specified name with host names of existing clients else if name matches with the ID
+    def _resolve_client(self, name):
+        """Returns the name and id of the client, if client name or host name or display name
+            or ID matches the client attribute.
 
             Args:
                 name (str/int)  --  name / hostname / ID of the client
 
             Returns:
-                object - instance of the Client class for the given client name
+                tuple   -   (client_name, client_id) of the matching client
 
             Raises:
                 SDKException:
@@ -2688,6 +2803,8 @@ class Clients(object):
                 client_from_hostname = self._get_client_from_hostname(name)
             elif self.has_hidden_client(name):
                 client_from_hostname = self._get_hidden_client_from_hostname(name)
+            elif self._get_client_from_display_name(name) is not None:
+                client_from_hostname = self._get_client_from_display_name(name)
             else:
                 raise SDKException(
                     'Client', '102', 'No client exists with given name/hostname: {0}'.format(name)
@@ -2700,19 +2817,161 @@ class Clients(object):
             except KeyError:
                 client_id = self.hidden_clients[client_name]['id']
 
-            return Client(self._commcell_object, client_name, client_id)
+            return client_name, client_id
 
         elif isinstance(name, int):
             name = str(name)
-            client_name = [client_name for client_name in self.all_clients
-                           if name in self.all_clients[client_name].values()]
+            client_name = self._clients_lookup.get('id', name)
 
-            if client_name:
-                return self.get(client_name[0])
+            if client_name is not None:
+                return self._resolve_client(client_name)
             raise SDKException('Client', '102', 'No client exists with the given ID: {0}'.format(name))
 
         raise SDKException('Client', '101')
 
+    def _get_client_properties_json(self, client_id):
+        """Gets the properties JSON of the client with the given id.
+
+            Args:
+                client_id   (str)   --  id of the client
+
+            Returns:
+                dict    -   dictionary consisting of the properties of the client
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        flag, response = self._cvpysdk_object.make_request(
+            'GET', self._services['CLIENT'] % client_id
+        )
+
+        if flag:
+            if response.json() and 'clientProperties' in response.json():
+                return response.json()['clientProperties'][0]
+
+            raise SDKException('Response', '102')
+
+        raise SDKException('Response', '101', self._update_response_(response.text))
+
+    def get(self, name):
+        """Returns a client object if client name or host name or ID matches the client attribute
+            We check if specified name matches any of the existing client names else
+            compare specified name with host names of existing clients else if name matches with the ID
+
+            Args:
+                name (str/int)  --  name / hostname / ID of the client
+
+            Returns:
+                object - instance of the Client class for the given client name
+
+            Raises:
+                SDKException:
+                    if type of the client name argument is not string or Int
+
+                    if no client exists with the given name
+        """
+        client_name, client_id = self._resolve_client(name)
+        return Client(self._commcell_object, client_name, client_id)
+
+    def iter_objects(self, names=None, workers=8):
+        """Yields the client objects for the given clients, as soon as their properties are
+            fetched.
+
+            The properties of the clients are fetched in parallel using a pool of worker
+            threads, and the Client objects are initialized from the fetched properties,
+            without requesting them again. Only as many requests as the workers are sent ahead
+            of the clients consumed, and the pending requests are cancelled, if the caller
+            stops early.
+
+            Args:
+                names   (list)  --  list of name / hostname / ID of the clients
+
+                    default: None, all the clients associated with the commcell
+
+                workers (int)   --  number of properties requests to run in parallel
+
+                    default: 8
+
+            Yields:
+                object  -   instance of the Client class, in the order the properties are received
+
+            Raises:
+                SDKException:
+                    if type of the workers argument is not a positive integer
+
+                    if no client exists with any of the given names
+
+                    if failed to get the properties of any of the clients
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise SDKException('Client', '101')
+
+        if names is None:
+            names = list(self.all_clients)
+
+        # resolve all names before firing any request, to fail fast on an invalid name
+        resolved_clients = [self._resolve_client(name) for name in names]
+
+        clients = iter(resolved_clients)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        pending = {}
+
+        try:
+            while True:
+                for client_name, client_id in islice(clients, workers - len(pending)):
+                    future = executor.submit(self._get_client_properties_json, client_id)
+                    pending[future] = (client_name, client_id)
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    client_name, client_id = pending.pop(future)
+                    yield Client(
+                        self._commcell_object, client_name, client_id, properties=future.result()
+                    )
+        finally:
+            for future in pending:
+                future.cancel()
+
+            executor.shutdown(wait=False)
+
+    def get_many(self, names, workers=8):
+        """Returns the client objects for the given clients, fetching their properties in
+            parallel.
+
+            Args:
+                names   (list)  --  list of name / hostname / ID of the clients
+
+                workers (int)   --  number of properties requests to run in parallel
+
+                    default: 8
+
+            Returns:
+                dict    -   dictionary with the name of the client as the key,
+                and the instance of the Client class as its value
+
+            Raises:
+                SDKException:
+                    if type of the names argument is not list
+
+                    if no client exists with any of the given names
+
+                    if failed to get the properties of any of the clients
+        """
+        if not isinstance(names, list):
+            raise SDKException('Client', '101')
+
+        return {
+            client_object.client_name: client_object
+            for client_object in self.iter_objects(names, workers)
+        }
+
     def delete(self, client_name):
         """Deletes the client from the commcell.
 
@@ -2785,17 +3044,28 @@ class Clients(object):
                 )
 
     def refresh(self):
-        """Refresh the clients associated with the Commcell."""
-        self._clients = self._get_clients()
-        self._hidden_clients = self._get_hidden_clients()
-        self._virtualization_clients = self._get_virtualization_clients()
-        self._office_365_clients = None
+        """Refresh the clients associated with the Commcell.
+
+            The clients, and their lookup tables are replaced together under the lock, only
+            after all of them are fetched, so that the lookups made meanwhile still get the
+            clients loaded earlier.
+        """
+        clients, clients_lookup = self._get_clients()
+        hidden_clients, hidden_clients_lookup = self._get_hidden_clients(clients)
+        virtualization_clients = self._get_virtualization_clients()
+
+        with self._lock:
+            self._clients, self._clients_lookup = clients, clients_lookup
+            self._hidden_clients = hidden_clients
+            self._hidden_clients_lookup = hidden_clients_lookup
+            self._virtualization_clients = virtualization_clients
+            self._office_365_clients = None
 
 
 class Client(object):
     """Class for performing client operations for a specific client."""
 
-    def __init__(self, commcell_object, client_name, client_id=None):
+    def __init__(self, commcell_object, client_name, client_id=None, properties=None):
         """Initialise the Client class instance.
 
             Args:
@@ -2806,6 +3076,11 @@ class Client(object):
                 client_id       (str)        --  id of the client
                     default: None
 
+                properties      (dict)       --  properties of the client, already fetched
+                via the **GET Client/{clientId}** API, to initialize the object with,
+                instead of requesting them again
+                    default: None
+
             Returns:
                 object - instance of the Client class
         """
@@ -2834,9 +3109,13 @@ class Client(object):
 
         self._CLIENT = self._services['CLIENT'] % (self.client_id)
 
+        # guards the lazy attributes, so that they are initialized only once
+        self._lock = threading.RLock()
+
         self._instance = None
 
         self._agents = None
+        self._subclient_index = None
         self._schedules = None
         self._users = None
         self._network = None
@@ -2867,7 +3146,10 @@ class Client(object):
 
         self._readiness = None
 
-        self.refresh()
+        if properties is None:
+            self.refresh()
+        else:
+            self._initialize_client_properties(properties)
 
     def __repr__(self):
         """String representation of the instance of this class."""
@@ -2882,6 +3164,35 @@ class Client(object):
         """
         return self._commcell_object.clients.get(self.client_name).client_id
 
+    def _lazy_init(self, attribute, factory, *args):
+        """Returns the value of the attribute, initializing it on the first access.
+
+            The attribute is initialized only once under the lock, even if it is accessed by
+            multiple threads at the same time.
+
+            Args:
+                attribute   (str)       --  name of the attribute of this instance
+
+                factory     (callable)  --  function / class to get the value of the attribute
+
+                *args                   --  arguments to call the factory with
+
+            Returns:
+                object  -   value of the attribute
+
+        """
+        value = getattr(self, attribute)
+
+        if value is None:
+            with self._lock:
+                value = getattr(self, attribute)
+
+                if value is None:
+                    value = factory(*args)
+                    setattr(self, attribute, value)
+
+        return value
+
     def _get_client_properties(self):
         """Gets the client properties of this client.
 
@@ -2898,75 +3209,84 @@ class Client(object):
 
         if flag:
             if response.json() and 'clientProperties' in response.json():
-                self._properties = response.json()['clientProperties'][0]
-
-                os_info = self._properties['client']['osInfo']
-                processor_type = os_info['OsDisplayInfo']['ProcessorType']
-                os_name = os_info['OsDisplayInfo']['OSName']
-                self._cvd_port = self._properties['client']['cvdPort']
-                self._os_info = '{0} {1} {2}  --  {3}'.format(
-                    processor_type,
-                    os_info['Type'],
-                    os_info['SubType'],
-                    os_name
-                )
+                self._initialize_client_properties(response.json()['clientProperties'][0])
+            else:
+                raise SDKException('Response', '102')
+        else:
+            raise SDKException('Response', '101', self._update_response_(response.text))
 
-                client_props = self._properties['clientProps']
+    def _initialize_client_properties(self, properties):
+        """Initializes the attributes of this client from its properties JSON.
 
-                self._is_data_recovery_enabled = client_props[
-                    'activityControl']['EnableDataRecovery']
+            Args:
+                properties  (dict)  --  properties of this client,
+                as received from the **GET Client/{clientId}** API
 
-                self._is_data_management_enabled = client_props[
-                    'activityControl']['EnableDataManagement']
+        """
+        self._properties = properties
+
+        os_info = self._properties['client']['osInfo']
+        processor_type = os_info['OsDisplayInfo']['ProcessorType']
+        os_name = os_info['OsDisplayInfo']['OSName']
+        self._cvd_port = self._properties['client']['cvdPort']
+        self._os_info = '{0} {1} {2}  --  {3}'.format(
+            processor_type,
+            os_info['Type'],
+            os_info['SubType'],
+            os_name
+        )
 
-                self._is_ci_enabled = client_props['activityControl']['EnableOnlineContentIndex']
+        client_props = self._properties['clientProps']
 
-                activities = client_props["clientActivityControl"]["activityControlOptions"]
+        self._is_data_recovery_enabled = client_props[
+            'activityControl']['EnableDataRecovery']
 
-                for activity in activities:
-                    if activity["activityType"] == 1:
-                        self._is_backup_enabled = activity["enableActivityType"]
-                    elif activity["activityType"] == 2:
-                        self._is_restore_enabled = activity["enableActivityType"]
-                    elif activity["activityType"] == 16:
-                        self._is_data_aging_enabled = activity["enableActivityType"]
+        self._is_data_management_enabled = client_props[
+            'activityControl']['EnableDataManagement']
 
-                self._client_hostname = self._properties['client']['clientEntity']['hostName']
+        self._is_ci_enabled = client_props['activityControl']['EnableOnlineContentIndex']
 
-                self._timezone = self._properties['client']['TimeZone']['TimeZoneName']
+        activities = client_props["clientActivityControl"]["activityControlOptions"]
 
-                self._is_intelli_snap_enabled = bool(client_props['EnableSnapBackups'])
+        for activity in activities:
+            if activity["activityType"] == 1:
+                self._is_backup_enabled = activity["enableActivityType"]
+            elif activity["activityType"] == 2:
+                self._is_restore_enabled = activity["enableActivityType"]
+            elif activity["activityType"] == 16:
+                self._is_data_aging_enabled = activity["enableActivityType"]
 
-                if 'installDirectory' in self._properties['client']:
-                    self._install_directory = self._properties['client']['installDirectory']
+        self._client_hostname = self._properties['client']['clientEntity']['hostName']
 
-                if 'jobResulsDir' in self._properties['client']:
-                    self._job_results_directory = self._properties['client'][
-                        'jobResulsDir']['path']
+        self._timezone = self._properties['client']['TimeZone']['TimeZoneName']
 
-                if 'GalaxyRelease' in self._properties['client']['versionInfo']:
-                    self._version = self._properties['client'][
-                        'versionInfo']['GalaxyRelease']['ReleaseString']
+        self._is_intelli_snap_enabled = bool(client_props['EnableSnapBackups'])
 
-                if 'version' in self._properties['client']['versionInfo']:
-                    service_pack = re.findall(
-                        r'[ServicePack|FeatureRelease]:([\d]*)',
-                        self._properties['client']['versionInfo']['version']
-                    )
+        if 'installDirectory' in self._properties['client']:
+            self._install_directory = self._properties['client']['installDirectory']
 
-                    if service_pack:
-                        self._service_pack = service_pack[0]
+        if 'jobResulsDir' in self._properties['client']:
+            self._job_results_directory = self._properties['client'][
+                'jobResulsDir']['path']
 
-                if 'clientSecurity' in client_props:
-                    self._client_owners = client_props['clientSecurity'].get('clientOwners')
+        if 'GalaxyRelease' in self._properties['client']['versionInfo']:
+            self._version = self._properties['client'][
+                'versionInfo']['GalaxyRelease']['ReleaseString']
 
-                if 'jobStartTime' in client_props:
-                    self._job_start_time = client_props['jobStartTime']
+        if 'version' in self._properties['client']['versionInfo']:
+            service_pack = re.findall(
+                r'[ServicePack|FeatureRelease]:([\d]*)',
+                self._properties['client']['versionInfo']['version']
+            )
 
-            else:
-                raise SDKException('Response', '102')
-        else:
-            raise SDKException('Response', '101', self._update_response_(response.text))
+            if service_pack:
+                self._service_pack = service_pack[0]
+
+        if 'clientSecurity' in client_props:
+            self._client_owners = client_props['clientSecurity'].get('clientOwners')
+
+        if 'jobStartTime' in client_props:
+            self._job_start_time = client_props['jobStartTime']
 
     def _request_json(self, option, enable=True, enable_time=None, job_start_time=None, **kwargs):
         """Returns the JSON request to pass to the API as per the options selected by the user.
@@ -3107,7 +3427,9 @@ class Client(object):
 
                     if response is empty
 
-                    if response is not success
+                    if response is not success, and the chunk was not written
+
+                    if response is not success, and the chunk may have been written
         """
         if request_id is not None:
             upload_url += '&requestId={0}'.format(request_id)
@@ -3140,7 +3462,12 @@ class Client(object):
             else:
                 raise SDKException('Response', '102')
         else:
-            raise SDKException('Response', '101', self._update_response_(response.text))
+            # the request is rejected before the chunk is written on a client error, or if the
+            # server is unavailable, while a proxy may fail with any other error after the write
+            if 400 <= response.status_code < 500 or response.status_code == 503:
+                raise SDKException('Response', '101', self._update_response_(response.text))
+
+            raise SDKException('Response', '103', self._update_response_(response.text))
 
     def _get_instance_of_client(self):
         """Gets the instance associated with this client.
@@ -3492,11 +3819,11 @@ class Client(object):
     @property
     def _security_association(self):
         """Returns the security association object"""
-        if self._association_object is None:
-            from .security.security_association import SecurityAssociation
-            self._association_object = SecurityAssociation(self._commcell_object, self)
+        from .security.security_association import SecurityAssociation
 
-        return self._association_object
+        return self._lazy_init(
+            '_association_object', SecurityAssociation, self._commcell_object, self
+        )
 
     @property
     def available_security_roles(self):
@@ -3612,46 +3939,38 @@ class Client(object):
         """Returns the instance of the Agents class representing the list of Agents
         installed / configured on the Client.
         """
-        if self._agents is None:
-            self._agents = Agents(self)
+        return self._lazy_init('_agents', Agents, self)
 
-        return self._agents
+    @property
+    def subclient_index(self):
+        """Returns the instance of the SubclientIndex class, for the subclients of all the
+            Agents configured on the Client, shared by all their Instances and Backupsets.
+        """
+        return self._lazy_init('_subclient_index', SubclientIndex, self)
 
     @property
     def schedules(self):
         """Returns the instance of the Schedules class representing the Schedules
         configured on the Client.
         """
-        if self._schedules is None:
-            self._schedules = Schedules(self)
-
-        return self._schedules
+        return self._lazy_init('_schedules', Schedules, self)
 
     @property
     def users(self):
         """Returns the instance of the Users class representing the list of Users
         with permissions set on the Client.
         """
-        if self._users is None:
-            self._users = Users(self._commcell_object)
-
-        return self._users
+        return self._lazy_init('_users', Users, self._commcell_object)
 
     @property
     def network(self):
         """Returns the object of Network class"""
-        if self._network is None:
-            self._network = Network(self)
-
-        return self._network
+        return self._lazy_init('_network', Network, self)
 
     @property
     def network_throttle(self):
         """Returns the object of NetworkThrottle class"""
-        if self._network_throttle is None:
-            self._network_throttle = NetworkThrottle(self)
-
-        return self._network_throttle
+        return self._lazy_init('_network_throttle', NetworkThrottle, self)
 
     @property
     def is_cluster(self):
@@ -4320,17 +4639,60 @@ class Client(object):
         """
         return self.readiness_details.is_ready()
 
-    def upload_file(self, source_file_path, destination_folder):
+    def upload_file(
+            self,
+            source_file_path,
+            destination_folder,
+            chunk_size=UPLOAD_CHUNK_SIZE,
+            max_retries=3,
+            progress_callback=None,
+            backoff=None):
         """Upload the specified source file to destination path on the client machine
 
+            The file is memory mapped, and each chunk is sent as a view of the mapped file,
+            without copying it in memory.
+
+            If the upload of a chunk is rejected by the server, i.e., with a 4xx or 503 response,
+            or the connection to the server could not be established, the chunk is sent again
+            with backoff, up to the given number of retries.
+
+            A chunk is never sent again after a failure which may have happened after the server
+            wrote it, e.g., a read timeout, or a 502 response from a proxy, as it would be appended
+            twice to the file. Such a failure is raised, unless it is the first chunk, for which a
+            new upload is started.
+
             Args:
-                source_file_path    (str)   --  path on the controller machine
+                source_file_path    (str)       --  path on the controller machine
 
-                destination_folder  (str)   --  path on the client machine where the files
+                destination_folder  (str)       --  path on the client machine where the files
                                                     are to be copied
 
+                chunk_size          (int)       --  size of each chunk to upload, in bytes,
+                the files not larger than the chunk size are uploaded in a single request
+
+                    default: 2 MB
+
+                max_retries         (int)       --  number of times to resume the upload of a
+                chunk, after it failed
+
+                    default: 3
+
+                progress_callback   (callable)  --  function to call after each chunk is uploaded,
+                with the arguments:
+
+                    (source file path, bytes uploaded, file size, throughput in bytes / second)
+
+                    default: None
+
+                backoff             (object)    --  instance of the Backoff class, to wait
+                between the retries of a chunk with
+
+                    default: None, exponential backoff of up to 30 seconds, for max retries
+
             Raises:
                 SDKException:
+                    if type of the chunk size or max retries is not valid
+
                     if failed to upload the file
 
                     if response is empty
@@ -4338,9 +4700,14 @@ class Client(object):
                     if response is not success
 
         """
-        chunk_size = 1024 ** 2 * 2
-        request_id = None
-        chunk_offset = None
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise SDKException('Client', '101')
+
+        if not isinstance(max_retries, int) or max_retries < 0:
+            raise SDKException('Client', '101')
+
+        if backoff is None:
+            backoff = Backoff(initial_delay=1, max_delay=30, max_attempts=max_retries)
 
         file_name = os.path.split(source_file_path)[-1]
 
@@ -4353,69 +4720,187 @@ class Client(object):
             'ParentFolderPath': b64encode(destination_folder.encode('utf-8'))
         }
 
-        file_stream = open(source_file_path, 'rb')
-
         if file_size <= chunk_size:
             upload_url = self._services['UPLOAD_FULL_FILE'] % (self.client_id)
-            self._make_request(upload_url, file_stream.read(), headers)
         else:
             upload_url = self._services['UPLOAD_CHUNKED_FILE'] % (self.client_id)
-            while file_size > chunk_size:
-                file_size = file_size - chunk_size
-                headers['FileEOF'] = str(0)
-                request_id, chunk_offset = self._make_request(
-                    upload_url, file_stream.read(chunk_size), headers, request_id, chunk_offset
-                )
 
-            headers['FileEOF'] = str(1)
-            self._make_request(
-                upload_url, file_stream.read(file_size), headers, request_id, chunk_offset
-            )
+        with open(source_file_path, 'rb') as file_stream:
+            # an empty file can not be memory mapped
+            if file_size:
+                file_map = mmap.mmap(file_stream.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                file_map = b''
+
+            try:
+                request_id = None
+                chunk_offset = 0
+                delays = backoff.delays()
+                start_time = time.time()
+
+                while True:
+                    chunk_end = min(chunk_offset + chunk_size, file_size)
+
+                    if file_size > chunk_size:
+                        headers['FileEOF'] = str(int(chunk_end == file_size))
+
+                    try:
+                        with memoryview(file_map)[chunk_offset:chunk_end] as chunk:
+                            request_id, acknowledged_offset = self._make_request(
+                                upload_url, chunk, headers, request_id, chunk_offset
+                            )
+                    except (SDKException, requests.exceptions.RequestException) as error:
+                        if isinstance(error, SDKException):
+                            # the server rejected the chunk, without writing it, refer
+                            # _make_request() for the responses it is rejected with
+                            rejected = error.exception_module == 'Response' and (
+                                error.exception_id == '101'
+                            )
+                            unknown = error.exception_module == 'Response' and not rejected
+                        else:
+                            rejected = isinstance(error, requests.exceptions.ConnectTimeout)
+                            unknown = not rejected
+
+                        # the chunk may have been written by the server, and sending it again to
+                        # the same upload request would append it twice
+                        if unknown and request_id is not None:
+                            raise SDKException(
+                                'Client',
+                                '102',
+                                'Upload of file {0} interrupted at offset {1}, the server may '
+                                'have written the chunk: {2}'.format(
+                                    source_file_path, chunk_offset, error
+                                )
+                            )
 
-    def upload_folder(self, source_dir, destination_dir):
+                        delay = next(delays, None) if rejected or unknown else None
+
+                        if delay is None or not backoff.sleep(*delay, reason=str(error)):
+                            raise
+
+                        continue
+
+                    delays = backoff.delays()
+
+                    # resume from the offset written by the server, if it wrote only a part
+                    if acknowledged_offset is not None and (
+                            chunk_offset < int(acknowledged_offset) < chunk_end):
+                        chunk_offset = int(acknowledged_offset)
+                    else:
+                        chunk_offset = chunk_end
+
+                    if progress_callback is not None:
+                        elapsed_time = time.time() - start_time
+                        progress_callback(
+                            source_file_path,
+                            chunk_offset,
+                            file_size,
+                            chunk_offset / elapsed_time if elapsed_time else 0.0
+                        )
+
+                    if chunk_offset >= file_size:
+                        break
+            finally:
+                if file_size:
+                    file_map.close()
+
+    def upload_folder(
+            self,
+            source_dir,
+            destination_dir,
+            workers=4,
+            chunk_size=UPLOAD_CHUNK_SIZE,
+            max_retries=3,
+            progress_callback=None,
+            backoff=None):
         """Uploads the specified source dir to destination path on the client machine
 
+            The files in the folder and all its sub-folders are uploaded concurrently,
+            over a pool of the given number of worker threads.
+
             Args:
-                source_dir          (str)   --  path on the controller machine
+                source_dir          (str)       --  path on the controller machine
 
-                destination_dir     (str)   --  path on the client machine where the files
+                destination_dir     (str)       --  path on the client machine where the files
                                                     are to be copied
 
+                workers             (int)       --  maximum number of files to upload concurrently
+
+                    default: 4
+
+                chunk_size          (int)       --  size of each chunk to upload, in bytes
+
+                    default: 2 MB
+
+                max_retries         (int)       --  number of times to resume the upload of a
+                chunk, after it failed
+
+                    default: 3
+
+                progress_callback   (callable)  --  function to call after each chunk of a file
+                is uploaded, refer **upload_file()** for its arguments
+
+                    default: None
+
+                backoff             (object)    --  instance of the Backoff class, to wait
+                between the retries of a chunk with
+
+                    default: None, exponential backoff of up to 30 seconds, for max retries
+
             Raises:
                 SDKException:
+                    if type of the workers is not valid
+
                     if failed to upload the file
 
                     if response is empty
 
                     if response is not success
         """
+        if not isinstance(workers, int) or workers < 1:
+            raise SDKException('Client', '101')
 
-        def _create_destination_path(base_path, *args):
-            """Returns the path obtained by joining the items in argument
-
-                The final path to be generated is done based on the operating system path
-            """
-            if 'windows' in self.os_info.lower():
-                delimiter = "\\"
-            else:
-                delimiter = "/"
+        # get the delimiter once, instead of evaluating the OS of the client for every path
+        delimiter = "\\" if 'windows' in self.os_info.lower() else "/"
 
-            if args:
-                for argv in args:
-                    base_path = "{0}{1}{2}".format(base_path, delimiter, argv)
+        source_dir = os.path.normpath(source_dir)
+        destination_dir = "{0}{1}{2}".format(
+            destination_dir, delimiter, os.path.split(source_dir)[-1]
+        )
 
-            return base_path
+        uploads = []
 
-        source_list = os.listdir(source_dir)
+        for dir_path, _, file_names in os.walk(source_dir):
+            relative_path = os.path.relpath(dir_path, source_dir)
+            destination_folder = destination_dir
 
-        destination_dir = _create_destination_path(destination_dir, os.path.split(source_dir)[-1])
+            if relative_path != os.curdir:
+                destination_folder = delimiter.join(
+                    [destination_dir] + relative_path.split(os.sep)
+                )
 
-        for item in source_list:
-            item = os.path.join(source_dir, item)
-            if os.path.isfile(item):
-                self.upload_file(item, destination_dir)
-            else:
-                self.upload_folder(item, destination_dir)
+            for file_name in sorted(file_names):
+                uploads.append((os.path.join(dir_path, file_name), destination_folder))
+
+        if not uploads:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(uploads))) as executor:
+            futures = [
+                executor.submit(
+                    self.upload_file,
+                    file_path,
+                    destination_folder,
+                    chunk_size,
+                    max_retries,
+                    progress_callback,
+                    backoff
+                ) for file_path, destination_folder in uploads
+            ]
+
+            # raise the first failure, after all the uploads are complete
+            for future in futures:
+                future.result()
 
     def start_service(self, service_name=None):
         """Executes the command on the client machine to start the Commvault service(s).
@@ -4779,13 +5264,12 @@ class Client(object):
         if "os_type" in kwargs:
             os_filter = kwargs['os_type']
 
-        # To get the complete properties in the response
-        self._commcell_object._headers["mode"] = "EdgeMode"
+        # To get the complete properties in the response, without changing the shared headers
+        headers = self._commcell_object._headers.copy()
+        headers["mode"] = "EdgeMode"
 
         flag, response = self._cvpysdk_object.make_request(
-            'GET', self._services['FILTER_CLIENTS'] % param_string)
-
-        self._commcell_object._headers.pop("mode")
+            'GET', self._services['FILTER_CLIENTS'] % param_string, headers=headers)
 
         if flag:
             if response.json() and 'clientProperties' in response.json():
@@ -4812,11 +5296,15 @@ class Client(object):
         """Refreshes the properties of the Client."""
         self._get_client_properties()
 
-        if self._client_type_id == 0:
-            self._agents = None
-            self._schedules = None
-            self._users = None
-            self._network = None
+        with self._lock:
+            if self._subclient_index is not None:
+                self._subclient_index.refresh()
+
+            if self._client_type_id == 0:
+                self._agents = None
+                self._schedules = None
+                self._users = None
+                self._network = None
 
     def set_encryption_property(self,
                                 enc_setting="USE_SPSETTINGS",
@@ -5473,9 +5961,7 @@ class Client(object):
     @property
     def readiness_details(self):
         """ returns instance of readiness"""
-        if self._readiness is None:
-            self._readiness = _Readiness(self._commcell_object, self.client_id)
-        return self._readiness
+        return self._lazy_init('_readiness', _Readiness, self._commcell_object, self.client_id)
 
     def get_environment_details(self):
         """
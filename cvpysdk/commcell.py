@@ -21,6 +21,17 @@ Commcell is the main class for the CVPySDK python package.
 
 Commcell:   Initializes a connection to the commcell and is a wrapper for the entire commcell ops.
 
+The modules of the entity collections (clients, plans, datacube, ...) are imported only when the
+corresponding property of the Commcell class is first accessed, to keep the import of this
+module cheap for scripts which need only a small part of the SDK. The classes of the
+collections can still be imported from this module, e.g., **from cvpysdk.commcell import Clients**,
+and their modules are imported on first access.
+
+A single logged in Commcell instance can be shared by multiple threads, e.g., the workers of a
+thread pool. The collections of the entities are initialized only once under a lock, every
+request is sent with a snapshot of the headers of the Commcell, and an expired Authtoken is
+renewed only once, by the first thread which gets the 401 response for it.
+
 Commcell:
     __init__()                  --  initialize instance of the Commcell class
 
@@ -34,9 +45,27 @@ Commcell:
     _update_response_()         --  returns only the relevant response for the response received
     from the server
 
+    _lazy_init()                --  returns the value of the attribute, initializing it once on
+    the first access
+
+    _load_commserv_details()    --  gets the details of the commserv, if not fetched yet
+
     _remove_attribs_()          --  removes all the attributs associated with the commcell
     object upon call to the logout method
 
+    _probe_web_services()       --  probes the web services concurrently, and returns the first
+    valid one
+
+    _read_sessions()            --  returns all the sessions saved in the session file
+
+    _write_sessions()           --  writes the sessions to the session file
+
+    _load_session()             --  returns the web service and Authtoken saved for the user
+
+    _save_session()             --  saves the web service and Authtoken of the current session
+
+    _remove_session()           --  removes the current session from the session file
+
     _get_commserv_details()     --  gets the details of the commserv, the Commcell class instance
     is initialized for
 
@@ -50,6 +79,13 @@ Commcell:
 
     logout()                    --  logs out the user associated with the current instance
 
+    add_request_hook()          --  registers the hook to be notified of all the REST API requests
+
+    remove_request_hook()       --  unregisters the hook registered earlier
+
+    collect_stats()             --  returns the collector of the REST API request metrics,
+    to be used as a context manager, to scope the metrics to a block of code
+
     request()                   --  runs an input HTTP request on the API specified,
     and returns its response
 
@@ -149,6 +185,8 @@ Commcell instance Attributes
 
     **device_id**               --  returns the id associated with the calling machine
 
+    **metadata_cache**          --  returns the `MetadataCache` the entity metadata is cached in
+
     *name_change*               --  returns the name change object of the commcell
 
     **clients**                 --  returns the instance of the `Clients` class,
@@ -284,11 +322,17 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import getpass
+import json
+import os
 import socket
+import threading
 
 from base64 import b64encode
+from importlib import import_module
 from past.builtins import basestring
 
+from concurrent.futures import ThreadPoolExecutor
+
 from requests.exceptions import SSLError
 from requests.exceptions import Timeout
 
@@ -297,53 +341,93 @@ from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from .services import get_services
 from .cvpysdk import CVPySDK
-from .client import Clients
-from .alert import Alerts
-from .storage import MediaAgents
-from .storage import DiskLibraries
-from .security.usergroup import UserGroups, UserGroup
-from .domains import Domains, Domain
-from .workflow import WorkFlows
+from .instrumentation import DEFAULT_BUCKETS
+from .instrumentation import StatsCollector
 from .exception import SDKException
-from .clientgroup import ClientGroups
-from .globalfilter import GlobalFilters
-from .datacube.datacube import Datacube
-from .content_analyzer import ContentAnalyzers
-from .activate_entity import ActivateEntities
-from .plan import Plans
-from .job import JobController
-from .security.user import Users, User
-from .security.role import Roles
-from .security.two_factor_authentication import TwoFactorAuthentication
-from .credential_manager import Credentials
-from .download_center import DownloadCenter
-from .organization import Organizations, Organization
-from .storage_pool import StoragePools
-from .monitoring import MonitoringPolicies
-from .policy import Policies
-from .schedules import SchedulePattern
-from .schedules import Schedules
-from .activitycontrol import ActivityControl
-from .eventviewer import Events
-from .array_management import ArrayManagement
-from .disasterrecovery import DisasterRecovery
-from .operation_window import OperationWindow
-from .identity_management import IdentityManagementApps
-from .system import System
-from .commcell_migration import CommCellMigration
-from .deployment.download import Download
-from .deployment.cache_config import CommServeCache
-from .deployment.cache_config import RemoteCache
-from .deployment.install import Install
-from .name_change import NameChange
-from .backup_network_pairs import BackupNetworkPairs
-from .reports import report
-from .recovery_targets import RecoveryTargets
-from .job import JobManagement
-from .index_server import IndexServers
-from .hac_clusters import HACClusters
-from .index_pools import IndexPools
-from .deduplication_engines import DeduplicationEngines
+
+_LAZY_IMPORTS = {
+    'Clients': ('.client', 'Clients'),
+    'Alerts': ('.alert', 'Alerts'),
+    'MediaAgents': ('.storage', 'MediaAgents'),
+    'DiskLibraries': ('.storage', 'DiskLibraries'),
+    'UserGroups': ('.security.usergroup', 'UserGroups'),
+    'UserGroup': ('.security.usergroup', 'UserGroup'),
+    'Domains': ('.domains', 'Domains'),
+    'Domain': ('.domains', 'Domain'),
+    'WorkFlows': ('.workflow', 'WorkFlows'),
+    'ClientGroups': ('.clientgroup', 'ClientGroups'),
+    'GlobalFilters': ('.globalfilter', 'GlobalFilters'),
+    'Datacube': ('.datacube.datacube', 'Datacube'),
+    'ContentAnalyzers': ('.content_analyzer', 'ContentAnalyzers'),
+    'ActivateEntities': ('.activate_entity', 'ActivateEntities'),
+    'Plans': ('.plan', 'Plans'),
+    'JobController': ('.job', 'JobController'),
+    'Users': ('.security.user', 'Users'),
+    'User': ('.security.user', 'User'),
+    'Roles': ('.security.role', 'Roles'),
+    'TwoFactorAuthentication': ('.security.two_factor_authentication', 'TwoFactorAuthentication'),
+    'Credentials': ('.credential_manager', 'Credentials'),
+    'DownloadCenter': ('.download_center', 'DownloadCenter'),
+    'Organizations': ('.organization', 'Organizations'),
+    'Organization': ('.organization', 'Organization'),
+    'StoragePools': ('.storage_pool', 'StoragePools'),
+    'MonitoringPolicies': ('.monitoring', 'MonitoringPolicies'),
+    'Policies': ('.policy', 'Policies'),
+    'SchedulePattern': ('.schedules', 'SchedulePattern'),
+    'Schedules': ('.schedules', 'Schedules'),
+    'ActivityControl': ('.activitycontrol', 'ActivityControl'),
+    'Events': ('.eventviewer', 'Events'),
+    'ArrayManagement': ('.array_management', 'ArrayManagement'),
+    'DisasterRecovery': ('.disasterrecovery', 'DisasterRecovery'),
+    'OperationWindow': ('.operation_window', 'OperationWindow'),
+    'IdentityManagementApps': ('.identity_management', 'IdentityManagementApps'),
+    'System': ('.system', 'System'),
+    'CommCellMigration': ('.commcell_migration', 'CommCellMigration'),
+    'Download': ('.deployment.download', 'Download'),
+    'CommServeCache': ('.deployment.cache_config', 'CommServeCache'),
+    'RemoteCache': ('.deployment.cache_config', 'RemoteCache'),
+    'Install': ('.deployment.install', 'Install'),
+    'NameChange': ('.name_change', 'NameChange'),
+    'BackupNetworkPairs': ('.backup_network_pairs', 'BackupNetworkPairs'),
+    'report': ('.reports.report', None),
+    'RecoveryTargets': ('.recovery_targets', 'RecoveryTargets'),
+    'JobManagement': ('.job', 'JobManagement'),
+    'IndexServers': ('.index_server', 'IndexServers'),
+    'HACClusters': ('.hac_clusters', 'HACClusters'),
+    'IndexPools': ('.index_pools', 'IndexPools'),
+    'DeduplicationEngines': ('.deduplication_engines', 'DeduplicationEngines'),
+}
+"""dict:    names of the classes imported by this module earlier, which are now imported lazily,
+with the module and the attribute to import for each, None to import the module itself"""
+
+
+def __getattr__(name):
+    """Imports the entity classes on first access, e.g., **from cvpysdk.commcell import Clients**,
+        without importing their modules along with this module.
+
+        Args:
+            name    (str)   --  name of the attribute of this module
+
+        Returns:
+            object  -   class / module imported for the name
+
+        Raises:
+            AttributeError:
+                if the module has no attribute with the given name
+
+    """
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+
+    module_name, attribute = _LAZY_IMPORTS[name]
+    value = import_module(module_name, __package__)
+
+    if attribute is not None:
+        value = getattr(value, attribute)
+
+    globals()[name] = value
+    return value
+
 
 USER_LOGGED_OUT_MESSAGE = 'User Logged Out. Please initialize the Commcell object again.'
 """str:     Message to be returned to the user, when trying the get the value of an attribute
@@ -363,7 +447,12 @@ class Commcell(object):
             authtoken=None,
             force_https=False,
             certificate_path=None,
-            is_service_commcell=None):
+            is_service_commcell=None,
+            pool_size=10,
+            metadata_cache=None,
+            fast_start=False,
+            session_file=None,
+            probe_timeout=5):
         """Initialize the Commcell object with the values required for doing the API operations.
 
             Commcell Username and Password can be None, if QSDK / SAML token is being given
@@ -426,6 +515,37 @@ class Commcell(object):
             **Note** In case of Multicommcell Login, if we wanted to login into child commcell (Service commcell)
                         set is_service_commcell to True
 
+                pool_size               (int)   --  maximum number of connections to the
+                webconsole to keep alive, and re-use across the requests made by this instance
+
+                    default: 10
+
+                metadata_cache          (object)    --  instance of the MetadataCache class, to
+                cache the client / agent / instance / backupset / subclient / alert metadata in
+
+                    default: None, metadata is fetched from the commcell every time
+
+                fast_start              (bool)  --  boolean flag to specify whether to probe the
+                HTTPS and HTTP services concurrently, with the probe timeout, and to defer getting
+                the details of the CommServ, till any of them is first read
+
+                    default: False
+
+                session_file            (str)   --  path of the file to save the web service and
+                the Authtoken of the session in, after log in, and to reuse them from, instead of
+                probing the services and logging in again
+
+                    default: None, the session is not saved
+
+            **Note** The Authtoken saved in the session file can be used to log in as the user,
+                        hence the file should be kept private. The session is removed from the
+                        file on logout
+
+                probe_timeout           (float) --  seconds to wait for the response, while
+                probing the services in the fast start mode
+
+                    default: 5
+
             Returns:
                 object  -   instance of this class
 
@@ -447,6 +567,7 @@ class Commcell(object):
             web_service.append(r'http://{0}/webconsole/api/'.format(webconsole_hostname))
 
         self._user = commcell_username
+        self._init_lock = threading.RLock()
 
         self._password = None
 
@@ -460,19 +581,32 @@ class Commcell(object):
         self._device_id = socket.getfqdn()
         self._is_service_commcell = is_service_commcell
 
-        self._cvpysdk_object = CVPySDK(self, certificate_path)
+        self._cvpysdk_object = CVPySDK(self, certificate_path, pool_maxsize=pool_size)
+        self._cvpysdk_object.metadata_cache = metadata_cache
 
-        # Checks if the service is running or not
-        for service in web_service:
-            self._web_service = service
-            try:
-                if self._cvpysdk_object._is_valid_service():
-                    break
-            except (RequestsConnectionError, SSLError, Timeout):
-                if force_https:
-                    raise
+        self._fast_start = fast_start
+        self._session_file = session_file
+        self._session_key = '{0}@{1}'.format(commcell_username, webconsole_hostname)
+
+        session = self._load_session() if session_file else {}
+
+        if session.get('web_service') in web_service:
+            # reuse the service resolved by an earlier session
+            self._web_service = session['web_service']
+        elif fast_start:
+            self._web_service = self._probe_web_services(web_service, probe_timeout, force_https)
         else:
-            raise SDKException('Commcell', '101')
+            # Checks if the service is running or not
+            for service in web_service:
+                self._web_service = service
+                try:
+                    if self._cvpysdk_object._is_valid_service():
+                        break
+                except (RequestsConnectionError, SSLError, Timeout):
+                    if force_https:
+                        raise
+            else:
+                raise SDKException('Commcell', '101')
 
         # Initialize all the services with this commcell service
         self._services = get_services(self._web_service)
@@ -483,6 +617,9 @@ class Commcell(object):
         if isinstance(commcell_password, dict):
             authtoken = commcell_password['Authtoken']
 
+        if not authtoken and session.get('authtoken'):
+            authtoken = session['authtoken']
+
         if authtoken and not is_service_commcell:
             if authtoken.startswith('QSDK ') or authtoken.startswith('SAML '):
                 self._headers['Authtoken'] = authtoken
@@ -515,6 +652,9 @@ class Commcell(object):
 
             raise SDKException('Commcell', '102')
 
+        if session_file:
+            self._save_session()
+
         self._master_saml_token = None
         self._commserv_name = None
         self._commserv_hostname = None
@@ -599,6 +739,9 @@ class Commcell(object):
 
     def __exit__(self, exception_type, exception_value, traceback):
         """Logs out the user associated with the current instance."""
+        if self._session_file:
+            self._remove_session()
+
         output = self._cvpysdk_object._logout()
         self._remove_attribs_()
         return output
@@ -620,6 +763,41 @@ class Commcell(object):
 
         return input_string
 
+    def _lazy_init(self, attribute, factory, *args):
+        """Returns the value of the attribute, initializing it on the first access.
+
+            The attribute is initialized only once under the lock, even if it is accessed by
+            multiple threads at the same time.
+
+            Args:
+                attribute   (str)       --  name of the attribute of this instance
+
+                factory     (callable)  --  function / class to get the value of the attribute
+
+                *args                   --  arguments to call the factory with
+
+            Returns:
+                object  -   value of the attribute
+
+        """
+        value = getattr(self, attribute)
+
+        if value is None:
+            with self._init_lock:
+                value = getattr(self, attribute)
+
+                if value is None:
+                    value = factory(*args)
+                    setattr(self, attribute, value)
+
+        return value
+
+    def _load_commserv_details(self):
+        """Gets the CommServ details, if they were not fetched yet by any thread."""
+        with self._init_lock:
+            if self._commserv_name is None:
+                self._get_commserv_details()
+
     def _remove_attribs_(self):
         """Removes all the attributes associated with the instance of this class."""
         del self._clients
@@ -673,6 +851,110 @@ class Commcell(object):
         del self._tfa
         del self
 
+    def _probe_web_services(self, web_services, timeout, force_https=False):
+        """Probes all the web services concurrently, and returns the first valid one, in the
+            order of preference of the services.
+
+            Args:
+                web_services    (list)  --  list of the web service urls, in the order of
+                preference
+
+                timeout         (float) --  seconds to wait for the response of each service
+
+                force_https     (bool)  --  boolean specifying whether to raise the connection
+                error of the HTTPS service
+
+                    default: False
+
+            Returns:
+                str     -   url of the first valid web service
+
+            Raises:
+                SDKException:
+                    if none of the services is valid
+
+        """
+        self._web_service = web_services[0]
+
+        with ThreadPoolExecutor(max_workers=len(web_services)) as executor:
+            futures = [
+                executor.submit(self._cvpysdk_object._is_valid_service, service, timeout)
+                for service in web_services
+            ]
+
+            for service, future in zip(web_services, futures):
+                try:
+                    if future.result():
+                        return service
+                except (RequestsConnectionError, SSLError, Timeout):
+                    if force_https:
+                        raise
+
+        raise SDKException('Commcell', '101')
+
+    def _read_sessions(self):
+        """Returns all the sessions saved in the session file.
+
+            Returns:
+                dict    -   sessions saved in the file, with the user and the webconsole
+                hostname as the key
+
+        """
+        try:
+            with open(self._session_file, 'r') as session_file:
+                return json.load(session_file)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _write_sessions(self, sessions):
+        """Writes the sessions to the session file, readable only by the current user.
+
+            Args:
+                sessions    (dict)  --  sessions to save in the file
+
+        """
+        temp_file = '{0}.{1}.tmp'.format(self._session_file, os.getpid())
+        file_descriptor = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+
+        with os.fdopen(file_descriptor, 'w') as session_file:
+            json.dump(sessions, session_file)
+
+        os.replace(temp_file, self._session_file)
+
+    def _load_session(self):
+        """Returns the web service and the Authtoken saved for the user and webconsole.
+
+            Returns:
+                dict    -   session saved for the user and webconsole
+
+                    {
+                        "web_service": web_service,
+
+                        "authtoken": authtoken
+                    }
+
+        """
+        return self._read_sessions().get(self._session_key, {})
+
+    def _save_session(self):
+        """Saves the web service and the Authtoken of the current session to the session file."""
+        sessions = self._read_sessions()
+        sessions[self._session_key] = {
+            'web_service': self._web_service,
+            'authtoken': self._headers['Authtoken']
+        }
+
+        self._write_sessions(sessions)
+
+    def _remove_session(self):
+        """Removes the current session from the session file, as its Authtoken is no longer
+            valid after logout.
+        """
+        sessions = self._read_sessions()
+
+        if sessions.pop(self._session_key, None) is not None:
+            self._write_sessions(sessions)
+
     def _get_commserv_details(self):
         """Gets the details of the CommServ, the Commcell class instance is initialized for,
             and updates the class instance attributes.
@@ -698,7 +980,6 @@ class Commcell(object):
                 try:
                     self._commserv_guid = response.json()['commcell']['csGUID']
                     self._commserv_hostname = response.json()['hostName']
-                    self._commserv_name = response.json()['commcell']['commCellName']
                     self._commserv_timezone_name = response.json()['csTimeZone']['TimeZoneName']
                     self._commserv_version = response.json()['currentSPVersion']
                     version_info = response.json().get('csVersionInfo')
@@ -731,6 +1012,9 @@ class Commcell(object):
 
                     self._version_info = version_info + '.0' * (3 - len(version_info.split('.')))
 
+                    # set the name last, as it marks the details as loaded to the other threads
+                    self._commserv_name = response.json()['commcell']['commCellName']
+
                 except KeyError as error:
                     raise SDKException('Commcell', '103', 'Key does not exist: {0}'.format(error))
             else:
@@ -755,7 +1039,10 @@ class Commcell(object):
 
         """
         flag, response = self._cvpysdk_object.make_request(
-            'POST', self._services['EXECUTE_QCOMMAND'], request_xml
+            'POST',
+            self._services['EXECUTE_QCOMMAND'],
+            request_xml,
+            content_type='application/xml'
         )
 
         if flag:
@@ -809,6 +1096,9 @@ class Commcell(object):
     @property
     def commcell_id(self):
         """Returns the ID of the CommCell."""
+        if self._commserv_name is None:
+            self._load_commserv_details()
+
         return self._id
 
     def _qoperation_execscript(self, arguments):
@@ -906,26 +1196,41 @@ class Commcell(object):
     @property
     def commserv_guid(self):
         """Returns the GUID of the CommServ."""
+        if self._commserv_name is None:
+            self._load_commserv_details()
+
         return self._commserv_guid
 
     @property
     def commserv_hostname(self):
         """Returns the hostname of the CommServ."""
+        if self._commserv_name is None:
+            self._load_commserv_details()
+
         return self._commserv_hostname
 
     @property
     def commserv_name(self):
         """Returns the name of the CommServ."""
+        if self._commserv_name is None:
+            self._load_commserv_details()
+
         return self._commserv_name
 
     @property
     def commserv_timezone(self):
         """Returns the time zone of the CommServ."""
+        if self._commserv_name is None:
+            self._load_commserv_details()
+
         return self._commserv_timezone
 
     @property
     def commserv_timezone_name(self):
         """Returns the name of the time zone of the CommServ."""
+        if self._commserv_name is None:
+            self._load_commserv_details()
+
         return self._commserv_timezone_name
 
     @property
@@ -935,6 +1240,9 @@ class Commcell(object):
             Example: 19
 
         """
+        if self._commserv_name is None:
+            self._load_commserv_details()
+
         return self._commserv_version
 
     @property
@@ -944,6 +1252,9 @@ class Commcell(object):
             Example: 11.19.1
 
         """
+        if self._commserv_name is None:
+            self._load_commserv_details()
+
         return self._version_info
 
     @property
@@ -961,6 +1272,11 @@ class Commcell(object):
         """Returns the logged in user name"""
         return self._user
 
+    @property
+    def metadata_cache(self):
+        """Returns the instance of the MetadataCache class, the entity metadata is cached in."""
+        return self._cvpysdk_object.metadata_cache
+
     @property
     def device_id(self):
         """Returns the value of the Device ID attribute."""
@@ -972,104 +1288,97 @@ class Commcell(object):
     @property
     def name_change(self):
         """Returns an instance of Namechange class"""
+        from .name_change import NameChange
+
         return NameChange(self)
 
     @property
     def clients(self):
         """Returns the instance of the Clients class."""
-        try:
-            if self._clients is None:
-                self._clients = Clients(self)
+        from .client import Clients
 
-            return self._clients
+        try:
+            return self._lazy_init('_clients', Clients, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def commserv_cache(self):
         """Returns the instance of the CommServeCache  class."""
-        try:
-            if self._commserv_cache is None:
-                self._commserv_cache = CommServeCache(self)
+        from .deployment.cache_config import CommServeCache
 
-            return self._commserv_cache
+        try:
+            return self._lazy_init('_commserv_cache', CommServeCache, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def index_servers(self):
         """Returns the instance of the Index Servers class."""
-        try:
-            if self._index_servers is None:
-                self._index_servers = IndexServers(self)
+        from .index_server import IndexServers
 
-            return self._index_servers
+        try:
+            return self._lazy_init('_index_servers', IndexServers, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def hac_clusters(self):
         """Returns the instance of the HAC Clusters class."""
-        try:
-            if self._hac_clusters is None:
-                self._hac_clusters = HACClusters(self)
+        from .hac_clusters import HACClusters
 
-            return self._hac_clusters
+        try:
+            return self._lazy_init('_hac_clusters', HACClusters, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def index_pools(self):
         """Returns the instance of the HAC Clusters class."""
-        try:
-            if self._index_pools is None:
-                self._index_pools = IndexPools(self)
+        from .index_pools import IndexPools
 
-            return self._index_pools
+        try:
+            return self._lazy_init('_index_pools', IndexPools, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def media_agents(self):
         """Returns the instance of the MediaAgents class."""
-        try:
-            if self._media_agents is None:
-                self._media_agents = MediaAgents(self)
+        from .storage import MediaAgents
 
-            return self._media_agents
+        try:
+            return self._lazy_init('_media_agents', MediaAgents, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def workflows(self):
         """Returns the instance of the Workflows class."""
-        try:
-            if self._workflows is None:
-                self._workflows = WorkFlows(self)
+        from .workflow import WorkFlows
 
-            return self._workflows
+        try:
+            return self._lazy_init('_workflows', WorkFlows, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def alerts(self):
         """Returns the instance of the Alerts class."""
-        try:
-            if self._alerts is None:
-                self._alerts = Alerts(self)
+        from .alert import Alerts
 
-            return self._alerts
+        try:
+            return self._lazy_init('_alerts', Alerts, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def disk_libraries(self):
         """Returns the instance of the DiskLibraries class."""
-        try:
-            if self._disk_libraries is None:
-                self._disk_libraries = DiskLibraries(self)
+        from .storage import DiskLibraries
 
-            return self._disk_libraries
+        try:
+            return self._lazy_init('_disk_libraries', DiskLibraries, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
@@ -1086,303 +1395,275 @@ class Commcell(object):
     @property
     def schedules(self):
         """Returns the instance of the Schedules class."""
-        try:
-            if self._schedules is None:
-                self._schedules = Schedules(self)
+        from .schedules import Schedules
 
-            return self._schedules
+        try:
+            return self._lazy_init('_schedules', Schedules, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def policies(self):
         """Returns the instance of the Policies class."""
-        try:
-            if self._policies is None:
-                self._policies = Policies(self)
+        from .policy import Policies
 
-            return self._policies
+        try:
+            return self._lazy_init('_policies', Policies, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def deduplication_engines(self):
         """Returns the instance of the Deduplicationengines class."""
+        from .deduplication_engines import DeduplicationEngines
+
         try:
-            if self._deduplication_engines is None:
-                self._deduplication_engines = DeduplicationEngines(self)
-            return self._deduplication_engines
+            return self._lazy_init('_deduplication_engines', DeduplicationEngines, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def user_groups(self):
         """Returns the instance of the UserGroups class."""
-        try:
-            if self._user_groups is None:
-                self._user_groups = UserGroups(self)
+        from .security.usergroup import UserGroups
 
-            return self._user_groups
+        try:
+            return self._lazy_init('_user_groups', UserGroups, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def domains(self):
         """Returns the instance of the UserGroups class."""
-        try:
-            if self._domains is None:
-                self._domains = Domains(self)
+        from .domains import Domains
 
-            return self._domains
+        try:
+            return self._lazy_init('_domains', Domains, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def client_groups(self):
         """Returns the instance of the ClientGroups class."""
-        try:
-            if self._client_groups is None:
-                self._client_groups = ClientGroups(self)
+        from .clientgroup import ClientGroups
 
-            return self._client_groups
+        try:
+            return self._lazy_init('_client_groups', ClientGroups, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def global_filters(self):
         """Returns the instance of the GlobalFilters class."""
-        try:
-            if self._global_filters is None:
-                self._global_filters = GlobalFilters(self)
+        from .globalfilter import GlobalFilters
 
-            return self._global_filters
+        try:
+            return self._lazy_init('_global_filters', GlobalFilters, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def datacube(self):
         """Returns the instance of the Datacube class."""
-        try:
-            if self._datacube is None:
-                self._datacube = Datacube(self)
+        from .datacube.datacube import Datacube
 
-            return self._datacube
+        try:
+            return self._lazy_init('_datacube', Datacube, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def content_analyzers(self):
         """Returns the instance of the ContentAnalyzers class."""
-        try:
-            if self._content_analyzers is None:
-                self._content_analyzers = ContentAnalyzers(self)
+        from .content_analyzer import ContentAnalyzers
 
-            return self._content_analyzers
+        try:
+            return self._lazy_init('_content_analyzers', ContentAnalyzers, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def activate_entity(self):
         """Returns the instance of the ContentAnalyzers class."""
-        try:
-            if self._activate_entity is None:
-                self._activate_entity = ActivateEntities(self)
+        from .activate_entity import ActivateEntities
 
-            return self._activate_entity
+        try:
+            return self._lazy_init('_activate_entity', ActivateEntities, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def plans(self):
         """Returns the instance of the Plans class."""
-        try:
-            if self._plans is None:
-                self._plans = Plans(self)
+        from .plan import Plans
 
-            return self._plans
+        try:
+            return self._lazy_init('_plans', Plans, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def job_controller(self):
         """Returns the instance of the Jobs class."""
-        try:
-            if self._job_controller is None:
-                self._job_controller = JobController(self)
+        from .job import JobController
 
-            return self._job_controller
+        try:
+            return self._lazy_init('_job_controller', JobController, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def users(self):
         """Returns the instance of the Users class."""
-        try:
-            if self._users is None:
-                self._users = Users(self)
+        from .security.user import Users
 
-            return self._users
+        try:
+            return self._lazy_init('_users', Users, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def roles(self):
         """Returns the instance of the Roles class."""
-        try:
-            if self._roles is None:
-                self._roles = Roles(self)
+        from .security.role import Roles
 
-            return self._roles
+        try:
+            return self._lazy_init('_roles', Roles, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def credentials(self):
         """Returns the instance of the Credentials class."""
-        try:
-            if self._credentials is None:
-                self._credentials = Credentials(self)
+        from .credential_manager import Credentials
 
-            return self._credentials
+        try:
+            return self._lazy_init('_credentials', Credentials, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def download_center(self):
         """Returns the instance of the DownloadCenter class."""
-        try:
-            if self._download_center is None:
-                self._download_center = DownloadCenter(self)
+        from .download_center import DownloadCenter
 
-            return self._download_center
+        try:
+            return self._lazy_init('_download_center', DownloadCenter, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def organizations(self):
         """Returns the instance of the Organizations class."""
-        try:
-            if self._organizations is None:
-                self._organizations = Organizations(self)
+        from .organization import Organizations
 
-            return self._organizations
+        try:
+            return self._lazy_init('_organizations', Organizations, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def storage_pools(self):
         """Returns the instance of the StoragePools class."""
-        try:
-            if self._storage_pools is None:
-                self._storage_pools = StoragePools(self)
+        from .storage_pool import StoragePools
 
-            return self._storage_pools
+        try:
+            return self._lazy_init('_storage_pools', StoragePools, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def monitoring_policies(self):
         """Returns the instance of the MonitoringPolicies class."""
-        try:
-            if self._monitoring_policies is None:
-                self._monitoring_policies = MonitoringPolicies(self)
+        from .monitoring import MonitoringPolicies
 
-            return self._monitoring_policies
+        try:
+            return self._lazy_init('_monitoring_policies', MonitoringPolicies, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def operation_window(self):
         """Returns the instance of the OperationWindow class."""
+        from .operation_window import OperationWindow
+
         try:
-            if self._operation_window is None:
-                self._operation_window = OperationWindow(self)
-            return self._operation_window
+            return self._lazy_init('_operation_window', OperationWindow, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def activity_control(self):
         """Returns the instance of the ActivityControl class."""
-        try:
-            if self._activity_control is None:
-                self._activity_control = ActivityControl(self)
+        from .activitycontrol import ActivityControl
 
-            return self._activity_control
+        try:
+            return self._lazy_init('_activity_control', ActivityControl, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def event_viewer(self):
         """Returns the instance of the Event Viewer class."""
-        try:
-            if self._events is None:
-                self._events = Events(self)
+        from .eventviewer import Events
 
-            return self._events
+        try:
+            return self._lazy_init('_events', Events, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def array_management(self):
         """Returns the instance of the ArrayManagement class."""
-        try:
-            if self._array_management is None:
-                self._array_management = ArrayManagement(self)
+        from .array_management import ArrayManagement
 
-            return self._array_management
+        try:
+            return self._lazy_init('_array_management', ArrayManagement, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def disasterrecovery(self):
         """Returns the instance of the DisasterRecovery class."""
-        try:
-            if self._disaster_recovery is None:
-                self._disaster_recovery = DisasterRecovery(self)
+        from .disasterrecovery import DisasterRecovery
 
-            return self._disaster_recovery
+        try:
+            return self._lazy_init('_disaster_recovery', DisasterRecovery, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def identity_management(self):
         """Returns the instance of the IdentityManagementApps class."""
-        try:
-            if self._identity_management is None:
-                self._identity_management = IdentityManagementApps(self)
+        from .identity_management import IdentityManagementApps
 
-            return self._identity_management
+        try:
+            return self._lazy_init('_identity_management', IdentityManagementApps, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def system(self):
         """Returns the instance of the System class."""
-        try:
-            if self._system is None:
-                self._system = System(self)
+        from .system import System
 
-            return self._system
+        try:
+            return self._lazy_init('_system', System, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def commserv_client(self):
         """Returns the instance of the Client class for the CommServ client."""
-        if self._commserv_client is None:
-            self._commserv_client = self.clients.get(self._commserv_name)
-
-        return self._commserv_client
+        return self._lazy_init('_commserv_client', self.clients.get, self.commserv_name)
 
     @property
     def commcell_migration(self):
         """Returns the instance of the CommcellMigration class"""
-        try:
-            if self._commcell_migration is None:
-                self._commcell_migration = CommCellMigration(self)
+        from .commcell_migration import CommCellMigration
 
-            return self._commcell_migration
+        try:
+            return self._lazy_init('_commcell_migration', CommCellMigration, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
@@ -1401,9 +1682,7 @@ class Commcell(object):
                 }
             }
         """
-        if self._registered_commcells is None:
-            self._registered_commcells = self._get_registered_service_commcells()
-        return self._registered_commcells
+        return self._lazy_init('_registered_commcells', self._get_registered_service_commcells)
 
     @property
     def redirect_rules_of_service(self):
@@ -1412,18 +1691,15 @@ class Commcell(object):
         list - consists of redirect rules of service commcell
             ['abc.com','commvault-nj']
         """
-        if self._redirect_rules_service is None:
-            self._redirect_rules_service = self._get_redirect_rules_service_commcell()
-        return self._redirect_rules_service
+        return self._lazy_init('_redirect_rules_service', self._get_redirect_rules_service_commcell)
 
     @property
     def recovery_targets(self):
         """Returns the instance of RecoverTargets class"""
-        try:
-            if self._recovery_targets is None:
-                self._recovery_targets = RecoveryTargets(self)
+        from .recovery_targets import RecoveryTargets
 
-            return self._recovery_targets
+        try:
+            return self._lazy_init('_recovery_targets', RecoveryTargets, self)
 
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
@@ -1431,11 +1707,10 @@ class Commcell(object):
     @property
     def backup_network_pairs(self):
         """Returns the instance of BackupNetworkPairs class"""
-        try:
-            if self._backup_network_pairs is None:
-                self._backup_network_pairs = BackupNetworkPairs(self)
+        from .backup_network_pairs import BackupNetworkPairs
 
-            return self._backup_network_pairs
+        try:
+            return self._lazy_init('_backup_network_pairs', BackupNetworkPairs, self)
 
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
@@ -1443,20 +1718,20 @@ class Commcell(object):
     @property
     def reports(self):
         """Returns the instance of the Report class"""
+        from .reports import report
+
         try:
-            if self._reports is None:
-                self._reports = report.Report(self)
-            return self._reports
+            return self._lazy_init('_reports', report.Report, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
     @property
     def job_management(self):
         """Returns the instance of the JobManagement class."""
+        from .job import JobManagement
+
         try:
-            if not self._job_management:
-                self._job_management = JobManagement(self)
-            return self._job_management
+            return self._lazy_init('_job_management', JobManagement, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
@@ -1467,19 +1742,65 @@ class Commcell(object):
         list - contains the list of accessible commcells
             ['cc1','cc2']
         """
-        if self._redirect_cc_idp is None:
-            self._redirect_cc_idp = self._commcells_for_user()
-        return self._redirect_cc_idp
+        return self._lazy_init('_redirect_cc_idp', self._commcells_for_user)
 
     def logout(self):
         """Logs out the user associated with the current instance."""
         if self._headers['Authtoken'] is None:
             return 'User already logged out.'
 
+        if self._session_file:
+            self._remove_session()
+
         output = self._cvpysdk_object._logout()
         self._remove_attribs_()
         return output
 
+    def add_request_hook(self, hook):
+        """Registers the hook to be notified of all the REST API requests made for this
+            Commcell.
+
+            Args:
+                hook    (object)    --  instance of the **RequestHook** class
+
+        """
+        self._cvpysdk_object.add_hook(hook)
+
+    def remove_request_hook(self, hook):
+        """Unregisters the hook, so that it is not notified of the requests anymore.
+
+            Args:
+                hook    (object)    --  instance of the **RequestHook** class
+
+        """
+        self._cvpysdk_object.remove_hook(hook)
+
+    def collect_stats(self, buckets=DEFAULT_BUCKETS):
+        """Returns the collector of the count, bytes, and latency histogram of the REST API
+            requests for each service, which is registered for the block of code it is used
+            for, as a context manager.
+
+            Usage:
+
+                >>> with commcell.collect_stats() as stats:
+                ...     subclient.backup()
+
+                >>> stats.stats
+
+                >>> stats.to_prometheus()
+
+            Args:
+                buckets     (tuple)     --  upper bounds of the latency histogram buckets,
+                in seconds
+
+                    default: DEFAULT_BUCKETS
+
+            Returns:
+                object  -   instance of the StatsCollector class
+
+        """
+        return StatsCollector(buckets, commcell_object=self)
+
     def request(self, request_type, request_url, request_body=None):
         """Runs the request of the type specified on the request URL, with the body passed
             in the arguments.
@@ -1622,7 +1943,13 @@ class Commcell(object):
         self._commserv_client = None
         self._identity_management = None
         self._commcell_migration = None
-        self._get_commserv_details()
+
+        if self._fast_start:
+            # the details are fetched again, when any of them is read next
+            self._commserv_name = None
+        else:
+            self._get_commserv_details()
+
         self._registered_commcells = None
         self._redirect_rules_service = None
         self._index_servers = None
@@ -1633,6 +1960,8 @@ class Commcell(object):
 
     def get_remote_cache(self, client_name):
         """Returns the instance of the RemoteCache  class."""
+        from .deployment.cache_config import RemoteCache
+
         try:
             self._remote_cache = RemoteCache(self, client_name)
             return self._remote_cache
@@ -1655,6 +1984,8 @@ class Commcell(object):
 
 
         """
+        from .schedules import SchedulePattern, Schedules
+
         if storage_policy_name is None:
             copy_name = ""
             storage_policy_name = ""
@@ -1879,6 +2210,8 @@ class Commcell(object):
                     if another sync job is running with the given client
 
         """
+        from .deployment.download import Download
+
         download = Download(self)
         return download.sync_remote_cache(
             client_list=client_list)
@@ -1956,6 +2289,8 @@ class Commcell(object):
                     **NOTE:** service_pack parameter must be specified for third option
 
         """
+        from .deployment.download import Download
+
         download = Download(self)
         return download.download_software(
             options=options,
@@ -2020,6 +2355,8 @@ class Commcell(object):
         **NOTE:** push_serivcepack_and_hotfixes cannot be used for revision upgrades
 
         """
+        from .deployment.install import Install
+
         install = Install(self)
         return install.push_servicepack_and_hotfix(
             client_computers=client_computers,
@@ -2129,6 +2466,8 @@ class Commcell(object):
                     not both
 
         """
+        from .deployment.install import Install
+
         install = Install(self)
         return install.install_software(
             client_computers=client_computers,
@@ -2912,6 +3251,10 @@ class Commcell(object):
 
                 if response is not success
         """
+        from .domains import Domain
+        from .organization import Organization
+        from .security.user import User
+        from .security.usergroup import UserGroup
 
         if not isinstance(service_commcell, basestring):
             raise SDKException('User', '101')
@@ -3000,10 +3343,10 @@ class Commcell(object):
     @property
     def two_factor_authentication(self):
         """Returns the instance of the TwoFactorAuthentication class"""
+        from .security.two_factor_authentication import TwoFactorAuthentication
+
         try:
-            if self._tfa is None:
-                self._tfa = TwoFactorAuthentication(self)
-            return self._tfa
+            return self._lazy_init('_tfa', TwoFactorAuthentication, self)
         except AttributeError:
             return USER_LOGGED_OUT_MESSAGE
 
@@ -3040,7 +3383,7 @@ class Commcell(object):
 			**Note** To determine CommServ OS type logged in user
 				should have access on CommServ client
 		"""
-        if self._is_linux_commserv is None and self.clients.has_client(self._commserv_name):
+        if self._is_linux_commserv is None and self.clients.has_client(self.commserv_name):
             self._is_linux_commserv = 'unix' in self.commserv_client.os_info.lower()
         return self._is_linux_commserv
 
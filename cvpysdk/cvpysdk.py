@@ -35,6 +35,15 @@ This file is used to perform Authentication for the user on the Commcell.
 
     #.  Common method to be used in the entire SDK to perform REST API call on the Web Server
 
+The requests can be made concurrently from multiple threads. Each request is sent with a snapshot
+of the headers of the commcell, which are replaced, and never modified in place, on token renewal
+and logout. An expired token is renewed only once under a lock, by the first thread which gets
+the 401 response for it, and the other threads retry with the renewed token.
+
+
+_sniff_content_type()       --  returns the content type of the request payload, from its first
+and last characters
+
 
 CVPySDK:
 
@@ -46,26 +55,67 @@ CVPySDK:
 
     _renew_login_token()        --  renews the Authtoken for the currently logged in user
 
+    _renew_expired_token()      --  renews the expired Authtoken once, for all the threads which
+    got the 401 response for it
+
+    _set_authtoken()            --  replaces the headers of the commcell with a copy, with the
+    given Authtoken
+
     _logout()                   --  sign out the current logged in user from the commcell,
     and ends the session
 
-    _request()                  --  executes the request on the server and return the Response
+    _create_session()           --  creates the pooled, keep-alive HTTP session used for all the
+    requests made by this instance
+
+    _request()                  --  executes the request on the server and return the Response,
+    notifying the registered hooks
+
+    _send()                     --  sends the request to the server via the pooled session
+
+    add_hook()                  --  registers the hook to be notified of all the requests
+
+    remove_hook()               --  unregisters the hook registered earlier
+
+    close()                     --  closes the HTTP session, and releases all pooled connections
 
     who_am_i()                  --  Fetches the username of the user to whom authtoken is mapped
 
     make_request()              --  run the http request specified on the URL/WebService provided,
     and return the flag specifying success/fail, and response
 
+    make_request_async()        --  coroutine to run the http request on an executor thread,
+    without blocking the event loop
+
+
+CVPySDK instance Attributes
+===========================
+
+    **hooks**                   --  returns the list of the **RequestHook** instances registered
+
+    **metadata_cache**          --  returns / sets the **MetadataCache** used to cache the
+    responses of the GET requests for the entity metadata
+
+    **session**                 --  returns the **requests.Session** used to run the requests
+
+    **connection_stats**        --  returns the count of requests sent, connections opened,
+    and connections reused by the session
+
 """
 
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
-from xml.parsers.expat import ExpatError
+import asyncio
+import functools
+import re
+import threading
+import time
 
 import requests
 import xmltodict
 
+from requests.adapters import HTTPAdapter
+
 try:
     # Python 2 import
     import httplib
@@ -74,6 +124,36 @@ except ImportError:
     import http.client as httplib
 
 from .exception import SDKException
+from .response import JSONResponse
+
+
+_XML_START = re.compile(br'\s*(?:\xef\xbb\xbf)?\s*<')
+_XML_END = re.compile(br'>\s*$')
+
+
+def _sniff_content_type(payload):
+    """Returns the content type of the payload, from its first and last characters only,
+        instead of parsing the complete payload.
+
+        Args:
+            payload     (bytes)     --  payload of the request
+
+        Returns:
+            str     -   'application/xml', if the payload starts with a tag and ends with a tag
+
+                'text/plain', otherwise
+
+    """
+    if payload is None:
+        return 'application/xml'
+
+    if not isinstance(payload, (bytes, bytearray, memoryview)):
+        return 'text/plain'
+
+    if _XML_START.match(payload) and _XML_END.search(payload[-64:]):
+        return 'application/xml'
+
+    return 'text/plain'
 
 
 class CVPySDK(object):
@@ -82,7 +162,7 @@ class CVPySDK(object):
         Also contains common method for running all HTTP requests.
     """
 
-    def __init__(self, commcell_object, certificate_path=None):
+    def __init__(self, commcell_object, certificate_path=None, pool_connections=10, pool_maxsize=10):
         """Initialize the CVPySDK object for running various operations.
 
             Args:
@@ -94,16 +174,40 @@ class CVPySDK(object):
 
                     default: None
 
+
+                pool_connections        (int)   --  number of per-host connection pools to cache
+
+                    default: 10
+
+
+                pool_maxsize            (int)   --  maximum number of connections to keep alive
+                in the pool of each host
+
+                    default: 10
+
             Returns:
                 object  -   instance of the CVPySDK class
 
         """
         self._commcell_object = commcell_object
         self._certificate_path = certificate_path
+        self._session = self._create_session(pool_connections, pool_maxsize)
+        self._metadata_cache = None
+        self._hooks = []
+        self._token_lock = threading.RLock()
 
-    def _is_valid_service(self):
+    def _is_valid_service(self, web_service=None, timeout=184):
         """Checks if the service url is a valid url or not.
 
+            Args:
+                web_service     (str)   --  service url to check
+
+                    default: None, the web service of the commcell
+
+                timeout         (float) --  seconds to wait for the response
+
+                    default: 184
+
             Returns:
                 True    -   if the service url is valid
 
@@ -120,8 +224,8 @@ class CVPySDK(object):
         try:
             response = self._request(
                 method='GET',
-                url=self._commcell_object._web_service,
-                timeout=184
+                url=web_service or self._commcell_object._web_service,
+                timeout=timeout
             )
 
             # Valid service if the status code is 200 and response is True
@@ -238,6 +342,55 @@ class CVPySDK(object):
         except requests.exceptions.ConnectionError as con_err:
             raise con_err
 
+    def _renew_expired_token(self, expired_token):
+        """Renews the Authtoken of the commcell, if it still is the expired token.
+
+            Only one thread renews the token at a time. The threads which got the 401 response
+            for the same token wait for the renewal, and then use the new token, instead of
+            renewing it again. The new token is saved to the session file of the commcell, if any.
+
+            Args:
+                expired_token   (str)   --  Authtoken the request was rejected for
+
+            Returns:
+                bool    -   True, if the token was renewed by this call
+
+                    False, if it was already renewed by another thread
+
+            Raises:
+                SDKException:
+                    if token renew failed
+
+        """
+        with self._token_lock:
+            if self._commcell_object._headers['Authtoken'] != expired_token:
+                return False
+
+            self._set_authtoken(self._renew_login_token())
+
+            if getattr(self._commcell_object, '_session_file', None):
+                try:
+                    self._commcell_object._save_session()
+                except (IOError, OSError):
+                    # the saved session is only used to skip the login on the next start
+                    pass
+
+            return True
+
+    def _set_authtoken(self, authtoken):
+        """Sets the Authtoken in the headers of the commcell.
+
+            The headers are replaced with an updated copy, and never modified in place, so that
+            the requests running on other threads keep using a consistent snapshot of them.
+
+            Args:
+                authtoken   (str)   --  new Authtoken, or None after logout
+
+        """
+        headers = self._commcell_object._headers.copy()
+        headers['Authtoken'] = authtoken
+        self._commcell_object._headers = headers
+
     def _logout(self):
         """Posts a logout request to the server.
 
@@ -246,9 +399,10 @@ class CVPySDK(object):
 
         """
         flag, response = self.make_request('POST', self._commcell_object._services['LOGOUT'])
+        self.close()
 
         if flag:
-            self._commcell_object._headers['Authtoken'] = None
+            self._set_authtoken(None)
 
             if response.status_code == httplib.OK:
                 return response.text
@@ -257,8 +411,33 @@ class CVPySDK(object):
         else:
             return 'User already logged out'
 
+    @staticmethod
+    def _create_session(pool_connections, pool_maxsize):
+        """Creates the HTTP session to be used for running all the requests to the WebServer.
+
+            The connections opened by the session are kept alive, and re-used by the subsequent
+            requests to the same host, instead of doing the TCP / TLS handshake again.
+
+            Args:
+                pool_connections    (int)   --  number of per-host connection pools to cache
+
+                pool_maxsize        (int)   --  maximum number of connections to keep alive
+                in the pool of each host
+
+            Returns:
+                object  -   instance of the **requests.Session** class
+
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        return session
+
     def _request(self, **kwargs):
-        """Executes the request on the Server with the given parameters.
+        """Executes the request on the Server with the given parameters, via the pooled session.
 
             If the certificate path is given and the Web Service starts with **https**,
             it adds the **verify** parameter to the request, and passes the certificate path as
@@ -270,14 +449,143 @@ class CVPySDK(object):
                     **requests.request** method
 
             Returns:
-                object  -   **requests.Response** class instance, as received from calling the
-                **requests.request** method
+                object  -   **JSONResponse** class instance, i.e., the **requests.Response**
+                received from calling the **requests.Session.request** method, which decodes
+                its JSON body only once
+
+        """
+        hooks = self._hooks
+
+        if not hooks:
+            return self._send(**kwargs)
+
+        method, url = kwargs.get('method'), kwargs.get('url')
+
+        for hook in hooks:
+            hook.before_request(method, url)
+
+        start_time = time.time()
+
+        try:
+            response = self._send(**kwargs)
+        except Exception as error:
+            for hook in hooks:
+                hook.after_request(method, url, None, time.time() - start_time, error)
+            raise
+
+        elapsed = time.time() - start_time
+
+        for hook in hooks:
+            hook.after_request(method, url, response, elapsed)
+
+        return response
+
+    def _send(self, **kwargs):
+        """Sends the request to the Server via the pooled session.
+
+            Args:
+                **kwargs    --  dict of keyword arguments, same as accepted by the
+
+                    **requests.request** method
+
+            Returns:
+                object  -   **JSONResponse** class instance for the response received
 
         """
         if self._certificate_path and self._commcell_object._web_service.startswith('https'):
-            return requests.request(verify=self._certificate_path, **kwargs)
+            response = self._session.request(verify=self._certificate_path, **kwargs)
+        else:
+            response = self._session.request(**kwargs)
+
+        response.__class__ = JSONResponse
+        return response
 
-        return requests.request(**kwargs)
+    def add_hook(self, hook):
+        """Registers the hook to be notified of all the requests made via this instance.
+
+            Args:
+                hook    (object)    --  instance of the **RequestHook** class
+
+        """
+        # replace the list instead of appending to it, as it may be iterated by other threads
+        self._hooks = self._hooks + [hook]
+
+    def remove_hook(self, hook):
+        """Unregisters the hook, so that it is not notified of the requests anymore.
+
+            Args:
+                hook    (object)    --  instance of the **RequestHook** class
+
+        """
+        self._hooks = [registered for registered in self._hooks if registered is not hook]
+
+    def close(self):
+        """Closes the HTTP session, and all the connections kept alive in its pools."""
+        self._session.close()
+
+    @property
+    def hooks(self):
+        """Returns the list of the hooks registered to be notified of the requests."""
+        return list(self._hooks)
+
+    @property
+    def metadata_cache(self):
+        """Returns the instance of the MetadataCache class used to cache the GET responses."""
+        return self._metadata_cache
+
+    @metadata_cache.setter
+    def metadata_cache(self, metadata_cache):
+        """Sets the MetadataCache class instance to cache the GET responses in.
+
+            Args:
+                metadata_cache  (object)    --  instance of the MetadataCache class
+
+                    None, to disable the caching
+
+        """
+        self._metadata_cache = metadata_cache
+
+    @property
+    def session(self):
+        """Returns the instance of the **requests.Session** class used to run the requests."""
+        return self._session
+
+    @property
+    def connection_stats(self):
+        """Returns the connection usage statistics of the pools currently held by the session.
+
+            Returns:
+                dict    -   dictionary consisting of the count of requests and connections
+
+                    {
+                        "requests": 120,
+
+                        "connections": 2,
+
+                        "reused_connections": 118
+                    }
+
+        """
+        stats = {
+            'requests': 0,
+            'connections': 0,
+            'reused_connections': 0
+        }
+
+        for adapter in set(self._session.adapters.values()):
+            pools = adapter.poolmanager.pools
+
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+
+                if pool is None:
+                    continue
+
+                stats['requests'] += pool.num_requests
+                stats['connections'] += pool.num_connections
+
+        stats['reused_connections'] = max(stats['requests'] - stats['connections'], 0)
+        return stats
 
     def who_am_i(self, authtoken=None):
         """Get the username of the user, to whom the Authtoken belongs to.
@@ -327,7 +635,8 @@ class CVPySDK(object):
             attempts=0,
             headers=None,
             stream=False,
-            files=None):
+            files=None,
+            content_type=None):
         """Makes the request of the type specified in the argument 'method'.
 
             Args:
@@ -377,6 +686,13 @@ class CVPySDK(object):
 
                     default: None
 
+
+                content_type    (str)       --  content type of the string / bytes payload
+                of a POST request, e.g., 'application/xml'
+
+                    default: None, the content type is guessed from the first and the last
+                    characters of the payload, if the headers include the Content-type
+
             Returns:
                 tuple:
                     (True, response)    -   in case of success
@@ -394,6 +710,20 @@ class CVPySDK(object):
 
         """
         try:
+            metadata_cache = self._metadata_cache
+
+            # only the GET requests made with the default headers are served from / saved to
+            # the cache, while any other request invalidates it, whatever its headers are
+            use_cache = metadata_cache is not None and headers is None and not stream
+
+            if metadata_cache is not None and method != 'GET':
+                metadata_cache.invalidate(url)
+            elif use_cache and method == 'GET':
+                response = metadata_cache.get(self._commcell_object._user, url)
+
+                if response is not None:
+                    return (True, response)
+
             if headers is None:
                 headers = self._commcell_object._headers.copy()
 
@@ -414,14 +744,11 @@ class CVPySDK(object):
                         # pass silently if payload is alredy encoded in bytes
                         pass
 
-                    if 'Content-type' in headers and headers['Content-type'] not in [
+                    if content_type is not None:
+                        headers['Content-type'] = content_type
+                    elif 'Content-type' in headers and headers['Content-type'] not in [
                             'application/x-www-form-urlencoded']:
-                        try:
-                            if payload is not None:
-                                xmltodict.parse(payload)
-                            headers['Content-type'] = 'application/xml'
-                        except ExpatError:
-                            headers['Content-type'] = 'text/plain'
+                        headers['Content-type'] = _sniff_content_type(payload)
 
                     response = self._request(
                         method=method, url=url, headers=headers, data=payload, stream=stream
@@ -437,15 +764,104 @@ class CVPySDK(object):
 
             if response.status_code == httplib.UNAUTHORIZED and headers['Authtoken'] is not None:
                 if attempts < 3:
-                    self._commcell_object._headers['Authtoken'] = self._renew_login_token()
-                    return self.make_request(method, url, payload, attempts + 1)
+                    start_time = time.time()
+                    renewed = self._renew_expired_token(headers['Authtoken'])
+
+                    for hook in self._hooks:
+                        if renewed:
+                            hook.on_token_renew(time.time() - start_time)
+
+                        hook.on_retry(method, url, attempts + 1)
+
+                    return self.make_request(
+                        method, url, payload, attempts + 1, content_type=content_type
+                    )
                 else:
                     # Raise max attempts exception, if attempts exceeds 3
                     raise SDKException('CVPySDK', '103')
 
             if response.status_code == httplib.OK and response.ok:
+                if use_cache and method == 'GET':
+                    metadata_cache.set(self._commcell_object._user, url, response)
+
                 return (True, response)
             else:
                 return (False, response)
         except requests.exceptions.ConnectionError as con_err:
             raise con_err
+
+    async def make_request_async(
+            self,
+            method,
+            url,
+            payload=None,
+            attempts=0,
+            headers=None,
+            stream=False,
+            files=None,
+            executor=None,
+            content_type=None):
+        """Coroutine to make the request of the type specified in the argument 'method',
+            without blocking the running event loop.
+
+            The request is run via the **make_request** method on a thread of the executor,
+            and hence shares the same pooled session, and the Authtoken renewal logic.
+
+            Args:
+                method      (str)           --  HTTP operation to perform
+
+                url         (str)           --  the web url or service to run the HTTP request on
+
+                payload     (dict / str)    --  data to be passed along with the request
+
+                    default: None
+
+                attempts    (int)           --  number of attempts made with the same request
+
+                    default: 0
+
+                headers     (dict)          --  dict of request headers for the request
+
+                    default: None
+
+                stream      (bool)          --  boolean specifying whether the request should get
+                data via stream or normal get
+
+                    default: False
+
+                files       (dict)          --  file to upload
+
+                    default: None
+
+                executor    (object)        --  instance of the **concurrent.futures.Executor**
+                to run the request on
+
+                    default: None, the default executor of the event loop is used
+
+                content_type    (str)       --  content type of the string / bytes payload
+
+                    default: None
+
+            Returns:
+                tuple:
+                    (True, response)    -   in case of success
+
+                    (False, response)   -   in case of failure
+
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            executor,
+            functools.partial(
+                self.make_request,
+                method,
+                url,
+                payload,
+                attempts,
+                headers,
+                stream,
+                files,
+                content_type
+            )
+        )
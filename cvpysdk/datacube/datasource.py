@@ -75,8 +75,18 @@ Datasource:
 
     update_datasource_schema(schema)    --  updates the schema for the given data source
 
+    _post_import_data()                 --  posts the data to be indexed in a single request
+
+    _import_batch()                     --  imports a JSON encoded batch of documents, retrying
+                                                the failed requests with backoff
+
+    _encode_batches()                   --  generator to encode the documents into batches
+
     import_data(data)                   --  imports/pumps given data into data source.
 
+    import_data_stream(documents)       --  imports the documents from any iterable, in batches
+                                                sent concurrently
+
     delete_content()                    --  deletes the contents of the data source.
 
     refresh()                           --  refresh the properties of the datasource
@@ -109,11 +119,22 @@ DataSource Attributes
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import json
+import threading
+import time
+
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+
+import requests
+
 from past.builtins import basestring
 
 from .handler import Handlers
 from .sedstype import SEDS_TYPE_DICT
 
+from ..backoff import Backoff
 from ..exception import SDKException
 
 
@@ -814,11 +835,15 @@ class Datasource(object):
             response.text)
         raise SDKException('Response', '101', response_string)
 
-    def import_data(self, data):
-        """imports/pumps given data into data source.
+    def _post_import_data(self, data, content_type=None):
+        """Posts the data to be indexed into the data source, in a single request.
 
             Args:
-                data (list)   -- data to be indexed and pumped into  solr.list of key value pairs.
+                data            (list / bytes)  --  list of documents, or the JSON encoded list
+
+                content_type    (str)           --  content type of the encoded data
+
+                    default: None
 
             Raises:
                 SDKException:
@@ -828,7 +853,7 @@ class Datasource(object):
 
         """
         flag, response = self._commcell_object._cvpysdk_object.make_request(
-            'POST', self._datacube_import_data, data
+            'POST', self._datacube_import_data, data, content_type=content_type
         )
         if flag:
             if response.json() and 'errorCode' in response.json():
@@ -844,6 +869,227 @@ class Datasource(object):
         )
         raise SDKException('Response', '101', response_string)
 
+    def _import_batch(self, payload, backoff, keyed=False):
+        """Imports the JSON encoded batch of documents into the data source, retrying the
+            request with backoff if it fails due to a connection error, or an unexpected response.
+
+            A request which may have reached the server, e.g., on a read timeout, is retried only
+            if all the documents have a unique key, as the documents imported by the server would
+            be duplicated otherwise.
+
+            Args:
+                payload         (bytes)     --  JSON encoded list of the documents
+
+                backoff         (object)    --  instance of the Backoff class, to wait between
+                the retries with
+
+                keyed           (bool)      --  boolean specifying whether all the documents
+                have a unique key, and are overwritten if imported again
+
+                    default: False
+
+            Raises:
+                SDKException:
+                    if failed to import the batch
+
+        """
+        delays = backoff.delays()
+
+        while True:
+            try:
+                return self._post_import_data(payload, 'application/json')
+            except (SDKException, requests.exceptions.RequestException) as error:
+                if isinstance(error, SDKException):
+                    # the errors reported by the server for the documents are not retried
+                    retryable = error.exception_module == 'Response' and error.exception_id == '101'
+                else:
+                    retryable = keyed or isinstance(error, requests.exceptions.ConnectTimeout)
+
+                delay = next(delays, None) if retryable else None
+
+                if delay is None or not backoff.sleep(*delay, reason=str(error)):
+                    raise
+
+    @staticmethod
+    def _encode_batches(documents, batch_size, batch_bytes, unique_key=None):
+        """Generator to encode the documents to JSON one at a time, and group them into batches.
+
+            Args:
+                documents   (iterable)  --  documents to encode
+
+                batch_size  (int)       --  maximum number of documents in a batch
+
+                batch_bytes (int)       --  maximum size of the encoded batch, in bytes,
+                a document larger than it is sent in a batch of its own
+
+                unique_key  (str)       --  name of the field, which uniquely identifies a document
+
+                    default: None
+
+            Yields:
+                tuple   -   (JSON encoded list of the documents in the batch, number of documents,
+                whether all the documents in the batch have the unique key)
+
+        """
+        batch = []
+        size = 2
+        keyed = unique_key is not None
+
+        for document in documents:
+            encoded = json.dumps(document, separators=(',', ':')).encode('utf-8')
+
+            if batch and (len(batch) >= batch_size or size + len(encoded) + 1 > batch_bytes):
+                yield b'[' + b','.join(batch) + b']', len(batch), keyed
+                batch = []
+                size = 2
+                keyed = unique_key is not None
+
+            batch.append(encoded)
+            size += len(encoded) + 1
+            keyed = keyed and document.get(unique_key) is not None
+
+        if batch:
+            yield b'[' + b','.join(batch) + b']', len(batch), keyed
+
+    def import_data(self, data):
+        """imports/pumps given data into data source.
+
+            Args:
+                data (list)   -- data to be indexed and pumped into  solr.list of key value pairs.
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+
+        """
+        self._post_import_data(data)
+
+    def import_data_stream(
+            self,
+            documents,
+            batch_size=1000,
+            batch_bytes=4 * 1024 ** 2,
+            workers=4,
+            max_retries=3,
+            progress_callback=None,
+            unique_key=None,
+            backoff=None):
+        """Imports the documents into the data source in batches, sending multiple batches
+            concurrently.
+
+            The documents are read from the iterable, and encoded one at a time, and only the
+            batches being sent are held in memory, hence any number of documents can be
+            imported from a generator in constant memory.
+
+            Args:
+                documents           (iterable)  --  documents to import, e.g., a list, or a
+                generator of the dicts of key value pairs
+
+                batch_size          (int)       --  maximum number of documents to send in a
+                single request
+
+                    default: 1000
+
+                batch_bytes         (int)       --  maximum size of the JSON body of a single
+                request, in bytes
+
+                    default: 4 MB
+
+                workers             (int)       --  maximum number of requests to run concurrently
+
+                    default: 4
+
+                max_retries         (int)       --  number of times to retry a batch, after the
+                request failed due to a connection error, or an unexpected response
+
+                    default: 3
+
+                unique_key          (str)       --  name of the field, which uniquely identifies
+                a document in the data source, a batch is retried after a read timeout only if
+                all its documents have this field, as the server may have imported the batch
+
+                    default: None, the batches are not retried after a read timeout
+
+                progress_callback   (callable)  --  function to call after each batch is imported,
+                with the arguments:
+
+                    (number of documents imported, documents imported per second)
+
+                    default: None
+
+                backoff             (object)    --  instance of the Backoff class, to wait
+                between the retries of a batch with
+
+                    default: None, exponential backoff of up to 30 seconds, for max retries
+
+            Returns:
+                dict    -   summary of the import
+
+                    {
+                        'documents': number of documents imported,
+
+                        'batches': number of batches sent,
+
+                        'documents_per_second': rate of the import
+                    }
+
+            Raises:
+                SDKException:
+                    if type of the batch size, batch bytes, workers or max retries is not valid
+
+                    if failed to import a batch
+
+        """
+        for value in (batch_size, batch_bytes, workers):
+            if not isinstance(value, int) or value < 1:
+                raise SDKException('Datacube', '101')
+
+        if not isinstance(max_retries, int) or max_retries < 0:
+            raise SDKException('Datacube', '101')
+
+        if backoff is None:
+            backoff = Backoff(initial_delay=1, max_delay=30, max_attempts=max_retries)
+
+        summary = {'documents': 0, 'batches': 0, 'documents_per_second': 0.0}
+        lock = threading.Lock()
+        start_time = time.time()
+
+        def _send(payload, count, keyed):
+            self._import_batch(payload, backoff, keyed)
+
+            with lock:
+                elapsed_time = time.time() - start_time
+                summary['documents'] += count
+                summary['batches'] += 1
+
+                if elapsed_time:
+                    summary['documents_per_second'] = summary['documents'] / elapsed_time
+
+                if progress_callback is not None:
+                    progress_callback(summary['documents'], summary['documents_per_second'])
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+
+            batches = self._encode_batches(documents, batch_size, batch_bytes, unique_key)
+
+            for payload, count, keyed in batches:
+                # wait for a request to complete, before encoding more batches than the workers
+                if len(pending) >= workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        future.result()
+
+                pending.add(executor.submit(_send, payload, count, keyed))
+
+            for future in pending:
+                future.result()
+
+        return summary
+
     def delete_content(self):
         """deletes the content of a data source from Data Cube.
            The data source itself is not deleted using this API.
@@ -18,12 +18,14 @@
 
 """Main file for performing handler operations on a datasource.
 
-Handlers and Handler are 2 classes defined in this file.
+Handlers, Handler and HandlerResultCache are the 3 classes defined in this file.
 
 Handlers: Class for representing all the Handlers associated with the datasource
 
 Handler: Class for a single Handler of the datasource
 
+HandlerResultCache: Class for caching the results of the handlers executed, with a time-to-live
+
 Handlers:
 
     __init__()                  --  initialize object of Handlers class associated with commcell
@@ -46,6 +48,14 @@ Handlers:
 
     delete()                    -- deletes the given handler name
 
+    execute_many()              -- executes the given handlers concurrently
+
+Handlers Attributes
+-------------------
+
+    **result_cache**            --  returns / sets the HandlerResultCache the handler results
+    are cached in
+
 Handler:
 
     __init__()                  -- Initialize object for Handler
@@ -54,26 +64,48 @@ Handler:
 
     share()                     -- Share the handler with user or usergroup
 
+HandlerResultCache:
+
+    __init__(ttl, max_size)     --  initialize the instance of the HandlerResultCache class
+
+    is_cacheable()              --  checks if the response of the URL can be cached
+
+Usage:
+
+    >>> handlers = datasource.ds_handlers
+    >>> handlers.result_cache = HandlerResultCache(ttl=60, max_size=256)
+
+    >>> results = handlers.execute_many([('handler1', ''), ('handler2', 'rows=10')])
+    >>> results[('handler1', '')]
+
 """
 
 
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+from concurrent.futures import ThreadPoolExecutor
+
 from past.builtins import basestring
 
 from ..exception import SDKException
+from ..metadata_cache import MetadataCache
 
 
 class Handlers(object):
     """Class for representing all the handlers associated with the datasource."""
 
-    def __init__(self, datasource_object):
+    def __init__(self, datasource_object, result_cache=None):
         """Initialize object of the Handlers class.
 
             Args:
                 _datasource_object (object)  --  instance of the datastore class
 
+                result_cache       (object)  --  instance of the HandlerResultCache class, to
+                cache the results of the handlers executed in
+
+                    default: None, the results are not cached
+
             Returns:
                 object - instance of the Handlers class
 
@@ -87,6 +119,7 @@ class Handlers(object):
         )
 
         self._handlers = None
+        self._result_cache = result_cache
         self.refresh()
 
     def __str__(self):
@@ -190,7 +223,7 @@ class Handlers(object):
 
         if self.has_handler(handler_name):
             handler_id = self.get_properties(handler_name)['handlerId']
-            return Handler(self._datasource_object, handler_name, handler_id)
+            return Handler(self._datasource_object, handler_name, handler_id, self._result_cache)
         raise SDKException('Datacube', '102', "Unable to get handler class object")
 
     def delete(self, handler_name):
@@ -224,6 +257,8 @@ class Handlers(object):
                 o_str = 'Failed to Delete handler on datasource\nError: "{0}"'.format(error_message)
                 raise SDKException('Datacube', '102', o_str)
             elif 'errorCode' in response.json() and response.json()['errorCode'] == 0:
+                if self._result_cache is not None:
+                    self._result_cache.clear()
                 return
             else:
                 raise SDKException('Datacube', '102', "Empty Response with no errorCode")
@@ -326,15 +361,104 @@ class Handlers(object):
             response.text)
         raise SDKException('Response', '101', response_string)
 
+    def execute_many(self, handler_requests, workers=8, raise_on_error=True):
+        """Executes the given handlers concurrently, with their filters.
+
+            The same handler and filter given more than once is executed only once.
+
+            Args:
+                handler_requests    (list)  --  list of (handler name, handler filter) tuples,
+                or the handler names, to execute them without a filter
+
+                    e.g.:   [('handler1', ''), ('handler2', 'rows=10&fq=size:[0 TO 100]')]
+
+                workers             (int)   --  maximum number of handlers to execute at once
+
+                    default: 8
+
+                raise_on_error      (bool)  --  whether to raise the exception, if any of the
+                handlers fails, or to return the exception as its result
+
+                    default: True
+
+            Returns:
+                dict    -   dictionary with the (handler name, handler filter) tuples as keys,
+                and the data fetched from the handlers as values
+
+                    {
+                        ('handler1', ''): dict of values fetched from handler1,
+
+                        ('handler2', 'rows=10'): dict of values fetched from handler2
+                    }
+
+            Raises:
+                SDKException:
+                    if type of the handler requests or workers argument is not valid
+
+                    if no handler exists with the given name
+
+                    if failed to execute any of the handlers, and raise_on_error is True
+
+        """
+        if not isinstance(handler_requests, (list, tuple)):
+            raise SDKException('Datacube', '101')
+
+        if not isinstance(workers, int) or workers < 1:
+            raise SDKException('Datacube', '101')
+
+        handler_requests = list(dict.fromkeys(
+            (request, '') if isinstance(request, basestring) else tuple(request)
+            for request in handler_requests
+        ))
+
+        if not handler_requests:
+            return {}
+
+        handler_objects = {}
+
+        for handler_name, _ in handler_requests:
+            if handler_name not in handler_objects:
+                handler_objects[handler_name] = self.get(handler_name)
+
+        def execute(handler_request):
+            handler_name, handler_filter = handler_request
+
+            try:
+                return handler_objects[handler_name].get_handler_data(handler_filter)
+            except SDKException as excp:
+                if raise_on_error:
+                    raise
+                return excp
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(handler_requests))) as executor:
+            return dict(zip(handler_requests, executor.map(execute, handler_requests)))
+
     def refresh(self):
         """Refresh the handlers associated with the Datasource."""
         self._handlers = self._get_handlers()
 
+    @property
+    def result_cache(self):
+        """Returns the instance of the HandlerResultCache class, the results are cached in."""
+        return self._result_cache
+
+    @result_cache.setter
+    def result_cache(self, result_cache):
+        """Sets the cache to store the results of the handlers executed in.
+
+            Args:
+                result_cache    (object)    --  instance of the HandlerResultCache class
+
+                    None, to disable the caching of the handler results
+
+        """
+        self._result_cache = result_cache
+
 
 class Handler(object):
     """Class for performing operations on a single Handler"""
 
-    def __init__(self, datasource_object, handler_name, handler_id=None):
+    def __init__(self, datasource_object, handler_name, handler_id=None, result_cache=None):
         """Initialize an object of the Handler class.
 
             Args:
@@ -344,6 +468,9 @@ class Handler(object):
 
                 handler_id            (int)       --  Id of the Handler. Default = None
 
+                result_cache          (object)    --  instance of the HandlerResultCache class,
+                to cache the handler results in. Default = None
+
             Returns:
 
                 object  -   instance of the Handler class
@@ -356,6 +483,7 @@ class Handler(object):
             self._handler_id = handler_id
         self.commcell_obj = self._datasource_object._commcell_object
         self._share_handler = self.commcell_obj._services['SHARE_HANDLER']
+        self._result_cache = result_cache
 
     @property
     def handler_id(self):
@@ -387,6 +515,9 @@ class Handler(object):
 
     def get_handler_data(self, handler_filter=""):
         """ Executes handler for fetching data
+
+            The result is served from the result cache of the handler, if any, until it expires.
+
                 Args:
 
                      handler_filter    (str)  -- Filter which needs to applied for handler execution
@@ -410,13 +541,26 @@ class Handler(object):
         self._execute_handler = self.commcell_obj._services['EXECUTE_HANDLER'] % (
             self.handler_id, self._handler_name, handler_filter
         )
-        flag, response = self.commcell_obj._cvpysdk_object.make_request(
-            'GET', self._execute_handler)
+        result_cache = self._result_cache
+        user = self.commcell_obj._user
+        response = None
+
+        if result_cache is not None:
+            response = result_cache.get(user, self._execute_handler)
+
+        if response is not None:
+            flag = True
+        else:
+            flag, response = self.commcell_obj._cvpysdk_object.make_request(
+                'GET', self._execute_handler)
         if flag:
-            if response.json() and 'response' in response.json():
-                return response.json()['response']
-            if 'error' in response.json():
-                error_message = response.json()['error']['errLogMessage']
+            response_json = response.json()
+            if response_json and 'response' in response_json:
+                if result_cache is not None:
+                    result_cache.set(user, self._execute_handler, response)
+                return response_json['response']
+            if 'error' in response_json:
+                error_message = response_json['error']['errLogMessage']
                 o_str = 'Failed to execute handler on datasource\nError: "{0}"'.format(error_message)
                 raise SDKException('Datacube', '102', o_str)
             raise SDKException('Datacube', '102', "No response object in Json")
@@ -497,3 +641,49 @@ class Handler(object):
                 return response.json()['response']
             raise SDKException('Datacube', '102', "Empty Response")
         raise SDKException('Response', '101', response.text)
+
+
+class HandlerResultCache(MetadataCache):
+    """Class for caching the results of the handlers in memory, with a time-to-live.
+
+        The results are keyed on the user and the URL of the handler execution, which consists of
+        the id and the name of the handler, and the filter applied, the handler id being unique
+        across the datasources.
+
+        The results are not invalidated by the data imported to the datasource, and are
+        refreshed only once they expire.
+
+    """
+
+    def __init__(self, ttl=60, max_size=256):
+        """Initialize the instance of the HandlerResultCache class.
+
+            Args:
+                ttl         (int)   --  seconds for which a handler result is valid
+
+                    default: 60
+
+                max_size    (int)   --  maximum number of handler results to keep in memory,
+                the least recently used result is evicted first
+
+                    default: 256
+
+            Returns:
+                object  -   instance of the HandlerResultCache class
+
+        """
+        super(HandlerResultCache, self).__init__(ttl, max_size, services=())
+
+    def is_cacheable(self, url):
+        """Checks if the response of the given URL can be cached.
+
+            All the handler executions can be cached, whatever the filter applied.
+
+            Args:
+                url     (str)   --  URL of the handler execution
+
+            Returns:
+                bool    -   True
+
+        """
+        return True
@@ -1289,7 +1289,7 @@ class DownloadCenter(object):
         flag, response = self._cvpysdk_object.make_request(
             'POST', self._services['DOWNLOAD_PACKAGE'], request_xml.format(
                 package_id, platform_id, download_type, request_id
-            )
+            ), content_type='application/xml'
         )
 
         if flag:
@@ -1311,7 +1311,8 @@ class DownloadCenter(object):
                 'POST',
                 self._services['DOWNLOAD_VIA_STREAM'],
                 request_xml.format(package_id, platform_id, download_type, request_id),
-                stream=True
+                stream=True,
+                content_type='application/xml'
             )
 
             # download chunks of 1MB each
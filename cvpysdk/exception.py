@@ -85,6 +85,7 @@ EXCEPTION_DICT = {
     'Response': {
         '101': 'Response was not success',
         '102': 'Response received is empty',
+        '103': 'Response was not success, the request may have been processed by the server',
         '500': 'Unable to perform the requested method'
     },
     'Commcell': {
@@ -93,7 +94,8 @@ EXCEPTION_DICT = {
         '103': 'Failed to get the CommServ details',
         '104': 'Failed to send an email to specified user',
         '105': 'Failed to run the Data Aging job',
-        '106': 'Failed to get the SAML token'
+        '106': 'Failed to get the SAML token',
+        '107': 'Data type of the input(s) is not valid'
     },
     'CVPySDK': {
         '101': 'Failed to Login with the credentials provided',
@@ -94,8 +94,28 @@ IndexServer
 
     _create_solr_query()                --  Create solr search query based on inputs provided
 
+    _get_solr_node()                    --  returns the node to send the next solr request to
+
+    _run_solr_request()                 --  runs the solr query on the given core
+
     execute_solr_query()                --  Creates solr url based on input and executes it on solr on given core
 
+    _get_unique_key()                   --  returns the unique key field of the given core
+
+    iter_solr_query()                   --  generator to walk through all the documents matching
+                                            the query, via the solr cursorMark paging
+
+    export_solr_query()                 --  writes all the documents matching the query to a
+                                            JSONL / CSV file
+
+    _get_sort_key()                     --  returns the key function to order the documents on
+                                            the solr sort clause
+
+    _merge_facet_counts()               --  merges the facet counts returned by the nodes
+
+    execute_solr_query_distributed()    --  executes the solr query on all the nodes concurrently,
+                                            and merges the results
+
     get_index_node()                    --  returns an Index server node object for given node name
 
 IndexServer Attributes
@@ -185,7 +205,17 @@ _Roles Attributes
     **roles_data**                      --  returns the list of details of all cloud roles
     """
 
+import csv
+import json
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from functools import cmp_to_key
+from heapq import merge
+from itertools import chain, islice
+from urllib.parse import quote
+
 from past.builtins import basestring
 from .exception import SDKException
 from .datacube.constants import IndexServerConstants
@@ -612,6 +642,9 @@ class IndexServer(object):
             self._cloud_id = self._get_cloud_id()
         self._properties = None
         self._roles_obj = None
+        self._solr_lock = threading.Lock()
+        self._solr_requests = {}
+        self._next_solr_node = 0
         self.refresh()
 
     def __repr__(self):
@@ -829,63 +862,119 @@ class IndexServer(object):
                         if failed to form solr query
         """
         try:
-            search_query = f'q='
-            simple_search = 0
-            if select_dict:
-                for key, value in select_dict.items():
-                    if isinstance(key, tuple):
-                        if isinstance(value, list):
-                            search_query += f'({key[0]}:{str(value[0])}'
-                            for val in value[1:]:
-                                search_query += f' OR {key[0]}:{str(val)}'
-                        else:
-                            search_query += f'({key[0]}:{value}'
-                        for key_val in key[1:]:
-                            if isinstance(value, list):
-                                search_query += f' OR {key_val}:{str(value[0])}'
-                                for val in value[1:]:
-                                    search_query += f' OR {key_val}:{str(val)}'
-                            else:
-                                search_query += f' OR {key_val}:{value}'
-                        search_query += ') AND '
-                    elif isinstance(value, list):
-                        search_query += f'({key}:{str(value[0])}'
-                        for val in value[1:]:
-                            search_query += f' OR {key}:{str(val)}'
-                        search_query += ") AND "
-                    elif key == "keyword":
-                        search_query += "(" + value + ")"
-                        simple_search = 1
-                        break
-                    else:
-                        search_query = search_query + f'{key}:{str(value)} AND '
-                if simple_search == 0:
-                    search_query = search_query[:-5]
-            else:
-                search_query += "*:*"
+            clauses = []
+            keyword = None
+
+            for key, value in (select_dict or {}).items():
+                if isinstance(key, tuple):
+                    values = value if isinstance(value, list) else [value]
+                    terms = [f'{field}:{str(val)}' for field in key for val in values]
+                    clauses.append('({0})'.format(' OR '.join(terms)))
+                elif isinstance(value, list):
+                    terms = [f'{key}:{str(val)}' for val in value]
+                    clauses.append('({0})'.format(' OR '.join(terms)))
+                elif key == "keyword":
+                    keyword = "(" + value + ")"
+                    break
+                else:
+                    clauses.append(f'{key}:{str(value)}')
+
+            if keyword is not None:
+                clauses.append(keyword)
+
+            query_parts = ['q=', ' AND '.join(clauses) if select_dict else '*:*']
 
-            field_query = ""
             if attr_list:
-                field_query = "&fl="
-                for item in attr_list:
-                    field_query += f'{str(item)},'
-                field_query = field_query[:-1]
-
-            ex_query = ""
-            if not op_params:
-                op_params = {'wt': "json"}
-            else:
-                op_params['wt'] = "json"
+                query_parts.append('&fl=' + ','.join(str(item) for item in attr_list))
+
+            op_params = dict(op_params or {}, wt='json')
+
             for key, value in op_params.items():
                 if value is None:
-                    ex_query += f'&{key}'
+                    query_parts.append(f'&{key}')
                 else:
-                    ex_query += f'&{key}={str(value)}'
-            final_url = f'{search_query}{field_query}{ex_query}'
-            return final_url
+                    query_parts.append(f'&{key}={str(value)}')
+
+            return ''.join(query_parts)
         except Exception as excp:
             raise SDKException('IndexServers', '104', f"Something went wrong while creating solr query - {excp}")
 
+    def _get_solr_node(self, solr_client=None):
+        """Returns the index of the Index server node to send the next solr request to.
+
+            For a solr cloud, the node with the fewest requests in progress from this instance
+            is picked, and the nodes with the same number of requests are used round-robin.
+            Otherwise, the first node is used, as the cores are not shared by the nodes.
+
+            Args:
+                solr_client     (str)   --  Index Server client name to use, instead of picking
+                one
+
+                    default: None
+
+            Returns:
+                int     -   index of the node in the **server_url** / **client_name** lists
+
+            Raises:
+                SDKException:
+
+                        if the client name is not found in this index server
+
+        """
+        if solr_client is not None:
+            if solr_client not in self.client_name:
+                raise SDKException(
+                    'IndexServers', '104', 'client name not found in this index server'
+                )
+            return self.client_name.index(solr_client)
+
+        if not self.is_cloud or len(self.server_url) == 1:
+            return 0
+
+        with self._solr_lock:
+            nodes = len(self.server_url)
+            order = [(self._next_solr_node + offset) % nodes for offset in range(nodes)]
+            node = min(order, key=lambda index: self._solr_requests.get(index, 0))
+            self._next_solr_node = (node + 1) % nodes
+            return node
+
+    def _run_solr_request(self, core_name, query, solr_client=None):
+        """Runs the solr query on the given core, on the node picked by **_get_solr_node()**.
+
+            Args:
+                core_name       (str)   --  core name / collection name to query
+
+                query           (str)   --  solr query string, created by **_create_solr_query()**
+
+                solr_client     (str)   --  Index Server client name to execute the query on
+
+                    default: None
+
+            Returns:
+                dict    -   JSON response of the query
+
+            Raises:
+                SDKException:
+
+                        if response is not success
+
+        """
+        node = self._get_solr_node(solr_client)
+        solr_url = f"{self.server_url[node]}/solr/{core_name}/select?{query}"
+
+        with self._solr_lock:
+            self._solr_requests[node] = self._solr_requests.get(node, 0) + 1
+
+        try:
+            flag, response = self._cvpysdk_object.make_request("GET", solr_url)
+        finally:
+            with self._solr_lock:
+                self._solr_requests[node] -= 1
+
+        if flag and response.json():
+            return response.json()
+        raise SDKException('IndexServers', '104', "Something went wrong while querying solr")
+
     def execute_solr_query(
             self,
             core_name,
@@ -899,7 +988,8 @@ class IndexServer(object):
                 core_name               (str)           --  Core name/collection name where we want to query
 
                 solr_client             (str)           --  Index Server client name to execute solr query
-                                                                Default : None (picks first client on index server)
+                                                                Default : None (picks the least loaded node
+                                                                for solr cloud, else the first node)
 
                 select_dict             (dictionary)    --  Dictionary containing search criteria and
                                                             value. Acts as 'q' field in solr query
@@ -937,18 +1027,405 @@ class IndexServer(object):
 
                         if response is not success
         """
-        solr_url = f"solr/{core_name}/select?{self._create_solr_query(select_dict, attr_list, op_params)}"
-        if solr_client is None:
-            solr_url = f"{self.server_url[0]}/{solr_url}"
+        query = self._create_solr_query(select_dict, attr_list, op_params)
+        return self._run_solr_request(core_name, query, solr_client)
+
+    def _get_unique_key(self, core_name, solr_client=None):
+        """Returns the name of the unique key field of the given core.
+
+            Args:
+                core_name       (str)   --  core name / collection name
+
+                solr_client     (str)   --  Index Server client name to send the request to
+
+                    default: None
+
+            Returns:
+                str     -   name of the unique key field
+
+            Raises:
+                SDKException:
+
+                        if response is not success
+
+        """
+        node = self._get_solr_node(solr_client)
+        schema_url = f"{self.server_url[node]}/solr/{core_name}/schema/uniquekey?wt=json"
+        flag, response = self._cvpysdk_object.make_request("GET", schema_url)
+        if flag and response.json() and 'uniqueKey' in response.json():
+            return response.json()['uniqueKey']
+        raise SDKException('IndexServers', '104', "Unable to get the unique key of the solr core")
+
+    def iter_solr_query(
+            self,
+            core_name,
+            select_dict=None,
+            attr_list=None,
+            op_params=None,
+            page_size=1000,
+            solr_client=None,
+            unique_key=None,
+            prefetch=True):
+        """Generator to walk through all the documents matching the solr query, one page at a
+            time, via the solr cursorMark paging.
+
+            Unlike the start / rows paging, the cost of fetching a page does not grow with its
+            offset, and the pages are consistent even if the index is modified meanwhile.
+
+            The results are sorted on the unique key of the core, after the sort given in the
+            op params, if any. The requests are spread across the nodes of a solr cloud, and the
+            next page is fetched in the background, while the documents of the current page are
+            being consumed.
+
+            Args:
+                core_name       (str)           --  core name / collection name to query
+
+                select_dict     (dictionary)    --  search criteria, refer **execute_solr_query()**
+
+                    default: None, all the documents
+
+                attr_list       (set)           --  column names to be returned in results
+
+                    default: None
+
+                op_params       (dictionary)    --  other params and values for solr query,
+                'start', 'rows', and 'cursorMark' are ignored
+
+                    default: None
+
+                page_size       (int)           --  number of documents to fetch per request
+
+                    default: 1000
+
+                solr_client     (str)           --  Index Server client name to execute the
+                queries on
+
+                    default: None, picks the least loaded node for each request
+
+                unique_key      (str)           --  name of the unique key field of the core
+
+                    default: None, fetched from the schema of the core
+
+                prefetch        (bool)          --  whether to fetch the next page in the
+                background
+
+                    default: True
+
+            Yields:
+                dict    -   each document matching the query
+
+            Raises:
+                SDKException:
+
+                        if type of the page size is not valid
+
+                        if response is not success
+
+        """
+        if not isinstance(page_size, int) or page_size < 1:
+            raise SDKException('IndexServers', '101')
+
+        if unique_key is None:
+            unique_key = self._get_unique_key(core_name, solr_client)
+
+        op_params = {
+            key: value for key, value in (op_params or {}).items()
+            if key not in ('start', 'rows', 'cursorMark')
+        }
+
+        sort = op_params.get('sort')
+        if not sort or unique_key not in [clause.split()[0] for clause in sort.split(',')]:
+            op_params['sort'] = f'{sort},{unique_key} asc' if sort else f'{unique_key} asc'
+
+        op_params['rows'] = page_size
+
+        def _get_page(cursor_mark):
+            params = dict(op_params, cursorMark=quote(cursor_mark, safe=''))
+            query = self._create_solr_query(select_dict, attr_list, params)
+            return self._run_solr_request(core_name, query, solr_client)
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        cursor_mark = '*'
+
+        try:
+            page = _get_page(cursor_mark)
+
+            while True:
+                next_cursor_mark = page.get('nextCursorMark', cursor_mark)
+                documents = page.get('response', {}).get('docs', [])
+
+                # the cursor mark does not change after the last page
+                is_last_page = next_cursor_mark == cursor_mark or not documents
+                next_page = None
+
+                if executor is not None and not is_last_page:
+                    next_page = executor.submit(_get_page, next_cursor_mark)
+
+                for document in documents:
+                    yield document
+
+                if is_last_page:
+                    break
+
+                cursor_mark = next_cursor_mark
+                page = next_page.result() if next_page is not None else _get_page(cursor_mark)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def export_solr_query(self, core_name, sink, output_format='jsonl', **kwargs):
+        """Writes all the documents matching the solr query to the sink, one page at a time,
+            without holding all the results in memory.
+
+            Args:
+                core_name       (str)           --  core name / collection name to query
+
+                sink            (str / object)  --  path of the file to write the documents to,
+                or a file object opened in text mode
+
+                output_format   (str)           --  format to write the documents in
+
+                    Valid values are:
+
+                        -   jsonl   -   one JSON document per line
+
+                        -   csv     -   one row per document, with the columns in the
+                        **attr_list**, or the fields of the first document
+
+                    default: jsonl
+
+                **kwargs                        --  arguments for **iter_solr_query()**, e.g.,
+                select_dict, attr_list, op_params, page_size, solr_client
+
+            Returns:
+                int     -   number of documents written
+
+            Raises:
+                SDKException:
+
+                        if the output format is not valid
+
+                        if response is not success
+
+        """
+        if output_format not in ('jsonl', 'csv'):
+            raise SDKException('IndexServers', '104', 'Output format should be jsonl or csv')
+
+        if isinstance(sink, basestring):
+            with open(sink, 'w', encoding='utf-8', newline='') as file_object:
+                return self.export_solr_query(core_name, file_object, output_format, **kwargs)
+
+        documents = self.iter_solr_query(core_name, **kwargs)
+        count = 0
+
+        if output_format == 'jsonl':
+            for document in documents:
+                sink.write(json.dumps(document) + '\n')
+                count += 1
+
+            return count
+
+        writer = None
+
+        for document in documents:
+            if writer is None:
+                fieldnames = list(kwargs.get('attr_list') or document.keys())
+                writer = csv.DictWriter(sink, fieldnames=fieldnames, extrasaction='ignore')
+                writer.writeheader()
+
+            writer.writerow(document)
+            count += 1
+
+        return count
+
+    @staticmethod
+    def _get_sort_key(sort):
+        """Returns the key function to order the documents from different nodes the same way as
+            solr, for the given sort clause.
+
+            Documents missing a sort field are placed last, as done by solr.
+
+            Args:
+                sort    (str)   --  solr sort clause, e.g., 'field1 asc,field2 desc'
+
+            Returns:
+                function    -   key function for the documents, None if no sort is given
+
+        """
+        if not sort:
+            return None
+
+        fields = []
+
+        for clause in sort.split(','):
+            field, _, order = clause.strip().partition(' ')
+            fields.append((field, order.strip().lower() == 'desc'))
+
+        def compare(document1, document2):
+            for field, descending in fields:
+                value1, value2 = document1.get(field), document2.get(field)
+
+                if value1 == value2:
+                    continue
+
+                if value1 is None or value2 is None:
+                    return 1 if value1 is None else -1
+
+                result = -1 if value1 < value2 else 1
+                return -result if descending else result
+
+            return 0
+
+        return cmp_to_key(compare)
+
+    @staticmethod
+    def _merge_facet_counts(facet_counts_list):
+        """Merges the facet counts returned by the nodes, by adding the counts of each value.
+
+            Args:
+                facet_counts_list   (list)  --  'facet_counts' of the response of each node
+
+            Returns:
+                dict    -   merged facet counts, with the values of the facet fields ordered
+                by their count
+
+        """
+        facet_queries = {}
+        facet_fields = {}
+        facet_ranges = {}
+
+        def add_counts(counts, pairs):
+            # solr returns the counts as a flat list of value, count pairs
+            for index in range(0, len(pairs) - 1, 2):
+                counts[pairs[index]] = counts.get(pairs[index], 0) + pairs[index + 1]
+
+        for facet_counts in facet_counts_list:
+            for query, count in facet_counts.get('facet_queries', {}).items():
+                facet_queries[query] = facet_queries.get(query, 0) + count
+
+            for field, pairs in facet_counts.get('facet_fields', {}).items():
+                add_counts(facet_fields.setdefault(field, {}), pairs)
+
+            for field, facet_range in facet_counts.get('facet_ranges', {}).items():
+                add_counts(facet_ranges.setdefault(field, {}), facet_range.get('counts', []))
+
+        def to_pairs(counts, by_count=True):
+            items = counts.items()
+
+            if by_count:
+                items = sorted(items, key=lambda item: -item[1])
+
+            return [value for item in items for value in item]
+
+        return {
+            'facet_queries': facet_queries,
+            'facet_fields': {
+                field: to_pairs(counts) for field, counts in facet_fields.items()
+            },
+            'facet_ranges': {
+                field: {'counts': to_pairs(counts, by_count=False)}
+                for field, counts in facet_ranges.items()
+            }
+        }
+
+    def execute_solr_query_distributed(
+            self,
+            core_name,
+            select_dict=None,
+            attr_list=None,
+            op_params=None,
+            solr_clients=None):
+        """Executes the solr query on the given core of all the Index server nodes concurrently,
+            and merges the results of the nodes as if they were shards of the same index.
+
+            The documents are merged on the sort given in the op params, the 'numFound' and the
+            facet counts are added up across the nodes.
+
+            For a solr cloud, the query is run on a single node, as solr already distributes it
+            across the shards of the collection.
+
+            Args:
+                core_name       (str)           --  core name / collection name to query
+
+                select_dict     (dictionary)    --  search criteria, refer **execute_solr_query()**
+
+                    default: None, all the documents
+
+                attr_list       (set)           --  column names to be returned in results,
+                must include the sort fields for the results to be merged in order
+
+                    default: None
+
+                op_params       (dictionary)    --  other params and values for solr query,
+                'start' and 'rows' apply to the merged results
+
+                    default: None
+
+                solr_clients    (list)          --  Index Server client names to query
+
+                    default: None, all the nodes of the index server
+
+            Returns:
+                dict    -   merged response, with the keys 'responseHeader', 'response', and
+                'facet_counts', if facets were requested
+
+            Raises:
+                SDKException:
+
+                        if the client name is not found in this index server
+
+                        if response is not success
+
+        """
+        if self.is_cloud:
+            return self.execute_solr_query(core_name, None, select_dict, attr_list, op_params)
+
+        solr_clients = solr_clients or self.client_name
+        op_params = dict(op_params or {})
+        start = int(op_params.pop('start', 0))
+        rows = int(op_params.pop('rows', 10))
+
+        # every node must return its first start + rows documents for the merge to be correct
+        query = self._create_solr_query(
+            select_dict, attr_list, dict(op_params, start=0, rows=start + rows)
+        )
+
+        with ThreadPoolExecutor(max_workers=len(solr_clients)) as executor:
+            responses = list(executor.map(
+                lambda solr_client: self._run_solr_request(core_name, query, solr_client),
+                solr_clients
+            ))
+
+        sort_key = self._get_sort_key(op_params.get('sort'))
+        doc_lists = [response.get('response', {}).get('docs', []) for response in responses]
+
+        if sort_key is None:
+            documents = chain.from_iterable(doc_lists)
         else:
-            if solr_client not in self.client_name:
-                raise SDKException('IndexServers', '104', 'client name not found in this index server')
-            server_url = self.server_url[self.client_name.index(solr_client)]
-            solr_url = f"{server_url}/{solr_url}"
-        flag, response = self._cvpysdk_object.make_request("GET", solr_url)
-        if flag and response.json():
-            return response.json()
-        raise SDKException('IndexServers', '104', "Something went wrong while querying solr")
+            documents = merge(*doc_lists, key=sort_key)
+
+        result = {
+            'responseHeader': {
+                'status': 0,
+                'QTime': max(response.get('responseHeader', {}).get('QTime', 0)
+                             for response in responses)
+            },
+            'response': {
+                'numFound': sum(response.get('response', {}).get('numFound', 0)
+                                for response in responses),
+                'start': start,
+                'docs': list(islice(documents, start, start + rows))
+            }
+        }
+
+        facet_counts_list = [
+            response['facet_counts'] for response in responses if 'facet_counts' in response
+        ]
+
+        if facet_counts_list:
+            result['facet_counts'] = self._merge_facet_counts(facet_counts_list)
+
+        return result
 
     def get_index_node(self, node_name):
         """Returns an Index server node object for given node name
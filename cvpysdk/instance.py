@@ -152,6 +152,7 @@ from .subclient import Subclients
 from .constants import AppIDAType
 from .exception import SDKException
 from .schedules import SchedulePattern, Schedules
+from .lookup_table import LookupTable
 
 
 class Instances(object):
@@ -182,6 +183,7 @@ class Instances(object):
         self._general_properties = None
         self._instance_properties = None
         self._instances = None
+        self._instances_lookup = None
         self._vs_instance_type_dict = {}
         self.refresh()
 
@@ -276,13 +278,13 @@ class Instances(object):
 
         if value in self.all_instances:
             return self.all_instances[value]
-        else:
-            try:
-                return list(
-                    filter(lambda x: x[1]['id'] == value, self.all_instances.items())
-                )[0][0]
-            except IndexError:
-                raise IndexError('No instance exists with the given Name / Id')
+
+        instance_name = self._instances_lookup.get('id', value)
+
+        if instance_name is None:
+            raise IndexError('No instance exists with the given Name / Id')
+
+        return instance_name
 
     def _get_instances(self):
         """Gets all the instances associated to the agent specified by agent_object.
@@ -1624,6 +1626,7 @@ class Instances(object):
     def refresh(self):
         """Refresh the instances associated with the Agent of the selected Client."""
         self._instances = self._get_instances()
+        self._instances_lookup = LookupTable.from_dict(self._instances, 'id')
 
 
 class Instance(object):
@@ -2868,4 +2871,9 @@ class Instance(object):
 
         self._get_instance_properties()
         self.backupsets = Backupsets(self)
+
+        if self.subclients is not None:
+            # fetch the subclients created / deleted outside of the SDK since the last refresh
+            self.subclients.refresh()
+
         self.subclients = Subclients(self)
@@ -35,8 +35,8 @@ SQLServerInstance:
 
     _get_sql_restore_options()      --  returns the dict containing destination sql server names
 
-    _run_backup()                   --  runs full backup for this subclients and appends the
-                                            job object to the return list
+    _run_backup()                   --  runs full backup for this subclients and returns the
+                                            job object
 
     _process_browse_request()       --  processes response received for Browse request
 
@@ -74,12 +74,12 @@ from __future__ import unicode_literals
 import re
 import time
 import datetime
-import threading
 from base64 import b64encode
 
 from ..instance import Instance
 from ..exception import SDKException
 from ..job import Job
+from ..job_submitter import JobSubmitter
 from ..constants import SQLDefines
 
 
@@ -371,22 +371,19 @@ class SQLServerInstance(Instance):
             raise SDKException('Response', '101', response_string)
         return response.json()
 
-    def _run_backup(self, subclient_name, return_list):
-        """Triggers full backup job for the given subclient, and appends its Job object to list
-            The SDKExcpetion class instance is appended to the list,
-            if any exception is raised while running the backup job for the Subclient.
+    def _run_backup(self, subclient_name):
+        """Triggers full backup job for the given subclient, and returns its Job object.
+
+            The subclient is initialized from the properties already fetched with the list of
+            subclients, instead of requesting them again.
 
             Args:
                 subclient_name (str):  Name of the subclient to trigger the backup for
 
-                return_list (list):  List to append the job object to
+            Returns:
+                object - instance of the Job class for the full backup job
         """
-        try:
-            job = self.subclients.get(subclient_name).backup('Full')
-            if job:
-                return_list.append(job)
-        except SDKException as excp:
-            return_list.append(excp)
+        return self.subclients._get_prefetched(subclient_name).backup('Full')
 
     def _process_browse_request(self, browse_request, get_full_details=False):
         """Runs the SQL Instance Browse API with the request JSON provided for the operation
@@ -443,28 +440,62 @@ class SQLServerInstance(Instance):
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
 
-    def backup(self):
+    def backup(self, submitter=None, max_workers=None, rate=None):
         """Run full backup job for all subclients in this instance.
 
+            The backup jobs are submitted over a bounded pool of worker threads,
+            throttled by the submission rate of the submitter.
+
+            Args:
+                submitter (object):  instance of the JobSubmitter class, to submit the jobs with
+
+                    default: None, the jobs are submitted on the worker threads of this call,
+                    bounded by the max workers, and throttled by the rate
+
+                max_workers (int):  maximum number of jobs to submit concurrently,
+                if no submitter is given
+
+                    default: None, JobSubmitter.DEFAULT_MAX_WORKERS
+
+                rate (float):  maximum number of jobs to submit per second,
+                if no submitter is given
+
+                    default: None, JobSubmitter.DEFAULT_RATE
+
             Returns:
                 list - list containing the job objects for the full backup jobs started for
                            the subclients in the backupset
         """
+        subclient_names = list(self.subclients._subclients or {})
         return_list = []
-        thread_list = []
 
-        all_subclients = self.subclients._subclients
+        if not subclient_names:
+            return return_list
 
-        if all_subclients:
-            for subclient in all_subclients:
-                thread = threading.Thread(
-                    target=self._run_backup, args=(subclient, return_list)
-                )
-                thread_list.append(thread)
-                thread.start()
+        own_submitter = submitter is None
+
+        if own_submitter:
+            max_workers = max_workers or JobSubmitter.DEFAULT_MAX_WORKERS
+            submitter = JobSubmitter(
+                max_workers=min(len(subclient_names), max_workers),
+                rate=rate or JobSubmitter.DEFAULT_RATE
+            )
 
-        for thread in thread_list:
-            thread.join()
+        try:
+            futures = [
+                submitter.submit(self._run_backup, subclient) for subclient in subclient_names
+            ]
+        finally:
+            if own_submitter:
+                submitter.shutdown(wait=False)
+
+        for future in futures:
+            try:
+                job = future.result()
+                if job:
+                    return_list.append(job)
+            except SDKException as excp:
+                return_list.append(excp)
 
         return return_list
 
@@ -0,0 +1,485 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for instrumenting the REST API requests made by the SDK.
+
+All the requests made by the SDK go through **CVPySDK.make_request**, which notifies the
+request hooks registered with it, before and after every request, on every retry, and on every
+renewal of the login token.
+
+RequestHook is the interface of the hooks, and StatsCollector is the built-in hook, which
+aggregates the number of requests, bytes transferred, and the latency histogram for each
+service in the SERVICES_DICT_TEMPLATE, and exports them as a dict, or in the text format of
+Prometheus.
+
+Usage:
+
+    >>> with commcell.collect_stats() as stats:
+    ...     job = subclient.backup()
+
+    >>> stats.stats['SUBCLIENT']['count']
+    2
+
+    >>> print(stats.to_prometheus())
+
+
+RequestHook:    Interface for the hooks notified of the requests made by the SDK
+
+StatsCollector: Hook aggregating the request metrics for each service
+
+get_service_name(): returns the key of the service in the SERVICES_DICT_TEMPLATE, for the URL
+
+
+RequestHook:
+============
+
+    before_request()            --  called before the request is sent
+
+    after_request()             --  called after the response is received, or the request failed
+
+    on_retry()                  --  called before the request is sent again
+
+    on_token_renew()            --  called after the login token is renewed
+
+
+StatsCollector:
+===============
+
+    __init__(buckets, commcell_object)  --  initialize the instance of the StatsCollector class
+
+    __enter__()                 --  registers the collector with the commcell
+
+    __exit__()                  --  unregisters the collector from the commcell
+
+    _get_service_stats()        --  returns the metrics of the service, adding them if missing
+
+    after_request()             --  aggregates the metrics of the request
+
+    on_retry()                  --  counts the retry of the request
+
+    on_token_renew()            --  counts the renewal of the login token
+
+    reset()                     --  resets all the metrics collected
+
+    to_prometheus()             --  returns the metrics in the Prometheus text exposition format
+
+StatsCollector Attributes
+-------------------------
+
+    **stats**                   --  returns the metrics collected for each service, as a dict
+
+    **retries**                 --  returns the number of requests retried
+
+    **token_renewals**          --  returns the number of times the login token was renewed
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import copy
+import re
+import threading
+
+from .services import SERVICES_DICT_TEMPLATE
+from .metadata_cache import _service_pattern
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+"""tuple:   Upper bounds of the latency histogram buckets, in seconds."""
+
+_SERVICE_PATTERNS = None
+_SERVICE_NAMES = {}
+_SERVICE_NAMES_MAX_SIZE = 4096
+_SERVICES_LOCK = threading.Lock()
+
+
+def get_service_name(url):
+    """Returns the key of the service in the SERVICES_DICT_TEMPLATE, the URL was built from.
+
+        The most specific service template matching the URL is picked. If no template matches,
+        the path of the URL is returned, with the ids in it replaced by **%s**.
+
+        Args:
+            url     (str)   --  URL of the request
+
+        Returns:
+            str     -   key of the service, or the path of the URL
+
+    """
+    global _SERVICE_PATTERNS
+
+    service_name = _SERVICE_NAMES.get(url)
+
+    if service_name is not None:
+        return service_name
+
+    with _SERVICES_LOCK:
+        if _SERVICE_PATTERNS is None:
+            # match the longest template first, as it is the most specific one
+            services = sorted(
+                SERVICES_DICT_TEMPLATE, key=lambda key: (-len(SERVICES_DICT_TEMPLATE[key]), key)
+            )
+            _SERVICE_PATTERNS = [(service, _service_pattern(service)) for service in services]
+
+    for service, pattern in _SERVICE_PATTERNS:
+        if pattern.search(url):
+            service_name = service
+            break
+    else:
+        path = url.split('?')[0].split('/api/')[-1]
+        service_name = re.sub(r'(?<=/)\d+(?=/|$)', '%s', path)
+
+    if len(_SERVICE_NAMES) >= _SERVICE_NAMES_MAX_SIZE:
+        _SERVICE_NAMES.clear()
+
+    _SERVICE_NAMES[url] = service_name
+    return service_name
+
+
+class RequestHook(object):
+    """Interface for the hooks notified of the REST API requests made by the SDK.
+
+        All the methods do nothing by default, and the hooks override the ones they need.
+        The hooks are called on the thread making the request, and hence must be thread-safe.
+    """
+
+    def before_request(self, method, url):
+        """Called before the request is sent to the server.
+
+            Args:
+                method  (str)   --  HTTP method of the request
+
+                url     (str)   --  URL of the request
+
+        """
+        pass
+
+    def after_request(self, method, url, response, elapsed, exception=None):
+        """Called after the response is received from the server, or the request failed.
+
+            Args:
+                method      (str)       --  HTTP method of the request
+
+                url         (str)       --  URL of the request
+
+                response    (object)    --  instance of the requests.Response class,
+                None if the request failed
+
+                elapsed     (float)     --  seconds taken by the request
+
+                exception   (object)    --  exception raised by the request, if it failed
+
+                    default: None
+
+        """
+        pass
+
+    def on_retry(self, method, url, attempt):
+        """Called before the request is sent to the server again.
+
+            Args:
+                method  (str)   --  HTTP method of the request
+
+                url     (str)   --  URL of the request
+
+                attempt (int)   --  number of the retry
+
+        """
+        pass
+
+    def on_token_renew(self, elapsed):
+        """Called after the login token is renewed, as the server rejected the current one.
+
+            Args:
+                elapsed (float) --  seconds taken to renew the token
+
+        """
+        pass
+
+
+class StatsCollector(RequestHook):
+    """Hook aggregating the count, bytes, and the latency histogram of the requests, for each
+        service in the SERVICES_DICT_TEMPLATE.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, commcell_object=None):
+        """Initialize the instance of the StatsCollector class.
+
+            Args:
+                buckets         (tuple)     --  upper bounds of the latency histogram buckets,
+                in seconds
+
+                    default: DEFAULT_BUCKETS
+
+                commcell_object (object)    --  instance of the Commcell class, to register the
+                collector with, when used as a context manager
+
+                    default: None
+
+            Returns:
+                object  -   instance of the StatsCollector class
+
+        """
+        self._buckets = tuple(sorted(buckets))
+        self._commcell_object = commcell_object
+
+        self._stats = {}
+        self._retries = 0
+        self._token_renewals = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """Registers the collector with the commcell, and returns the current instance.
+
+            Returns:
+                object  -   the initialized instance referred by self
+
+        """
+        self._commcell_object._cvpysdk_object.add_hook(self)
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        """Unregisters the collector from the commcell."""
+        self._commcell_object._cvpysdk_object.remove_hook(self)
+
+    def _get_service_stats(self, service):
+        """Returns the metrics of the service, adding them if not collected yet.
+
+            Args:
+                service     (str)   --  key of the service in the SERVICES_DICT_TEMPLATE
+
+            Returns:
+                dict    -   metrics of the service
+
+        """
+        if service not in self._stats:
+            self._stats[service] = {
+                'count': 0,
+                'errors': 0,
+                'bytes_sent': 0,
+                'bytes_received': 0,
+                'latency_sum': 0.0,
+                'latency_max': 0.0,
+                'buckets': [0] * len(self._buckets)
+            }
+
+        return self._stats[service]
+
+    def after_request(self, method, url, response, elapsed, exception=None):
+        """Aggregates the metrics of the request, under its service.
+
+            Args:
+                method      (str)       --  HTTP method of the request
+
+                url         (str)       --  URL of the request
+
+                response    (object)    --  instance of the requests.Response class,
+                None if the request failed
+
+                elapsed     (float)     --  seconds taken by the request
+
+                exception   (object)    --  exception raised by the request, if it failed
+
+                    default: None
+
+        """
+        bytes_sent = bytes_received = 0
+
+        if response is not None:
+            body = response.request.body if response.request is not None else None
+            bytes_sent = len(body) if body is not None and hasattr(body, '__len__') else 0
+
+            # do not read the body of a streamed response, the caller is yet to consume it
+            content_length = response.headers.get('Content-Length')
+
+            if content_length is not None:
+                bytes_received = int(content_length)
+            elif response._content_consumed:
+                bytes_received = len(response.content or b'')
+
+        service = get_service_name(url)
+
+        with self._lock:
+            stats = self._get_service_stats(service)
+            stats['count'] += 1
+            stats['bytes_sent'] += bytes_sent
+            stats['bytes_received'] += bytes_received
+            stats['latency_sum'] += elapsed
+            stats['latency_max'] = max(stats['latency_max'], elapsed)
+
+            if exception is not None or response is None or not response.ok:
+                stats['errors'] += 1
+
+            for index, bound in enumerate(self._buckets):
+                if elapsed <= bound:
+                    stats['buckets'][index] += 1
+                    break
+
+    def on_retry(self, method, url, attempt):
+        """Counts the retry of the request.
+
+            Args:
+                method  (str)   --  HTTP method of the request
+
+                url     (str)   --  URL of the request
+
+                attempt (int)   --  number of the retry
+
+        """
+        with self._lock:
+            self._retries += 1
+
+    def on_token_renew(self, elapsed):
+        """Counts the renewal of the login token.
+
+            Args:
+                elapsed (float) --  seconds taken to renew the token
+
+        """
+        with self._lock:
+            self._token_renewals += 1
+
+    def reset(self):
+        """Resets all the metrics collected so far."""
+        with self._lock:
+            self._stats = {}
+            self._retries = 0
+            self._token_renewals = 0
+
+    def to_prometheus(self, prefix='cvpysdk'):
+        """Returns the metrics collected in the Prometheus text exposition format.
+
+            Args:
+                prefix  (str)   --  prefix for the names of the metrics
+
+                    default: cvpysdk
+
+            Returns:
+                str     -   metrics in the Prometheus text format
+
+        """
+        stats = self.stats
+        lines = []
+
+        def add_metric(name, metric_type, help_text, key):
+            lines.append('# HELP {0}_{1} {2}'.format(prefix, name, help_text))
+            lines.append('# TYPE {0}_{1} {2}'.format(prefix, name, metric_type))
+
+            for service in sorted(stats):
+                lines.append('{0}_{1}{{service="{2}"}} {3}'.format(
+                    prefix, name, service, stats[service][key]
+                ))
+
+        add_metric('requests_total', 'counter', 'Number of REST API requests made.', 'count')
+        add_metric(
+            'request_errors_total', 'counter', 'Number of REST API requests failed.', 'errors'
+        )
+        add_metric('request_bytes_total', 'counter', 'Bytes sent in the requests.', 'bytes_sent')
+        add_metric(
+            'response_bytes_total', 'counter', 'Bytes received in the responses.', 'bytes_received'
+        )
+
+        name = '{0}_request_duration_seconds'.format(prefix)
+        lines.append('# HELP {0} Latency of the REST API requests.'.format(name))
+        lines.append('# TYPE {0} histogram'.format(name))
+
+        for service in sorted(stats):
+            buckets = stats[service]['buckets']
+            cumulative = 0
+
+            # the buckets hold the count of each bucket, the exposition format is cumulative
+            for bound in self._buckets:
+                cumulative += buckets[bound]
+                lines.append('{0}_bucket{{service="{1}",le="{2}"}} {3}'.format(
+                    name, service, bound, cumulative
+                ))
+
+            lines.append('{0}_bucket{{service="{1}",le="+Inf"}} {2}'.format(
+                name, service, stats[service]['count']
+            ))
+            lines.append('{0}_sum{{service="{1}"}} {2}'.format(
+                name, service, stats[service]['latency_sum']
+            ))
+            lines.append('{0}_count{{service="{1}"}} {2}'.format(
+                name, service, stats[service]['count']
+            ))
+
+        lines.append('# HELP {0}_retries_total Number of REST API requests retried.'.format(prefix))
+        lines.append('# TYPE {0}_retries_total counter'.format(prefix))
+        lines.append('{0}_retries_total {1}'.format(prefix, self.retries))
+
+        lines.append(
+            '# HELP {0}_token_renewals_total Number of login token renewals.'.format(prefix)
+        )
+        lines.append('# TYPE {0}_token_renewals_total counter'.format(prefix))
+        lines.append('{0}_token_renewals_total {1}'.format(prefix, self.token_renewals))
+
+        return '\n'.join(lines) + '\n'
+
+    @property
+    def stats(self):
+        """Returns a copy of the metrics collected for each service.
+
+            dict    -   metrics for each service
+
+                {
+                    "CLIENT": {
+                        "count": 2,
+
+                        "errors": 0,
+
+                        "bytes_sent": 0,
+
+                        "bytes_received": 10240,
+
+                        "latency_sum": 0.42,
+
+                        "latency_max": 0.25,
+
+                        "buckets": {
+                            0.005: 0,
+
+                            ...
+
+                            "+Inf": 0
+                        }
+                    }
+                }
+
+        """
+        with self._lock:
+            stats = copy.deepcopy(self._stats)
+
+        for service_stats in stats.values():
+            counts = service_stats['buckets']
+            buckets = dict(zip(self._buckets, counts))
+            buckets['+Inf'] = service_stats['count'] - sum(counts)
+            service_stats['buckets'] = buckets
+
+        return stats
+
+    @property
+    def retries(self):
+        """Returns the number of the requests retried."""
+        return self._retries
+
+    @property
+    def token_renewals(self):
+        """Returns the number of times the login token was renewed."""
+        return self._token_renewals
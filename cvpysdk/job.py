@@ -25,6 +25,14 @@ JobManagement:  Class for performing Job Management operations
 
 Job:            Class for keeping track of a job and perform various operations on it.
 
+JobHandle:      Class for a lightweight, read-only handle to a job, built from its summary.
+
+JobWatcher:     Class for tracking the status of multiple jobs via a single poll loop.
+
+is_job_finished()       --  checks whether a job with the given status has finished
+
+get_job_summary()       --  gets the summary of the job with the given id via the GET Job API
+
 
 JobController
 =============
@@ -38,6 +46,10 @@ JobController
     __repr__()                  --  returns the string representation of the object of this class,
     with the commcell it is associated with
 
+    _parse_job_summary()        --  parses the summary of a job received in the jobs response
+
+    _get_jobs_page()            --  executes the request, and returns a single page of the jobs
+
     _get_jobs_list()            --  executes the request, and parses and returns the jobs response
 
     _get_jobs_request_json(**options)
@@ -53,7 +65,15 @@ JobController
 
     finished_jobs()             --  retutns the dict of finished jobs and their details
 
-    get()                       --  returns the Job class instance for the given job id
+    iter_jobs()                 --  generator to walk through the jobs one page at a time
+
+    get()                       --  returns the Job / JobHandle class instance for the given job id
+
+    _run_job_action()           --  posts the suspend / resume / kill action for a single job id,
+    and returns its result
+
+    bulk_action()               --  suspends / resumes / kills the given jobs concurrently,
+    and returns the result for each job
 
     kill_all_jobs()             -- Kills all jobs on the commcell
 
@@ -263,6 +283,85 @@ Job instance Attributes
 
 **job.state**                       -- returns the current state of the job.
 
+JobHandle
+=========
+
+    __init__()                  --  initializes the instance of JobHandle class for the job with
+    id: 'job_id', from its job summary, without any request to the commcell
+
+    __repr__()                  --  returns the string representation of the object of this class,
+    with the job id it is associated with
+
+    _get_job_summary()          --  gets the summary of the job
+
+    _get_job_details()          --  gets the details of the job
+
+    _get_events()               --  gets the commserv events of the job
+
+    _get()                      --  returns the value of the key from the job summary
+
+    refresh()                   --  refresh the summary of the job
+
+    to_job()                    --  returns the Job class instance for the job
+
+JobHandle instance Attributes
+-----------------------------
+
+**job_id**, **summary**, **status**, **is_finished**, **job_type**, **operation**,
+**percent_complete**, **backup_level**, **pending_reason**, **phase**, **client_name**,
+**agent_name**, **instance_name**, **backupset_name**, **subclient_name**,
+**start_timestamp**, **end_timestamp**, **start_time**, **end_time**
+                                    --  values from the job summary, no request is made to
+                                        the commcell, unless the summary was not given
+
+**details**                         --  returns the full details of the job, fetched on first access
+
+**events**                          --  returns the commserv events of the job, fetched on
+                                        first access
+
+JobWatcher
+==========
+
+    __init__()                  --  initializes the instance of JobWatcher class to track the
+    status of multiple jobs of the commcell
+
+    __repr__()                  --  returns the string representation of the object of this class,
+    with the commcell it is associated with
+
+    __enter__()                 --  starts the poll loop in background, using the "with" context
+    manager
+
+    __exit__()                  --  stops the poll loop running in background
+
+    _get_jobs_summary()         --  gets the summary of all the given jobs via a single jobs query
+
+    _get_job_details()          --  gets the details of the given job
+
+    _notify()                   --  calls the callbacks of the job, with its new status
+
+    _fail_jobs()                --  fails the futures of all the jobs being tracked
+
+    watch()                     --  adds the job to the list of jobs to be tracked, and returns
+    the future for the final status of the job
+
+    unwatch()                   --  removes the job from the list of jobs to be tracked
+
+    poll()                      --  fetches the status of all the tracked jobs, and notifies
+    the status changes
+
+    start()                     --  starts the poll loop in a background thread
+
+    stop()                      --  stops the poll loop running in background
+
+    wait()                      --  waits till the given jobs have finished
+
+JobWatcher instance Attributes
+------------------------------
+
+**jobs**                            --  returns the last known status of all the tracked jobs
+
+**last_error**                      --  returns the last error raised by a poll or a callback
+
 ErrorRule
 =========
 
@@ -283,14 +382,81 @@ from __future__ import unicode_literals
 
 import time
 import copy
+import threading
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.exceptions import RequestException
 
 from .exception import SDKException
 from .constants import AdvancedJobDetailType, ApplicationGroup
 
 
+def is_job_finished(status):
+    """Checks whether a job with the given status has finished or not.
+
+        Args:
+            status  (str)   --  status of the job
+
+        Returns:
+            bool    -   boolean that represents whether the job has finished or not
+
+    """
+    status = (status or '').lower()
+
+    return ('completed' in status or
+            'killed' in status or
+            'committed' in status or
+            'failed' in status)
+
+
+def get_job_summary(commcell_object, job_id):
+    """Gets the summary of the job with the given id, via the GET Job API.
+
+        Args:
+            commcell_object     (object)        --  instance of the Commcell class
+
+            job_id              (str / int)     --  id of the job
+
+        Returns:
+            dict    -   summary of the job, as returned in the **jobSummary** of the response
+
+            None    -   if no record was found for the job
+
+        Raises:
+            SDKException:
+                if response is empty
+
+                if response is not success
+
+    """
+    flag, response = commcell_object._cvpysdk_object.make_request(
+        'GET', commcell_object._services['JOB'] % job_id
+    )
+
+    if not flag:
+        raise SDKException('Response', '101', commcell_object._update_response_(response.text))
+
+    if not response.json():
+        raise SDKException('Response', '102')
+
+    for job in response.json().get('jobs', []):
+        if 'jobSummary' in job:
+            return job['jobSummary']
+
+    return None
+
+
 class JobController(object):
     """Class for controlling all the jobs associated with the commcell."""
 
+    _BULK_ACTIONS = {
+        'suspend': 'SUSPEND_JOB',
+        'resume': 'RESUME_JOB',
+        'kill': 'KILL_JOB'
+    }
+
     def __init__(self, commcell_object):
         """Initialize instance of the JobController class to get the details of Commcell Jobs.
 
@@ -365,6 +531,11 @@ class JobController(object):
 
                             default: 20
 
+                    offset          (int)   --  number of jobs to skip, before the jobs list
+                    that is to be returned
+
+                            default: 0
+
                     lookup_time     (int)   --  list of jobs to be retrieved which are specified
                     hours older
 
@@ -383,6 +554,10 @@ class JobController(object):
 
                             default: []
 
+                    job_id_list     (list)  --  list of ids of the jobs to return
+
+                            default: [], all the jobs
+
             Returns:
                 dict    -   request json that is to be sent to server
 
@@ -410,7 +585,7 @@ class JobController(object):
             "category": job_list_category[options.get('category', 'ALL')],
             "pagingConfig": {
                 "sortDirection": 1,
-                "offset": 0,
+                "offset": options.get('offset', 0),
                 "sortField": "jobId",
                 "limit": options.get('limit', 20)
             },
@@ -424,16 +599,80 @@ class JobController(object):
             }
         }
 
+        if options.get('job_id_list'):
+            request_json['jobFilter']['jobIdList'] = [
+                int(job_id) for job_id in options['job_id_list']
+            ]
+
         return request_json
 
-    def _get_jobs_list(self, **options):
-        """Executes a request on the server to get the list of jobs.
+    def _parse_job_summary(self, job_summary, summary_type=''):
+        """Parses the job summary received in the jobs response.
 
             Args:
-                request_json    (dict)  --  request that is to be sent to server
+                job_summary     (dict)  --  the **jobSummary** of the job in the jobs response
+
+                summary_type    (str)   --  type of the summary to return
+
+                    accepted values: ['basic', 'full', 'handle']
+
+                    default: basic
 
             Returns:
-                dict    -   dict containing details about all the retrieved jobs
+                dict    -   basic / full summary of the job
+
+                object  -   JobHandle class instance for the job, if summary type is handle
+
+        """
+        if summary_type.lower() == 'full':
+            return job_summary
+
+        if summary_type.lower() == 'handle':
+            return JobHandle(self._commcell_object, job_summary['jobId'], job_summary)
+
+        status = job_summary['status']
+        operation = job_summary['localizedOperationName']
+        percent_complete = job_summary['percentComplete']
+        backup_level = job_summary.get('backupLevelName')
+
+        app_type = ''
+        job_type = ''
+        pending_reason = ''
+        subclient_id = ''
+
+        if 'appTypeName' in job_summary:
+            app_type = job_summary['appTypeName']
+
+        if 'jobType' in job_summary:
+            job_type = job_summary['jobType']
+
+        if 'pendingReason' in job_summary:
+            pending_reason = job_summary['pendingReason']
+
+        if 'subclient' in job_summary:
+            job_subclient = job_summary['subclient']
+            if 'subclientId' in job_subclient:
+                subclient_id = job_subclient['subclientId']
+
+        return {
+            'operation': operation,
+            'status': status,
+            'app_type': app_type,
+            'job_type': job_type,
+            'percent_complete': percent_complete,
+            'pending_reason': pending_reason,
+            'subclient_id': subclient_id,
+            'backup_level': backup_level
+        }
+
+    def _get_jobs_page(self, **options):
+        """Executes a request on the server to get a single page of the list of jobs.
+
+            Args:
+                options     (dict)  --  dict of key-word arguments for the jobs request json
+
+            Returns:
+                list    -   list of the jobs in the page, as received in the response
 
             Raises:
                 SDKException:
@@ -448,60 +687,10 @@ class JobController(object):
             'POST', self._services['ALL_JOBS'], request_json
         )
 
-        jobs_dict = {}
-
         if flag:
             try:
                 if response.json():
-                    if 'jobs' in response.json():
-                        all_jobs = response.json()['jobs']
-
-                        for job in all_jobs:
-                            if 'jobSummary' in job and job['jobSummary']['isVisible'] is True:
-
-                                job_summary = job['jobSummary']
-                                job_id = job_summary['jobId']
-
-                                if options.get('job_summary', '').lower() == 'full':
-                                    jobs_dict[job_id] = job_summary
-                                else:
-                                    status = job_summary['status']
-                                    operation = job_summary['localizedOperationName']
-                                    percent_complete = job_summary['percentComplete']
-                                    backup_level = job_summary.get('backupLevelName')
-
-                                    app_type = ''
-                                    job_type = ''
-                                    pending_reason = ''
-                                    subclient_id = ''
-
-                                    if 'appTypeName' in job_summary:
-                                        app_type = job_summary['appTypeName']
-
-                                    if 'jobType' in job_summary:
-                                        job_type = job_summary['jobType']
-
-                                    if 'pendingReason' in job_summary:
-                                        pending_reason = job_summary['pendingReason']
-
-                                    if 'subclient' in job_summary:
-                                        job_subclient = job_summary['subclient']
-                                        if 'subclientId' in job_subclient:
-                                            subclient_id = job_subclient['subclientId']
-
-                                    jobs_dict[job_id] = {
-                                        'operation': operation,
-                                        'status': status,
-                                        'app_type': app_type,
-                                        'job_type': job_type,
-                                        'percent_complete': percent_complete,
-                                        'pending_reason': pending_reason,
-                                        'subclient_id': subclient_id,
-                                        'backup_level': backup_level
-                                    }
-
-                    return jobs_dict
-
+                    return response.json().get('jobs', [])
                 else:
                     raise SDKException('Response', '102')
 
@@ -511,6 +700,33 @@ class JobController(object):
             response_string = self._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
 
+    def _get_jobs_list(self, **options):
+        """Executes a request on the server to get the list of jobs.
+
+            Args:
+                request_json    (dict)  --  request that is to be sent to server
+
+            Returns:
+                dict    -   dict containing details about all the retrieved jobs
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+
+        """
+        jobs_dict = {}
+
+        for job in self._get_jobs_page(**options):
+            if 'jobSummary' in job and job['jobSummary']['isVisible'] is True:
+                job_summary = job['jobSummary']
+                jobs_dict[job_summary['jobId']] = self._parse_job_summary(
+                    job_summary, options.get('job_summary', '')
+                )
+
+        return jobs_dict
+
     def _modify_all_jobs(self, operation_type=None):
         """ Executes a request on the server to suspend/resume/kill all the jobs on the commserver
 
@@ -629,11 +845,12 @@ class JobController(object):
 
                         default: []
 
-                    job_summary     (str)   --  To return the basic job summary or full job summary
+                    job_summary     (str)   --  To return the basic job summary, full job summary,
+                    or the JobHandle class instance for each job
 
                         default: basic
 
-                        accepted values: ['basic', 'full']
+                        accepted values: ['basic', 'full', 'handle']
 
             Returns:
                 dict    -   dictionary consisting of the job IDs matching the given criteria
@@ -712,11 +929,12 @@ class JobController(object):
 
                         default: []
 
-                    job_summary     (str)   --  To return the basic job summary or full job summary
+                    job_summary     (str)   --  To return the basic job summary, full job summary,
+                    or the JobHandle class instance for each job
 
                         default: basic
 
-                        accepted values: ['basic', 'full']
+                        accepted values: ['basic', 'full', 'handle']
 
             Returns:
                 dict    -   dictionary consisting of the job IDs matching the given criteria
@@ -796,11 +1014,12 @@ class JobController(object):
 
                         default: []
 
-                    job_summary     (str)   --  To return the basic job summary or full job summary
+                    job_summary     (str)   --  To return the basic job summary, full job summary,
+                    or the JobHandle class instance for each job
 
                         default: basic
 
-                        accepted values: ['basic', 'full']
+                        accepted values: ['basic', 'full', 'handle']
 
             Returns:
                 dict    -   dictionary consisting of the job IDs matching the given criteria
@@ -822,131 +1041,391 @@ class JobController(object):
 
         return self._get_jobs_list(**options)
 
-    def suspend_all_jobs(self):
-        """ Suspends all the jobs on the commserver """
-        self._modify_all_jobs('suspend')
+    def iter_jobs(
+            self,
+            client_name=None,
+            lookup_time=5,
+            job_filter=None,
+            page_size=100,
+            prefetch=True,
+            **options):
+        """Generator to walk through all the jobs of the Commcell within the number of hours
+            specified in lookup time value, one page at a time.
 
-    def resume_all_jobs(self):
-        """ Resumes all the jobs on the commserver """
-        self._modify_all_jobs('resume')
+            Only a page of jobs is held in memory (two, if prefetch is enabled), irrespective
+            of the total number of jobs matching the criteria.
 
-    def kill_all_jobs(self):
-        """ Kills all the jobs on the commserver """
-        self._modify_all_jobs('kill')
+            Args:
+                client_name     (str)   --  name of the client to filter out the jobs for
 
-    def get(self, job_id):
-        """Returns the job object for the given job id.
+                    default: None, get all the jobs
 
-            Args:
-                job_id  (int)   --  id of the job to create Job class instance for
 
-            Returns:
-                object  -   Job class object for the given job id
+                lookup_time     (int)   --  get all the jobs executed within the number of hours
 
-            Raises:
-                SDKException:
-                    if no job with specified job id exists
+                    default: 5 Hours
 
-        """
-        return Job(self._commcell_object, job_id)
 
+                job_filter      (str)   --  type of jobs to filter
 
-class JobManagement(object):
-    """Class for performing job management operations. """
+                        for multiple filters, give the values **comma(,)** separated
 
-    def __init__(self, commcell_object):
-        """
-        Initialize instance of JobManagement class for performing operations on jon management settings.
+                    default: None
 
-            Args:
-                commcell_object         (object)        --  instance of Commcell class.
 
-            Returns:
-                None
+                page_size       (int)   --  number of jobs to fetch in a single request
 
-        """
-        self._comcell = commcell_object
-        self._service = commcell_object._services.get('JOB_MANAGEMENT_SETTINGS')
-        self._cvpysdk_object = commcell_object._cvpysdk_object
-        self._error_rules = None
-        self.refresh()
+                    default: 100
 
-    @property
-    def error_rules(self):
-        if not  self._error_rules:
-            self._error_rules = _ErrorRule(self._comcell)
-        return self._error_rules
 
-    def _set_jobmanagement_settings(self):
-        """
-        Executes a request on the server, to set the job management settings.
+                prefetch        (bool)  --  boolean specifying whether to fetch the next page
+                in a background thread, while the current page is being consumed
 
-         Returns:
-               None
+                    default: True
 
-         Raises:
-              SDKException:
-                    if given inputs are invalid
+                options         (dict)  --  dict of key-word arguments
 
-        """
+                Available Options:
 
-        flag, response = self._cvpysdk_object.make_request(method='POST', url=self._service,
-                                                           payload=self._settings_dict)
-        if flag:
-            if response and response.json():
-                if response.json().get('errorCode', 0) != 0:
-                    raise SDKException('Job', '102', 'Failed to set job management properties. \nError: {0}'.format(
-                        response.json().get('errorMessage', '')))
-                self.refresh()
-        else:
-            raise SDKException('Response', '101', response.json()["errorMessage"])
+                    category        (str)   --  category of the jobs to return
 
-    def _get_jobmanagement_settings(self):
-        """
-         Executes a request on the server to get the settings of job management.
+                        default: ALL
 
-            Returns:
-                None
+                        accepted values: ['ALL', 'ACTIVE', 'FINISHED']
+
+                    offset          (int)   --  number of jobs to skip, before the first page
+
+                        default: 0
+
+                    show_aged_job   (bool)  --  boolean specifying whether to include aged jobs in
+                    the result or not
+
+                        default: False
+
+                    clients_list    (list)  --  list of clients to return the jobs for
+
+                        default: []
+
+                    job_type_list   (list)  --  list of job operation types
+
+                        default: []
+
+                    job_summary     (str)   --  To return the basic job summary, full job summary,
+                    or the JobHandle class instance for each job
+
+                        default: basic
+
+                        accepted values: ['basic', 'full', 'handle']
+
+            Yields:
+                tuple   -   (job id, details of the job) for each job matching the given criteria
 
             Raises:
-                SDKException
+                SDKException:
+                    if page size is not a positive integer
+
+                    if client name is given, and no client exists with the given name
+
                     if response is empty
 
                     if response is not success
-        """
-        flag, response = self._cvpysdk_object.make_request(method='GET', url=self._service)
-        if flag:
-            if response and response.json():
-                self._settings_dict = response.json()
-                if self._settings_dict.get('errorCode', 0) != 0:
-                    raise SDKException('Job', '102', 'Failed to get job management properties. \nError: {0}'.format(
-                        self._settings_dict.get('errorMessage', '')))
-                if 'jobManagementSettings' in self._settings_dict:
-                    self._restart_settings = {'jobRestartSettings': self._settings_dict.get(
-                        'jobManagementSettings').get('jobRestartSettings', {})}
-                    self._priority_settings = {'jobPrioritySettings': self._settings_dict.get(
-                        'jobManagementSettings').get('jobPrioritySettings', {})}
-                    self._general_settings = {'generalSettings': self._settings_dict.get(
-                        'jobManagementSettings').get('generalSettings', {})}
-                    self._update_settings = {'jobUpdatesSettings': self._settings_dict.get(
-                        'jobManagementSettings').get('jobUpdatesSettings', {})}
-                else:
-                    raise SDKException('Response', '102')
-            else:
-                raise SDKException('Response', '102')
-        else:
-            response_string = self._comcell._update_response_(response.text)
-            raise SDKException('Response', '101', response_string)
 
-    def refresh(self):
-        """
-        calls the private method _get_jobmanagement_settings()
         """
-        self._restart_settings = None
-        self._general_settings = None
-        self._update_settings = None
-        self._priority_settings = None
-        self._get_jobmanagement_settings()
+        if not isinstance(page_size, int) or page_size < 1:
+            raise SDKException('Job', '108')
+
+        options.setdefault('category', 'ALL')
+        options['lookup_time'] = lookup_time
+        options['limit'] = page_size
+
+        # the pages are fetched from the offset given, instead of the first job
+        offset = options.pop('offset', 0)
+
+        if job_filter:
+            options['job_type_list'] = options.get('job_type_list', []) + job_filter.split(',')
+
+        if client_name:
+            options['clients_list'] = options.get('clients_list', []) + [client_name]
+
+        def _get_page(offset):
+            return self._get_jobs_page(offset=offset, **options)
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+        try:
+            page = _get_page(offset)
+
+            while page:
+                offset += page_size
+                next_page = None
+
+                # a page shorter than the page size is the last page
+                if executor is not None and len(page) == page_size:
+                    next_page = executor.submit(_get_page, offset)
+
+                for job in page:
+                    if 'jobSummary' in job and job['jobSummary']['isVisible'] is True:
+                        job_summary = job['jobSummary']
+                        yield job_summary['jobId'], self._parse_job_summary(
+                            job_summary, options.get('job_summary', '')
+                        )
+
+                if len(page) < page_size:
+                    break
+
+                page = next_page.result() if next_page is not None else _get_page(offset)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def _run_job_action(self, job_id, action):
+        """Posts the action for the job with the given id, without getting its details.
+
+            Args:
+                job_id  (str)   --  id of the job to run the action for
+
+                action  (str)   --  action to run for the job
+
+                    Valid values are:
+
+                        -   suspend
+
+                        -   resume
+
+                        -   kill
+
+            Returns:
+                tuple   -   (True, None), if the action was run successfully
+
+                    (False, error message), if the action failed for the job, or the response
+                    received is not valid
+
+        """
+        service = self._BULK_ACTIONS[action]
+
+        try:
+            flag, response = self._cvpysdk_object.make_request(
+                'POST', self._services[service] % job_id
+            )
+        except (SDKException, RequestException) as error:
+            return False, str(error)
+
+        if not flag:
+            return False, self._update_response_(response.text)
+
+        try:
+            response_json = response.json()
+
+            if response_json and 'errors' in response_json:
+                error_list = response_json['errors'][0]['errList'][0]
+
+                if error_list['errorCode'] != 0:
+                    return False, error_list['errLogMessage'].strip()
+        except (ValueError, KeyError, IndexError, TypeError):
+            return False, 'Invalid response received: {0}'.format(
+                self._update_response_(response.text)
+            )
+
+        return True, None
+
+    def bulk_action(self, job_ids, action, workers=8):
+        """Suspends / Resumes / Kills all the given jobs, running the action for multiple jobs
+            concurrently.
+
+            Unlike **Job.pause()**, **Job.resume()**, and **Job.kill()**, the Job instance is not
+            initialized, and the job summary and details are not fetched for any of the jobs.
+
+            The failure of the action for a job does not stop the action for the other jobs,
+            and is reported in the result of that job.
+
+            Args:
+                job_ids     (list)  --  list of ids of the jobs to run the action for
+
+                action      (str)   --  action to run for the jobs
+
+                    Valid values are:
+
+                        -   suspend
+
+                        -   resume
+
+                        -   kill
+
+                workers     (int)   --  maximum number of actions to run concurrently
+
+                    default: 8
+
+            Returns:
+                dict    -   result of the action for each job id, as
+
+                    {
+                        job_id1: (True, None),
+
+                        job_id2: (False, error message)
+                    }
+
+            Raises:
+                SDKException:
+                    if the action is not valid
+
+                    if type of the job ids is not list, or workers is not a positive integer
+
+        """
+        action = action.lower() if isinstance(action, str) else action
+
+        if action not in self._BULK_ACTIONS:
+            raise SDKException('Job', '102', 'Invalid action: {0}'.format(action))
+
+        if not isinstance(job_ids, (list, tuple, set)):
+            raise SDKException('Job', '108')
+
+        if not isinstance(workers, int) or workers < 1:
+            raise SDKException('Job', '108')
+
+        job_ids = [str(job_id) for job_id in job_ids]
+
+        if not job_ids:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(job_ids))) as executor:
+            results = executor.map(lambda job_id: self._run_job_action(job_id, action), job_ids)
+            return dict(zip(job_ids, results))
+
+    def suspend_all_jobs(self):
+        """ Suspends all the jobs on the commserver """
+        self._modify_all_jobs('suspend')
+
+    def resume_all_jobs(self):
+        """ Resumes all the jobs on the commserver """
+        self._modify_all_jobs('resume')
+
+    def kill_all_jobs(self):
+        """ Kills all the jobs on the commserver """
+        self._modify_all_jobs('kill')
+
+    def get(self, job_id, lazy=False):
+        """Returns the job object for the given job id.
+
+            Args:
+                job_id  (int)   --  id of the job to create Job class instance for
+
+                lazy    (bool)  --  boolean specifying whether to return the lightweight
+                JobHandle class instance, which fetches the job summary on first access only
+
+                    default: False
+
+            Returns:
+                object  -   Job class object for the given job id
+
+                object  -   JobHandle class object for the given job id, if lazy is True
+
+            Raises:
+                SDKException:
+                    if no job with specified job id exists
+
+        """
+        if lazy:
+            return JobHandle(self._commcell_object, job_id)
+
+        return Job(self._commcell_object, job_id)
+
+
+class JobManagement(object):
+    """Class for performing job management operations. """
+
+    def __init__(self, commcell_object):
+        """
+        Initialize instance of JobManagement class for performing operations on jon management settings.
+
+            Args:
+                commcell_object         (object)        --  instance of Commcell class.
+
+            Returns:
+                None
+
+        """
+        self._comcell = commcell_object
+        self._service = commcell_object._services.get('JOB_MANAGEMENT_SETTINGS')
+        self._cvpysdk_object = commcell_object._cvpysdk_object
+        self._error_rules = None
+        self.refresh()
+
+    @property
+    def error_rules(self):
+        if not  self._error_rules:
+            self._error_rules = _ErrorRule(self._comcell)
+        return self._error_rules
+
+    def _set_jobmanagement_settings(self):
+        """
+        Executes a request on the server, to set the job management settings.
+
+         Returns:
+               None
+
+         Raises:
+              SDKException:
+                    if given inputs are invalid
+
+        """
+
+        flag, response = self._cvpysdk_object.make_request(method='POST', url=self._service,
+                                                           payload=self._settings_dict)
+        if flag:
+            if response and response.json():
+                if response.json().get('errorCode', 0) != 0:
+                    raise SDKException('Job', '102', 'Failed to set job management properties. \nError: {0}'.format(
+                        response.json().get('errorMessage', '')))
+                self.refresh()
+        else:
+            raise SDKException('Response', '101', response.json()["errorMessage"])
+
+    def _get_jobmanagement_settings(self):
+        """
+         Executes a request on the server to get the settings of job management.
+
+            Returns:
+                None
+
+            Raises:
+                SDKException
+                    if response is empty
+
+                    if response is not success
+        """
+        flag, response = self._cvpysdk_object.make_request(method='GET', url=self._service)
+        if flag:
+            if response and response.json():
+                self._settings_dict = response.json()
+                if self._settings_dict.get('errorCode', 0) != 0:
+                    raise SDKException('Job', '102', 'Failed to get job management properties. \nError: {0}'.format(
+                        self._settings_dict.get('errorMessage', '')))
+                if 'jobManagementSettings' in self._settings_dict:
+                    self._restart_settings = {'jobRestartSettings': self._settings_dict.get(
+                        'jobManagementSettings').get('jobRestartSettings', {})}
+                    self._priority_settings = {'jobPrioritySettings': self._settings_dict.get(
+                        'jobManagementSettings').get('jobPrioritySettings', {})}
+                    self._general_settings = {'generalSettings': self._settings_dict.get(
+                        'jobManagementSettings').get('generalSettings', {})}
+                    self._update_settings = {'jobUpdatesSettings': self._settings_dict.get(
+                        'jobManagementSettings').get('jobUpdatesSettings', {})}
+                else:
+                    raise SDKException('Response', '102')
+            else:
+                raise SDKException('Response', '102')
+        else:
+            response_string = self._comcell._update_response_(response.text)
+            raise SDKException('Response', '101', response_string)
+
+    def refresh(self):
+        """
+        calls the private method _get_jobmanagement_settings()
+        """
+        self._restart_settings = None
+        self._general_settings = None
+        self._update_settings = None
+        self._priority_settings = None
+        self._get_jobmanagement_settings()
 
     def set_general_settings(self, settings):
         """
@@ -1991,26 +2470,23 @@ class Job(object):
         """
         attempts = 0
         while attempts < 5:  # Retrying to ignore the transient case when no jobs are found
-            flag, response = self._cvpysdk_object.make_request('GET', self._JOB)
             attempts += 1
 
-            if flag:
-                if response.json():
-                    if response.json().get('totalRecordsWithoutPaging', 0) == 0:
-                        time.sleep(3)
-                        continue
-
-                    if 'jobs' in response.json():
-                        for job in response.json()['jobs']:
-                            return job['jobSummary']
-                else:
+            try:
+                summary = get_job_summary(self._commcell_object, self.job_id)
+            except SDKException as excp:
+                if excp.exception_module == 'Response' and excp.exception_id == '102':
                     if attempts > 4:
-                        raise SDKException('Response', '102')
+                        raise
                     time.sleep(20)
+                    continue
+                raise
 
-            else:
-                response_string = self._update_response_(response.text)
-                raise SDKException('Response', '101', response_string)
+            if summary is None:
+                time.sleep(3)
+                continue
+
+            return summary
 
         raise SDKException('Job', '104')
 
@@ -2176,10 +2652,7 @@ class Job(object):
                 '%Y-%m-%d %H:%M:%S', time.gmtime(self._summary['lastUpdateTime'])
             )
 
-        return ('completed' in self._status.lower() or
-                'killed' in self._status.lower() or
-                'committed' in self._status.lower() or
-                'failed' in self._status.lower())
+        return is_job_finished(self._status)
 
     @property
     def client_name(self):
@@ -2558,6 +3031,704 @@ class Job(object):
         raise SDKException('Response', '101', self._update_response_(response.text))
 
 
+class JobHandle(object):
+    """Class for a lightweight, read-only handle to a job, built from its job summary.
+
+        Unlike the Job class, no request is made to the commcell on initialization.
+        The details and events of the job are fetched only on first access.
+
+    """
+
+    __slots__ = ('_commcell_object', '_job_id', '_summary', '_details', '_events')
+
+    def __init__(self, commcell_object, job_id, summary=None):
+        """Initialise the JobHandle class instance.
+
+            Args:
+                commcell_object     (object)        --  instance of the Commcell class
+
+                job_id              (str / int)     --  id of the job
+
+                summary             (dict)          --  job summary of the job, as returned in
+                the **jobSummary** of the jobs response
+
+                    default: None, summary is fetched on first access
+
+            Returns:
+                object  -   instance of the JobHandle class
+
+            Raises:
+                SDKException:
+                    if job id is not an integer
+
+        """
+        try:
+            int(job_id)
+        except (TypeError, ValueError):
+            raise SDKException('Job', '101')
+
+        self._commcell_object = commcell_object
+        self._job_id = str(job_id)
+        self._summary = summary
+        self._details = None
+        self._events = None
+
+    def __repr__(self):
+        """String representation of the instance of this class.
+
+            Returns:
+                str     -   string for instance of this class
+
+        """
+        return 'JobHandle class instance for job id: "{0}"'.format(self._job_id)
+
+    def _get_job_summary(self):
+        """Gets the summary of this job.
+
+            Returns:
+                dict    -   dict that contains the summary of this job
+
+            Raises:
+                SDKException:
+                    if no record found for this job
+
+                    if response is empty
+
+                    if response is not success
+
+        """
+        summary = get_job_summary(self._commcell_object, self._job_id)
+
+        if summary is None:
+            raise SDKException('Job', '104')
+
+        return summary
+
+    def _get_job_details(self):
+        """Gets the detailed properties of this job.
+
+            Returns:
+                dict    -   dict consisting of the detailed properties of the job
+
+            Raises:
+                SDKException:
+                    if failed to get the job details
+
+                    if response is not success
+
+        """
+        flag, response = self._commcell_object._cvpysdk_object.make_request(
+            'POST', self._commcell_object._services['JOB_DETAILS'], {"jobId": int(self._job_id)}
+        )
+
+        if flag:
+            if response.json() and 'job' in response.json():
+                return response.json()['job']
+
+            raise SDKException('Job', '105')
+
+        response_string = self._commcell_object._update_response_(response.text)
+        raise SDKException('Response', '101', response_string)
+
+    def _get_events(self):
+        """Gets the commserv events of this job.
+
+            Returns:
+                list    -   list of the commserv events of the job
+
+            Raises:
+                SDKException:
+                    if no events found for this job
+
+                    if response is not success
+
+        """
+        flag, response = self._commcell_object._cvpysdk_object.make_request(
+            'GET', self._commcell_object._services['JOB_EVENTS'] % self._job_id
+        )
+
+        if flag:
+            if response.json() and 'commservEvents' in response.json():
+                return response.json()['commservEvents']
+
+            raise SDKException('Job', '104')
+
+        response_string = self._commcell_object._update_response_(response.text)
+        raise SDKException('Response', '101', response_string)
+
+    def _get(self, key, section=None):
+        """Returns the value of the key from the job summary, or its section.
+
+            Args:
+                key         (str)   --  key to get the value of
+
+                section     (str)   --  key of the section of the summary, the key is in
+
+                    default: None
+
+            Returns:
+                object  -   value of the key
+
+                None    -   if the key is not present in the summary
+
+        """
+        summary = self.summary
+
+        if section is not None:
+            summary = summary.get(section, {})
+
+        return summary.get(key)
+
+    def refresh(self):
+        """Refresh the summary of the job, and clears the fetched details and events."""
+        self._summary = self._get_job_summary()
+        self._details = None
+        self._events = None
+
+    def to_job(self):
+        """Returns the Job class instance for this job.
+
+            Returns:
+                object  -   instance of the Job class for this job
+
+        """
+        return Job(self._commcell_object, self._job_id)
+
+    @property
+    def job_id(self):
+        """Treats the job id as a read-only attribute."""
+        return self._job_id
+
+    @property
+    def summary(self):
+        """Treats the job summary as a read-only attribute."""
+        if self._summary is None:
+            self._summary = self._get_job_summary()
+
+        return self._summary
+
+    @property
+    def details(self):
+        """Treats the job full details as a read-only attribute, fetched on first access."""
+        if self._details is None:
+            self._details = self._get_job_details()
+
+        return self._details
+
+    @property
+    def events(self):
+        """Treats the commserv events of the job as a read-only attribute,
+            fetched on first access.
+
+        """
+        if self._events is None:
+            self._events = self._get_events()
+
+        return self._events
+
+    @property
+    def status(self):
+        """Treats the job status, as of the last fetched summary, as a read-only attribute."""
+        return self._get('status')
+
+    @property
+    def is_finished(self):
+        """Treats whether the job had finished, as of the last fetched summary,
+            as a read-only attribute.
+
+        """
+        return is_job_finished(self.status)
+
+    @property
+    def job_type(self):
+        """Treats the job type as a read-only attribute."""
+        return self._get('jobType')
+
+    @property
+    def operation(self):
+        """Treats the job operation name as a read-only attribute."""
+        return self._get('localizedOperationName')
+
+    @property
+    def percent_complete(self):
+        """Treats the job progress percentage as a read-only attribute."""
+        return self._get('percentComplete')
+
+    @property
+    def backup_level(self):
+        """Treats the backup level as a read-only attribute."""
+        return self._get('backupLevelName')
+
+    @property
+    def pending_reason(self):
+        """Treats the job pending reason as a read-only attribute."""
+        return self._get('pendingReason') or None
+
+    @property
+    def phase(self):
+        """Treats the job current phase as a read-only attribute."""
+        return self._get('currentPhaseName')
+
+    @property
+    def client_name(self):
+        """Treats the client name as a read-only attribute."""
+        return self._get('clientName', 'subclient')
+
+    @property
+    def agent_name(self):
+        """Treats the agent name as a read-only attribute."""
+        return self._get('appName', 'subclient')
+
+    @property
+    def instance_name(self):
+        """Treats the instance name as a read-only attribute."""
+        return self._get('instanceName', 'subclient')
+
+    @property
+    def backupset_name(self):
+        """Treats the backupset name as a read-only attribute."""
+        return self._get('backupsetName', 'subclient')
+
+    @property
+    def subclient_name(self):
+        """Treats the subclient name as a read-only attribute."""
+        return self._get('subclientName', 'subclient')
+
+    @property
+    def start_timestamp(self):
+        """Treats the unix start time as a read-only attribute."""
+        return self._get('jobStartTime')
+
+    @property
+    def end_timestamp(self):
+        """Treats the unix end time as a read-only attribute."""
+        return self._get('jobEndTime')
+
+    @property
+    def start_time(self):
+        """Treats the start time as a read-only attribute."""
+        if self.start_timestamp:
+            return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(self.start_timestamp))
+
+    @property
+    def end_time(self):
+        """Treats the end time as a read-only attribute."""
+        if self.end_timestamp:
+            return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(self.end_timestamp))
+
+
+class JobWatcher(object):
+    """Class for tracking the status of multiple jobs via a single poll loop."""
+
+    def __init__(
+            self,
+            commcell_object,
+            interval=5,
+            max_interval=60,
+            backoff=1.5,
+            clients_list=None):
+        """Initialize the instance of the JobWatcher class.
+
+            Args:
+                commcell_object     (object)    --  instance of the Commcell class
+
+                interval            (int)       --  seconds to wait between the polls, while the
+                status of any of the jobs is changing
+
+                    default: 5
+
+                max_interval        (int)       --  maximum seconds to wait between the polls,
+                the interval is increased up to this value, while none of the jobs change status
+
+                    default: 60
+
+                backoff             (float)     --  factor to increase the interval by, after
+                every poll with no status change
+
+                    default: 1.5
+
+                clients_list        (list)      --  list of names of the clients the jobs are
+                running for, to filter the jobs query by
+
+                    default: None, jobs of all the clients are queried
+
+            Returns:
+                object  -   instance of the JobWatcher class
+
+        """
+        self._commcell_object = commcell_object
+
+        self._cvpysdk_object = commcell_object._cvpysdk_object
+        self._services = commcell_object._services
+        self._update_response_ = commcell_object._update_response_
+
+        self._interval = interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._clients_list = clients_list or []
+
+        self._current_interval = interval
+        self._start_time = time.time()
+
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._last_error = None
+
+    def __repr__(self):
+        """Representation string for the instance of the JobWatcher class."""
+        return "JobWatcher class instance for Commcell: '{0}'".format(
+            self._commcell_object.commserv_name
+        )
+
+    def __enter__(self):
+        """Starts the poll loop in background, and returns the current instance."""
+        self.start()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        """Stops the poll loop running in background."""
+        self.stop()
+
+    def _get_jobs_summary(self, job_ids):
+        """Gets the summary of the given jobs, via a single jobs query filtered by their ids.
+
+            The jobs not returned by the query, are fetched individually.
+
+            Args:
+                job_ids     (list)  --  list of ids of the jobs
+
+            Returns:
+                dict    -   dictionary with the job id as key, and the job summary as value
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+
+        """
+        # completed jobs older than the watcher need not be listed by the query
+        lookup_time = (time.time() - self._start_time) / 3600 + 1
+
+        jobs_list = self._commcell_object.job_controller._get_jobs_list(
+            category='ALL',
+            lookup_time=lookup_time,
+            limit=len(job_ids),
+            clients_list=self._clients_list,
+            job_id_list=job_ids,
+            job_summary='full'
+        )
+
+        summaries = {}
+
+        for job_id in job_ids:
+            if int(job_id) in jobs_list:
+                summaries[job_id] = jobs_list[int(job_id)]
+                continue
+
+            summary = get_job_summary(self._commcell_object, job_id)
+
+            if summary is not None:
+                summaries[job_id] = summary
+
+        return summaries
+
+    def _get_job_details(self, job_id):
+        """Gets the detailed properties of the given job.
+
+            Args:
+                job_id  (str)   --  id of the job
+
+            Returns:
+                dict    -   dict consisting of the detailed properties of the job
+
+                None    -   if failed to get the job details
+
+        """
+        try:
+            flag, response = self._cvpysdk_object.make_request(
+                'POST', self._services['JOB_DETAILS'], {"jobId": int(job_id)}
+            )
+
+            if flag and response.json() and 'job' in response.json():
+                return response.json()['job']
+        except (SDKException, RequestException, ValueError):
+            pass
+
+        return None
+
+    def _notify(self, job_id, job, summary):
+        """Calls the callbacks of the job, with its new status.
+
+            An exception raised by a callback is saved as the **last_error**, and does not stop
+            the other callbacks, or the poll loop.
+
+            Args:
+                job_id      (str)   --  id of the job
+
+                job         (dict)  --  status, callbacks, and the future of the job
+
+                summary     (dict)  --  summary of the job
+
+        """
+        for callback in job['callbacks']:
+            try:
+                callback(job_id, summary['status'], summary)
+            except Exception as excp:
+                self._last_error = excp
+
+    def _fail_jobs(self, exception):
+        """Fails the futures of all the jobs being tracked with the given exception, and stops
+            tracking them.
+
+            Args:
+                exception   (object)    --  exception to set on the futures of the jobs
+
+        """
+        self._last_error = exception
+
+        with self._lock:
+            jobs = list(self._jobs.values())
+            self._jobs.clear()
+
+        for job in jobs:
+            if not job['future'].done():
+                job['future'].set_exception(exception)
+
+    def watch(self, job_id, callback=None):
+        """Adds the job to the list of jobs to be tracked.
+
+            Args:
+                job_id      (str / int)     --  id of the job
+
+                callback    (callable)      --  function to be called on every change in the
+                status of the job, with the job id, status, and the job summary as arguments
+
+                    default: None
+
+            Returns:
+                object  -   instance of the **concurrent.futures.Future** class, resolved with
+                the final status of the job, once the job has finished
+
+                    {
+                        "status": "Completed",
+
+                        "summary": {},
+
+                        "details": {}
+                    }
+
+            Raises:
+                SDKException:
+                    if job id is not an integer
+
+        """
+        try:
+            job_id = str(int(job_id))
+        except (TypeError, ValueError):
+            raise SDKException('Job', '101')
+
+        with self._lock:
+            if job_id not in self._jobs:
+                self._jobs[job_id] = {
+                    'status': None,
+                    'callbacks': [],
+                    'future': Future()
+                }
+
+            if callback is not None:
+                self._jobs[job_id]['callbacks'].append(callback)
+
+            # start polling at the minimum interval, for the newly added job
+            self._current_interval = self._interval
+
+            return self._jobs[job_id]['future']
+
+    def unwatch(self, job_id):
+        """Removes the job from the list of jobs being tracked, and cancels its future.
+
+            Args:
+                job_id      (str / int)     --  id of the job
+
+        """
+        with self._lock:
+            job = self._jobs.pop(str(job_id), None)
+
+        if job is not None:
+            job['future'].cancel()
+
+    def poll(self):
+        """Fetches the status of all the jobs being tracked, and notifies the status changes.
+
+            The details of a job are fetched only once, after the job has finished.
+
+            Returns:
+                int     -   number of jobs whose status changed in this poll
+
+        """
+        with self._lock:
+            job_ids = list(self._jobs)
+
+        if not job_ids:
+            return 0
+
+        summaries = self._get_jobs_summary(job_ids)
+        transitions = 0
+
+        for job_id, summary in summaries.items():
+            with self._lock:
+                job = self._jobs.get(job_id)
+
+            # skip the summary with no status, it is fetched again on the next poll
+            if job is None or not summary.get('status') or summary['status'] == job['status']:
+                continue
+
+            transitions += 1
+            job['status'] = summary['status']
+
+            self._notify(job_id, job, summary)
+
+            if is_job_finished(summary['status']):
+                with self._lock:
+                    self._jobs.pop(job_id, None)
+
+                details = self._get_job_details(job_id)
+
+                if not job['future'].done():
+                    job['future'].set_result({
+                        'status': summary['status'],
+                        'summary': summary,
+                        'details': details
+                    })
+
+        if transitions:
+            self._current_interval = self._interval
+        else:
+            self._current_interval = min(
+                self._current_interval * self._backoff, self._max_interval
+            )
+
+        return transitions
+
+    def _run(self):
+        """Runs the poll loop, till the watcher is stopped.
+
+            A failed poll is retried after the interval. If the loop exits for any other reason
+            than the watcher being stopped, the futures of the jobs being tracked are failed.
+        """
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    self.poll()
+                except Exception as excp:
+                    # transient failure of the jobs query, or unexpected response, retry after
+                    # the interval
+                    self._last_error = excp
+                    self._current_interval = self._interval
+
+                self._stop_event.wait(self._current_interval)
+        except BaseException as excp:
+            self._fail_jobs(SDKException('Job', '102', 'Job watcher stopped: {0}'.format(excp)))
+            raise
+
+    def start(self):
+        """Starts the poll loop in a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='JobWatcher')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stops the poll loop running in the background thread."""
+        self._stop_event.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def wait(self, job_ids=None, timeout=None):
+        """Waits till the given jobs have finished.
+
+            If the poll loop is not running in background, the jobs are polled on the
+            calling thread. A failed poll is retried after the interval, till the timeout.
+
+            The jobs whose futures were failed, as the poll loop exited with an error, are left
+            out of the result, like the jobs that have not finished, and the error is set as the
+            **last_error**.
+
+            Args:
+                job_ids     (list)  --  list of ids of the jobs to wait for
+
+                    default: None, all the jobs being tracked
+
+                timeout     (int)   --  maximum seconds to wait for the jobs to finish
+
+                    default: None, wait till all the jobs have finished
+
+            Returns:
+                dict    -   dictionary with the job id as key, and the final status of the job
+                as value, for the jobs that have finished
+
+        """
+        def sleep(seconds):
+            # never sleep past the timeout, as the interval backs off up to the max interval
+            if end_time is not None:
+                seconds = min(seconds, max(end_time - time.time(), 0))
+
+            time.sleep(seconds)
+
+        if job_ids is None:
+            with self._lock:
+                job_ids = list(self._jobs)
+
+        futures = dict((str(job_id), self.watch(job_id)) for job_id in job_ids)
+        end_time = None if timeout is None else time.time() + timeout
+
+        while not all(future.done() for future in futures.values()):
+            if end_time is not None and time.time() >= end_time:
+                break
+
+            # poll on the calling thread, if the poll loop is not running in background
+            if self._thread is None or not self._thread.is_alive():
+                try:
+                    self.poll()
+                except Exception as excp:
+                    self._last_error = excp
+
+                if all(future.done() for future in futures.values()):
+                    break
+
+                sleep(self._current_interval)
+            else:
+                sleep(min(self._interval, 1))
+
+        return dict(
+            (job_id, future.result()['status'])
+            for job_id, future in futures.items()
+            if future.done() and not future.cancelled() and future.exception() is None
+        )
+
+    @property
+    def jobs(self):
+        """Returns the dict of the jobs being tracked, with the job id as key,
+            and the last known status of the job as value.
+
+        """
+        with self._lock:
+            return dict((job_id, job['status']) for job_id, job in self._jobs.items())
+
+    @property
+    def last_error(self):
+        """Returns the last exception raised by a poll, or by a callback of a job."""
+        return self._last_error
+
+
 class _ErrorRule:
     """Class for enabling, disabling, adding, getting and deleting error rules."""
 
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for submitting jobs to the commcell in bulk, over a bounded pool of worker threads.
+
+The number of jobs being submitted concurrently is bounded by the number of workers, and the
+rate at which the jobs are submitted is throttled via a token bucket, instead of sleeping
+between the submissions. The bulk operations of the SDK submit the jobs with the submitter given,
+or with a submitter of their own otherwise, bounded by **JobSubmitter.DEFAULT_MAX_WORKERS**, and
+throttled by **JobSubmitter.DEFAULT_RATE**, unless given in the call.
+
+Usage:
+
+    >>> from cvpysdk.job_submitter import JobSubmitter
+
+    >>> with JobSubmitter(max_workers=16, rate=5, burst=10) as submitter:
+    ...     futures = backupset.backup_async(submitter=submitter, backup_level='Full')
+
+    >>> jobs = {name: future.result() for name, future in futures.items()}
+
+
+TokenBucket:    Class for throttling the rate of the submissions
+
+JobSubmitter:   Class for submitting the jobs over a bounded pool of worker threads
+
+
+TokenBucket:
+============
+
+    __init__(rate, burst)       --  initialize the instance of the TokenBucket class
+
+    acquire()                   --  waits till a token is available, and consumes it
+
+
+JobSubmitter:
+=============
+
+    __init__()                  --  initialize the instance of the JobSubmitter class
+
+    __enter__()                 --  returns the current instance, using the "with" context manager
+
+    __exit__()                  --  waits for the submitted jobs, and shuts down the workers
+
+    _run()                      --  runs the function on the worker, once a token is available
+
+    submit()                    --  submits the function to be run on a worker thread
+
+    shutdown()                  --  shuts down the worker threads
+
+JobSubmitter Attributes
+-----------------------
+
+    **max_workers**             --  returns the maximum number of jobs submitted concurrently
+
+    **rate**                    --  returns the maximum number of jobs submitted per second
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .exception import SDKException
+
+
+class TokenBucket(object):
+    """Class for throttling the rate of the operations via a token bucket."""
+
+    def __init__(self, rate, burst=1):
+        """Initialize the instance of the TokenBucket class.
+
+            Args:
+                rate    (float)     --  number of tokens added to the bucket per second
+
+                burst   (int)       --  maximum number of tokens the bucket can hold,
+                i.e., the operations that can be run back to back
+
+                    default: 1
+
+            Returns:
+                object  -   instance of the TokenBucket class
+
+        """
+        self._rate = float(rate)
+        self._burst = burst
+        self._tokens = float(burst)
+        self._last_time = time.time()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Waits till a token is available in the bucket, and consumes it."""
+        while True:
+            with self._lock:
+                now = time.time()
+                self._tokens = min(self._burst, self._tokens + (now - self._last_time) * self._rate)
+                self._last_time = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_time = (1 - self._tokens) / self._rate
+
+            time.sleep(wait_time)
+
+
+class JobSubmitter(object):
+    """Class for submitting jobs over a bounded pool of worker threads, throttled by rate."""
+
+    DEFAULT_MAX_WORKERS = 8
+    """int:     maximum number of jobs submitted concurrently, by default"""
+
+    DEFAULT_RATE = 2
+    """float:   maximum number of jobs submitted per second, by default"""
+
+    DEFAULT_BURST = 4
+    """int:     number of jobs submitted back to back, before the rate limit applies, by default"""
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        """Initialize the instance of the JobSubmitter class.
+
+            Args:
+                max_workers     (int)   --  maximum number of jobs to submit concurrently
+
+                    default: 8
+
+                rate            (float) --  maximum number of jobs to submit per second,
+                None to submit the jobs without any throttling
+
+                    default: 2
+
+                burst           (int)   --  number of jobs that can be submitted back to back,
+                before the rate limit applies
+
+                    default: 4
+
+            Returns:
+                object  -   instance of the JobSubmitter class
+
+            Raises:
+                SDKException:
+                    if max workers, rate, or burst is not a positive number
+
+        """
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise SDKException('Job', '108')
+
+        if rate is not None and (not isinstance(rate, (int, float)) or rate <= 0):
+            raise SDKException('Job', '108')
+
+        if not isinstance(burst, int) or burst < 1:
+            raise SDKException('Job', '108')
+
+        self._max_workers = max_workers
+        self._rate = rate
+
+        self._bucket = TokenBucket(rate, burst) if rate is not None else None
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def __enter__(self):
+        """Returns the current instance.
+
+            Returns:
+                object  -   the initialized instance referred by self
+
+        """
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        """Waits for the submitted jobs, and shuts down the worker threads."""
+        self.shutdown()
+
+    def _run(self, function, *args, **kwargs):
+        """Runs the function on the worker thread, once a token is available.
+
+            Args:
+                function    (callable)  --  function to run
+
+                *args                   --  positional arguments for the function
+
+                **kwargs                --  keyword arguments for the function
+
+            Returns:
+                object  -   value returned by the function
+
+        """
+        if self._bucket is not None:
+            self._bucket.acquire()
+
+        return function(*args, **kwargs)
+
+    def submit(self, function, *args, **kwargs):
+        """Submits the function to be run on a worker thread, throttled by the rate.
+
+            Args:
+                function    (callable)  --  function to run, e.g., **subclient.backup**
+
+                *args                   --  positional arguments for the function
+
+                **kwargs                --  keyword arguments for the function
+
+            Returns:
+                object  -   instance of the **concurrent.futures.Future** class, for the value
+                returned by the function
+
+        """
+        return self._executor.submit(self._run, function, *args, **kwargs)
+
+    def shutdown(self, wait=True):
+        """Shuts down the worker threads.
+
+            Args:
+                wait    (bool)  --  boolean specifying whether to wait for the submitted jobs
+
+                    default: True
+
+        """
+        self._executor.shutdown(wait=wait)
+
+    @property
+    def max_workers(self):
+        """Returns the maximum number of jobs submitted concurrently."""
+        return self._max_workers
+
+    @property
+    def rate(self):
+        """Returns the maximum number of jobs submitted per second, None if not throttled."""
+        return self._rate
+
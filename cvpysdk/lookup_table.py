@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for the secondary lookup indexes of the entity collections of the SDK.
+
+The collection classes (Clients, Backupsets, Subclients, etc.) hold their entities in a
+dictionary keyed by the entity name. LookupTable maps the other attributes of the entities,
+like the id or the hostname, back to the entity name, so that they can be resolved in
+constant time, instead of scanning the whole dictionary for every lookup.
+
+The table is built once every time the collection is refreshed.
+
+LookupTable:
+============
+
+    __init__(*keys)         --  initialize the instance of the LookupTable class for the
+    attributes given
+
+    __len__()               --  returns the number of entities added to the table
+
+    from_dict()             --  builds a table from the dictionary of a collection class
+
+    add()                   --  adds the attributes of an entity to the table
+
+    get()                   --  returns the name of the entity with the given attribute value
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+
+class LookupTable(object):
+    """Class for mapping the attributes of the entities of a collection to the entity name."""
+
+    def __init__(self, *keys):
+        """Initialize the instance of the LookupTable class.
+
+            Args:
+                *keys   (str)   --  names of the attributes to index the entities on
+
+                    e.g.:   'id', 'hostname'
+
+            Returns:
+                object  -   instance of the LookupTable class
+
+        """
+        self._tables = {key: {} for key in keys}
+        self._count = 0
+
+    def __len__(self):
+        """Returns the number of the entities added to the table."""
+        return self._count
+
+    @classmethod
+    def from_dict(cls, entities, *keys):
+        """Builds the table from the dictionary of entities of a collection class.
+
+            Args:
+                entities    (dict)  --  dictionary with the entity name as key,
+                and the dict of its details as value
+
+                    if the value is not a dict, it is considered as the **id** of the entity
+
+                *keys       (str)   --  names of the attributes to index the entities on
+
+            Returns:
+                object  -   instance of the LookupTable class
+
+        """
+        table = cls(*keys)
+
+        for name, details in (entities or {}).items():
+            if not isinstance(details, dict):
+                details = {'id': details}
+
+            table.add(name, **details)
+
+        return table
+
+    def add(self, name, **attributes):
+        """Adds the attributes of the entity to the table.
+
+            Only the first entity added for a value is mapped to it, same as the first match
+            when scanning the collection dictionary.
+
+            Args:
+                name            (str)   --  name of the entity
+
+                **attributes            --  values of the attributes of the entity
+
+        """
+        for key, table in self._tables.items():
+            value = attributes.get(key)
+
+            if value is not None and value != '':
+                table.setdefault(str(value).lower(), name)
+
+        self._count += 1
+
+    def get(self, key, value, default=None):
+        """Returns the name of the entity with the given value for the attribute.
+
+            Args:
+                key     (str)   --  name of the attribute to lookup
+
+                value   (str)   --  value of the attribute
+
+                default (str)   --  value to return if no entity matches
+
+                    default: None
+
+            Returns:
+                str     -   name of the entity matching the value
+
+            Raises:
+                KeyError:
+                    if the table is not indexed on the given attribute
+
+        """
+        return self._tables[key].get(str(value).lower(), default)
@@ -0,0 +1,570 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for caching the metadata of the Commcell entities fetched via the REST API.
+
+The responses of the GET requests for the client, agent, instance, backupset, subclient and
+alert metadata are cached, keyed on the logged in user and the service URL, which includes the
+id of the entity. The cache is consulted by **CVPySDK.make_request**, and hence by all the
+`_get_*` loaders of the collection classes.
+
+Any add / update / delete request made via the SDK invalidates the cache, so that the SDK
+never returns the metadata it changed itself from the cache. Changes made outside of this
+session are picked up once the cached entry expires.
+
+Usage:
+
+    >>> from cvpysdk.commcell import Commcell
+    >>> from cvpysdk.metadata_cache import MetadataCache
+
+    >>> commcell = Commcell(
+    ...     'webconsole_hostname', 'username', 'password', metadata_cache=MetadataCache(ttl=300)
+    ... )
+
+    >>> commcell.metadata_cache.stats
+    {'hits': 12, 'misses': 4, 'evictions': 0, 'expirations': 0, 'invalidations': 0, 'size': 4}
+
+
+MetadataCache:  In-memory LRU cache, with a time-to-live for every entry
+
+DiskMetadataCache:  MetadataCache backed by an on-disk store, to share the cache across
+the processes / sessions on the same machine
+
+Only the status code, the headers, and the body of the responses are written to the disk,
+never the request made, and hence the Authtoken it was made with.
+
+
+MetadataCache:
+==============
+
+    __init__(ttl, max_size, services)   --  initialize the instance of the MetadataCache class
+
+    __len__()                   --  returns the number of entries in the cache
+
+    _make_key()                 --  returns the key of the cache entry for the user and URL
+
+    _load()                     --  returns the cache entry from the backing store
+
+    _store()                    --  saves the cache entry to the backing store
+
+    _discard()                  --  removes all entries from the backing store
+
+    is_cacheable()              --  checks if the response of the URL can be cached
+
+    is_read_only()              --  checks if the request to the URL does not modify any entity
+
+    get()                       --  returns the cached response for the user and URL
+
+    set()                       --  caches the response for the user and URL
+
+    invalidate()                --  invalidates the cache, if the request to the URL modifies
+    any entity
+
+    clear()                     --  removes all the entries from the cache
+
+MetadataCache Attributes
+------------------------
+
+    **ttl**                     --  returns the time-to-live of the cache entries, in seconds
+
+    **max_size**                --  returns the maximum number of entries kept in memory
+
+    **stats**                   --  returns the hit / miss metrics of the cache
+
+
+DiskMetadataCache:
+==================
+
+    __init__(directory, ttl, max_size, services)    --  initialize the instance of the
+    DiskMetadataCache class
+
+    _path()                     --  returns the path of the file for the cache entry
+
+    _load()                     --  returns the cache entry from the disk
+
+    _store()                    --  saves the cache entry to the disk
+
+    _dump_entry()               --  returns the cache entry serialized to bytes
+
+    _load_entry()               --  returns the cache entry deserialized from bytes
+
+    _discard()                  --  removes all the cache entries from the disk
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+from collections import OrderedDict
+
+from requests.structures import CaseInsensitiveDict
+
+from .response import JSONResponse
+from .services import SERVICES_DICT_TEMPLATE
+
+
+CACHEABLE_SERVICES = (
+    'GET_ALL_CLIENTS',
+    'GET_ALL_CLIENTS_PLUS_HIDDEN',
+    'GET_VIRTUAL_CLIENTS',
+    'CLIENT',
+    'GET_ALL_AGENTS',
+    'GET_AGENT',
+    'GET_ALL_INSTANCES',
+    'INSTANCE',
+    'GET_ALL_BACKUPSETS',
+    'BACKUPSET',
+    'GET_ALL_SUBCLIENTS',
+    'GET_CLIENT_SUBCLIENTS',
+    'SUBCLIENT',
+    'GET_ALL_ALERTS',
+    'ALERT'
+)
+"""tuple:   Keys of the services in the SERVICES_DICT_TEMPLATE, whose GET response is cached."""
+
+READ_ONLY_SERVICES = (
+    'LOGIN',
+    'RENEW_LOGIN_TOKEN',
+    'WHO_AM_I',
+    'JOB_DETAILS',
+    'ALL_JOBS',
+    'BROWSE'
+)
+"""tuple:   Keys of the services in the SERVICES_DICT_TEMPLATE, which are called with a POST
+request, but do not modify any entity, and hence do not invalidate the cache.
+
+"""
+
+
+def _service_pattern(service):
+    """Returns the compiled regex to match the URLs of the service template given.
+
+        Args:
+            service     (str)   --  key of the service in the SERVICES_DICT_TEMPLATE
+
+        Returns:
+            object  -   compiled regex pattern
+
+    """
+    endpoint = re.escape(SERVICES_DICT_TEMPLATE[service].format(''))
+    endpoint = endpoint.replace(re.escape('%s'), '[^/?&]+')
+    return re.compile(r'(?:^|/){0}(?:&[^/]*)?$'.format(endpoint))
+
+
+class MetadataCache(object):
+    """Class for caching the metadata responses in memory, with a time-to-live."""
+
+    def __init__(self, ttl=60, max_size=1024, services=CACHEABLE_SERVICES):
+        """Initialize the instance of the MetadataCache class.
+
+            Args:
+                ttl         (int)   --  seconds for which a cached response is valid
+
+                    default: 60
+
+                max_size    (int)   --  maximum number of responses to keep in memory,
+                the least recently used response is evicted first
+
+                    default: 1024
+
+                services    (tuple) --  keys of the services in the SERVICES_DICT_TEMPLATE,
+                whose GET response is to be cached
+
+                    default: CACHEABLE_SERVICES
+
+            Returns:
+                object  -   instance of the MetadataCache class
+
+        """
+        self._ttl = ttl
+        self._max_size = max_size
+        self._patterns = [_service_pattern(service) for service in services]
+        self._read_only_patterns = [_service_pattern(service) for service in READ_ONLY_SERVICES]
+
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def __len__(self):
+        """Returns the number of the entries in the in-memory cache."""
+        return len(self._entries)
+
+    @staticmethod
+    def _make_key(user, url):
+        """Returns the key of the cache entry for the given user and URL.
+
+            Args:
+                user    (str)   --  name of the user, the response was received for
+
+                url     (str)   --  URL of the service, including the id of the entity
+
+            Returns:
+                str     -   key of the cache entry
+
+        """
+        return '{0}|{1}'.format(user, url)
+
+    def _load(self, key):
+        """Returns the cache entry from the backing store.
+
+            The in-memory cache has no backing store.
+
+            Args:
+                key     (str)   --  key of the cache entry
+
+            Returns:
+                tuple   -   (expiry time, response), if the entry exists in the store
+
+                None    -   if the entry does not exist in the store
+
+        """
+        return None
+
+    def _store(self, key, entry):
+        """Saves the cache entry to the backing store.
+
+            The in-memory cache has no backing store.
+
+            Args:
+                key     (str)   --  key of the cache entry
+
+                entry   (tuple) --  (expiry time, response)
+
+        """
+        pass
+
+    def _discard(self):
+        """Removes all the entries from the backing store.
+
+            The in-memory cache has no backing store.
+
+        """
+        pass
+
+    def is_cacheable(self, url):
+        """Checks if the GET response of the given URL can be cached.
+
+            Args:
+                url     (str)   --  URL of the service
+
+            Returns:
+                bool    -   boolean specifying whether the URL matches any cacheable service
+
+        """
+        return any(pattern.search(url) for pattern in self._patterns)
+
+    def is_read_only(self, url):
+        """Checks if the request to the given URL does not modify any entity.
+
+            Args:
+                url     (str)   --  URL of the service
+
+            Returns:
+                bool    -   boolean specifying whether the URL matches any read only service
+
+        """
+        return any(pattern.search(url) for pattern in self._read_only_patterns)
+
+    def get(self, user, url):
+        """Returns the cached response of the GET request for the given user and URL.
+
+            Args:
+                user    (str)   --  name of the user, the request is made for
+
+                url     (str)   --  URL of the service
+
+            Returns:
+                object  -   cached **requests.Response** class instance
+
+                None    -   if the response is not cached, or the cached response has expired
+
+        """
+        if not self.is_cacheable(url):
+            return None
+
+        key = self._make_key(user, url)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                entry = self._load(key)
+
+                if entry is not None:
+                    self._entries[key] = entry
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if entry[0] < time.time():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+        # the decoded body of the response is not shared across the callers
+        return copy.copy(entry[1])
+
+    def set(self, user, url, response):
+        """Caches the response of the GET request for the given user and URL.
+
+            Args:
+                user        (str)       --  name of the user, the request was made for
+
+                url         (str)       --  URL of the service
+
+                response    (object)    --  **requests.Response** class instance received
+
+        """
+        if not self.is_cacheable(url):
+            return
+
+        key = self._make_key(user, url)
+
+        # the value decoded for the caller is not shared with the callers getting the response
+        entry = (time.time() + self._ttl, copy.copy(response))
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+            self._store(key, entry)
+
+    def invalidate(self, url):
+        """Invalidates the cache, if the request to the given URL modifies any entity.
+
+            Args:
+                url     (str)   --  URL of the service, the non-GET request is made to
+
+        """
+        if self.is_read_only(url):
+            return
+
+        with self._lock:
+            self.clear()
+            self._invalidations += 1
+
+    def clear(self):
+        """Removes all the entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._discard()
+
+    @property
+    def ttl(self):
+        """Returns the time-to-live of the cache entries, in seconds."""
+        return self._ttl
+
+    @property
+    def max_size(self):
+        """Returns the maximum number of entries kept in the memory."""
+        return self._max_size
+
+    @property
+    def stats(self):
+        """Returns the hit / miss metrics of the cache.
+
+            dict    -   consists of the metrics of the cache
+
+                {
+                    "hits": 12,
+
+                    "misses": 4,
+
+                    "evictions": 0,
+
+                    "expirations": 0,
+
+                    "invalidations": 0,
+
+                    "size": 4
+                }
+
+        """
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'expirations': self._expirations,
+            'invalidations': self._invalidations,
+            'size': len(self._entries)
+        }
+
+
+class DiskMetadataCache(MetadataCache):
+    """Class for caching the metadata responses in memory, backed by an on-disk store."""
+
+    def __init__(self, directory, ttl=300, max_size=1024, services=CACHEABLE_SERVICES):
+        """Initialize the instance of the DiskMetadataCache class.
+
+            Args:
+                directory   (str)   --  path of the directory to store the cache entries in
+
+                ttl         (int)   --  seconds for which a cached response is valid
+
+                    default: 300
+
+                max_size    (int)   --  maximum number of responses to keep in memory
+
+                    default: 1024
+
+                services    (tuple) --  keys of the services in the SERVICES_DICT_TEMPLATE,
+                whose GET response is to be cached
+
+                    default: CACHEABLE_SERVICES
+
+            Returns:
+                object  -   instance of the DiskMetadataCache class
+
+        """
+        super(DiskMetadataCache, self).__init__(ttl, max_size, services)
+        self._directory = directory
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def _path(self, key):
+        """Returns the path of the file for the cache entry with the given key."""
+        return os.path.join(
+            self._directory, '{0}.cache'.format(hashlib.sha1(key.encode()).hexdigest())
+        )
+
+    @staticmethod
+    def _dump_entry(entry):
+        """Returns the cache entry serialized to bytes, as a line of JSON with the expiry time,
+            the status code, and the headers of the response, followed by its body.
+
+            Args:
+                entry   (tuple) --  (expiry time, response)
+
+            Returns:
+                bytes   -   serialized cache entry
+
+        """
+        expiry, response = entry
+        metadata = {
+            'expiry': expiry,
+            'status_code': response.status_code,
+            'reason': response.reason,
+            'url': response.url,
+            'encoding': response.encoding,
+            'headers': dict(response.headers)
+        }
+
+        return json.dumps(metadata).encode('utf-8') + b'\n' + (response.content or b'')
+
+    @staticmethod
+    def _load_entry(data):
+        """Returns the cache entry deserialized from the bytes written by **_dump_entry()**.
+
+            Args:
+                data    (bytes) --  serialized cache entry
+
+            Returns:
+                tuple   -   (expiry time, response)
+
+            Raises:
+                ValueError:
+                    if the data is not a valid cache entry
+
+        """
+        metadata, _, content = data.partition(b'\n')
+        metadata = json.loads(metadata.decode('utf-8'))
+
+        response = JSONResponse()
+        response.status_code = metadata['status_code']
+        response.reason = metadata['reason']
+        response.url = metadata['url']
+        response.encoding = metadata['encoding']
+        response.headers = CaseInsensitiveDict(metadata['headers'])
+        response._content = content
+        response._content_consumed = True
+
+        return float(metadata['expiry']), response
+
+    def _load(self, key):
+        """Returns the cache entry from the disk.
+
+            Args:
+                key     (str)   --  key of the cache entry
+
+            Returns:
+                tuple   -   (expiry time, response), if the entry exists on the disk
+
+                None    -   if the entry does not exist, or could not be read
+
+        """
+        try:
+            with open(self._path(key), 'rb') as cache_file:
+                return self._load_entry(cache_file.read())
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store(self, key, entry):
+        """Saves the cache entry to the disk.
+
+            The entry is written to a temporary file first, and then moved in place,
+            so that the other processes never read a partially written entry.
+
+            Args:
+                key     (str)   --  key of the cache entry
+
+                entry   (tuple) --  (expiry time, response)
+
+        """
+        path = self._path(key)
+        temp_path = '{0}.{1}.tmp'.format(path, os.getpid())
+
+        try:
+            with open(temp_path, 'wb') as cache_file:
+                cache_file.write(self._dump_entry(entry))
+
+            os.replace(temp_path, path)
+        except (IOError, OSError, TypeError, ValueError):
+            # pass silently, the entry is still cached in memory
+            pass
+
+    def _discard(self):
+        """Removes all the cache entries from the disk."""
+        for file_name in os.listdir(self._directory):
+            if file_name.endswith('.cache'):
+                try:
+                    os.remove(os.path.join(self._directory, file_name))
+                except OSError:
+                    pass
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# --------------------------------------------------------------------------
+
+"""File for the response of the REST API calls made via the SDK.
+
+The SDK calls **response.json()** multiple times on the same response, to check for and read
+the different keys of the response. JSONResponse decodes the body only once, on the first call,
+and returns the decoded value on all the subsequent calls. The decoded value is shared by all
+the calls on the same response, and should be treated as read only, the caller should copy it
+before modifying it.
+
+The body is decoded with the **json** module by default. The faster **orjson** decoder can be
+enabled via **use_orjson()**, if it is installed, the bodies orjson fails to decode, e.g., with
+integers larger than 64 bits, are decoded with the json module instead.
+Any other decoder can be plugged in via **set_json_decoder()**.
+
+For very large responses requested with **stream=True**, the items of a list in the body can be
+decoded one at a time via **JSONResponse.iter_json()**, if **ijson** is installed.
+
+
+JSONResponse:
+=============
+
+    json()                      --  returns the decoded JSON body of the response
+
+    iter_json()                 --  generator to decode the items of a list in the JSON body
+    one at a time
+
+    __copy__()                  --  returns a copy of the response, which decodes its body again
+
+
+set_json_decoder()          --  sets the function to decode the JSON body of the responses with
+
+get_json_decoder()          --  returns the function used to decode the JSON body
+
+use_orjson()                --  enables / disables the decoding of the JSON body with orjson
+
+"""
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+
+import json
+import re
+
+from requests import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# numbers of 20 or more digits, which orjson can not decode to an int without losing precision
+_LONG_NUMBER = re.compile(b'[0-9]{20}')
+
+
+def _decode(content):
+    """Decodes the JSON content of the response via the standard json module.
+
+        Args:
+            content     (bytes)     --  body of the response
+
+        Returns:
+            object  -   decoded JSON value
+
+    """
+    return json.loads(content.decode('utf-8-sig'))
+
+
+def _decode_orjson(content):
+    """Decodes the JSON content of the response via orjson.
+
+        The content is decoded via the standard json module, if orjson fails to decode it, as
+        orjson is stricter than the json module, e.g., for a byte order mark, or if it has any
+        number of 20 or more digits, which orjson decodes to a float if it exceeds 64 bits.
+
+        Args:
+            content     (bytes)     --  body of the response
+
+        Returns:
+            object  -   decoded JSON value
+
+    """
+    if _LONG_NUMBER.search(content):
+        return _decode(content)
+
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return _decode(content)
+
+
+_JSON_DECODER = _decode
+
+
+def set_json_decoder(decoder):
+    """Sets the function to decode the JSON body of the responses with.
+
+        Args:
+            decoder     (callable)  --  function which takes the body as bytes, and returns the
+            decoded value, raising a ValueError for invalid JSON
+
+                None, to reset to the default decoder, i.e., the standard json module
+
+    """
+    global _JSON_DECODER
+
+    if decoder is None:
+        decoder = _decode
+
+    _JSON_DECODER = decoder
+
+
+def get_json_decoder():
+    """Returns the function used to decode the JSON body of the responses."""
+    return _JSON_DECODER
+
+
+def use_orjson(enable=True):
+    """Enables / disables the decoding of the JSON body of the responses with orjson.
+
+        Args:
+            enable  (bool)  --  boolean specifying whether to decode the JSON body with orjson,
+            or with the standard json module
+
+                default: True
+
+        Returns:
+            bool    -   boolean specifying whether the JSON body is decoded with orjson
+
+                False, if orjson is not installed
+
+    """
+    enable = enable and orjson is not None
+    set_json_decoder(_decode_orjson if enable else None)
+    return enable
+
+
+class JSONResponse(Response):
+    """Class for the response of a REST API call, which decodes its JSON body only once."""
+
+    _UNDECODED = object()
+
+    def json(self, **kwargs):
+        """Returns the decoded JSON body of the response.
+
+            The body is decoded on the first call, and the same value is returned on the
+            subsequent calls. The value is read only, and must be copied by the caller before
+            modifying it, as the other callers reading the response would see the changes.
+
+            Args:
+                **kwargs    --  keyword arguments for **json.loads**, the body is decoded again
+                with the requests decoder, if any are given
+
+            Returns:
+                object  -   decoded JSON value
+
+            Raises:
+                ValueError:
+                    if the body is not a valid JSON
+
+        """
+        if kwargs:
+            return super(JSONResponse, self).json(**kwargs)
+
+        decoded = self.__dict__.get('_decoded', self._UNDECODED)
+
+        if decoded is self._UNDECODED:
+            if self.encoding and self.encoding.lower().replace('-', '') not in ('utf8', 'utf8sig'):
+                decoded = super(JSONResponse, self).json()
+            else:
+                decoded = _JSON_DECODER(self.content)
+
+            self.__dict__['_decoded'] = decoded
+
+        return decoded
+
+    def iter_json(self, prefix='item'):
+        """Generator to decode the items of a list in the JSON body one at a time.
+
+            If the response was requested with **stream=True** and **ijson** is installed, the
+            items are decoded as the body is received, without loading the full body in memory.
+            Otherwise the body is decoded once, and the items of the list are yielded.
+
+            Args:
+                prefix  (str)   --  ijson prefix of the items to yield
+
+                    e.g.:   'jobs.item'
+
+                    default: 'item', items of the list at the root of the body
+
+            Yields:
+                object  -   decoded value of each item of the list
+
+        """
+        if ijson is not None and not self._content_consumed:
+            for item in ijson.items(self.raw, prefix):
+                yield item
+
+            return
+
+        value = self.json()
+
+        for key in prefix.split('.'):
+            if key == 'item':
+                break
+
+            value = value[key]
+
+        for item in value:
+            yield item
+
+    def __copy__(self):
+        """Returns a copy of the response, which decodes its body again on first use."""
+        response = JSONResponse()
+        response.__dict__.update(self.__dict__)
+        response.__dict__.pop('_decoded', None)
+        return response
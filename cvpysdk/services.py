@@ -77,6 +77,7 @@ SERVICES_DICT_TEMPLATE = {
     'INSTANCE': '{0}Instance/%s',
 
     'GET_ALL_SUBCLIENTS': '{0}Subclient?clientId=%s&applicationId=%s&propertyLevel=20',
+    'GET_CLIENT_SUBCLIENTS': '{0}Subclient?clientId=%s&propertyLevel=%s',
     'ADD_SUBCLIENT': '{0}Subclient',
     'SUBCLIENT': '{0}Subclient/%s',
     'SUBCLIENT_BACKUP': '{0}Subclient/%s/action/backup?backupLevel=%s',
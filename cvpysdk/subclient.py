@@ -18,7 +18,10 @@
 
 """Main file for performing subclient operations.
 
-Subclients and Subclient are 2 classes defined in this file.
+SubclientIndex, Subclients, and Subclient are 3 classes defined in this file.
+
+SubclientIndex: Class for the index of all the subclients of a client, fetched once and shared
+by all the Agents / Instances / Backupsets of the client
 
 Subclients: Class for representing all the subclients associated with a backupset / instance
 
@@ -40,7 +43,17 @@ Subclients:
     __getitem__()               --  returns the name of the subclient for the given subclient Id
     or the details for the given subclient name
 
-    _get_subclients()           --  gets all the subclients associated with the backupset specified
+    _get_subclients()           --  gets all the subclients associated with the backupset specified,
+    from the subclient index of the client
+
+    _load_subclients()          --  loads the subclients from the subclient index of the client,
+    on their first use
+
+    _can_run_backup()           --  checks from the fetched properties, whether backup can be run
+    for the subclient
+
+    _get_prefetched()           --  returns the subclient object, initialized from the properties
+    fetched with the list of subclients
 
     _process_add_request()      --  to post the add client request
 
@@ -67,6 +80,27 @@ Subclients:
     refresh()                   --  refresh the subclients associated with the Backupset / Instance
 
 
+SubclientIndex:
+===============
+    __init__(client_object)     --  initialise object of the index of all the subclients
+    of the client
+
+    __repr__()                  --  returns the string for the instance of the SubclientIndex class
+
+    _get_subclients()           --  gets all the subclients of the client, partitioned by the
+    agent, instance, and backupset
+
+    get()                       --  returns the subclients of the given agent, instance,
+    and backupset
+
+    refresh()                   --  discards the subclients fetched, to fetch them again
+
+SubclientIndex Attributes
+-------------------------
+
+    **property_level**          --  returns the property level the subclients are fetched with
+
+
 Subclient:
 ==========
     __init__()                  --  initialise instance of the Subclient class,
@@ -118,11 +152,20 @@ Subclient:
     browse()                    --  gets the content of the backup for this subclient
     at the path specified
 
+    browse_async()              --  gets the content of the backup for this subclient
+    in the background
+
     browse_in_time()            --  gets the content of the backup for this subclient
     at the input path in the time range specified
 
     find()                      --  searches a given file/folder name in the subclient content
 
+    iter_browse()               --  generator to get the content of the backup for this subclient
+    page by page
+
+    iter_find()                 --  generator to search a given file/folder name in the subclient
+    content page by page
+
     restore_in_place()          --  Restores the files/folders specified in the
     input paths list to the same location
 
@@ -162,29 +205,208 @@ from __future__ import absolute_import
 from __future__ import unicode_literals
 
 import math
+import threading
 import time
 import copy
 from base64 import b64encode
 from past.builtins import basestring
 from future.standard_library import install_aliases
+from .backoff import run_async
 from .job import Job
 from .job import JobController
 from .schedules import Schedules
 from .exception import SDKException
 from .schedules import SchedulePattern
+from .lookup_table import LookupTable
 
 install_aliases()
 
+# properties fetched with the list of subclients, for the Subclient being initialized on this
+# thread by Subclients._get_prefetched(), instead of requesting them again
+_PREFETCHED_PROPERTIES = threading.local()
+
+
+class SubclientIndex(object):
+    """Class for the index of all the subclients of a client, fetched once, and shared by all
+        the Agents / Instances / Backupsets of the client.
+    """
+
+    BASIC_PROPERTY_LEVEL = 10
+    """int:     property level to fetch only the names and ids of the subclients"""
+
+    DEFAULT_PROPERTY_LEVEL = 20
+    """int:     property level to fetch the common properties of the subclients as well"""
+
+    def __init__(self, client_object, property_level=DEFAULT_PROPERTY_LEVEL):
+        """Initialize the SubclientIndex object for the given client.
+
+            Args:
+                client_object   (object)    --  instance of the Client class
+
+                property_level  (int)       --  property level to fetch the subclients with,
+                if not given in the calls to **get()**
+
+                    default: 20
+
+            Returns:
+                object  -   instance of the SubclientIndex class
+
+        """
+        self._client_object = client_object
+        self._commcell_object = client_object._commcell_object
+
+        self._cvpysdk_object = self._commcell_object._cvpysdk_object
+        self._services = self._commcell_object._services
+        self._update_response_ = self._commcell_object._update_response_
+
+        self._property_level = property_level
+
+        self._subclients = None
+        self._fetched_level = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        """Representation string for the instance of the SubclientIndex class."""
+        return 'SubclientIndex class instance for Client: "{0}"'.format(
+            self._client_object.client_name
+        )
+
+    def _get_subclients(self, property_level):
+        """Gets all the subclients of the client, partitioned by the agent, instance, and
+            backupset they belong to.
+
+            Args:
+                property_level  (int)   --  property level to fetch the subclients with
+
+            Returns:
+                dict    -   list of subclient properties for each (agent, instance, backupset)
+
+                    {
+                        ('file system', 'defaultinstancename', 'defaultbackupset'): [
+                            subclient1_properties,
+
+                            subclient2_properties
+                        ]
+                    }
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+
+        """
+        flag, response = self._cvpysdk_object.make_request(
+            'GET', self._services['GET_CLIENT_SUBCLIENTS'] % (
+                self._client_object.client_id, property_level
+            )
+        )
+
+        if flag:
+            if response.json() and 'subClientProperties' in response.json():
+                subclients = {}
+
+                for dictionary in response.json()['subClientProperties']:
+                    entity = dictionary['subClientEntity']
+                    key = (
+                        entity['appName'].lower(),
+                        entity['instanceName'].lower(),
+                        entity['backupsetName'].lower()
+                    )
+                    subclients.setdefault(key, []).append(dictionary)
+
+                return subclients
+            else:
+                raise SDKException('Response', '102')
+        else:
+            raise SDKException('Response', '101', self._update_response_(response.text))
+
+    def get(self, agent_name, instance_name=None, backupset_name=None, property_level=None):
+        """Returns the properties of the subclients of the given agent, instance, and backupset.
+
+            The subclients are fetched only on the first call, or if a higher property level
+            is requested than the one already fetched.
+
+            Args:
+                agent_name      (str)   --  name of the agent
+
+                instance_name   (str)   --  name of the instance,
+                None for the subclients of all the instances of the agent
+
+                    default: None
+
+                backupset_name  (str)   --  name of the backupset,
+                None for the subclients of all the backupsets
+
+                    default: None
+
+                property_level  (int)   --  minimum property level of the properties needed
+
+                    default: None, the property level of the index
+
+            Returns:
+                list    -   properties of the subclients, as returned by the
+                **GET Subclient** API
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+
+        """
+        if property_level is None:
+            property_level = self._property_level
+
+        with self._lock:
+            if self._subclients is None or self._fetched_level < property_level:
+                self._subclients = self._get_subclients(property_level)
+                self._fetched_level = property_level
+
+            subclients = self._subclients
+
+        key = (agent_name.lower(), instance_name, backupset_name)
+        result = []
+
+        for partition, properties in subclients.items():
+            if all(value is None or value.lower() == partition[index]
+                   for index, value in enumerate(key)):
+                result.extend(properties)
+
+        return result
+
+    def refresh(self):
+        """Discards the subclients fetched, so that they are fetched again on the next call."""
+        with self._lock:
+            self._subclients = None
+            self._fetched_level = None
+
+    @property
+    def property_level(self):
+        """Returns the property level the subclients are fetched with, by default."""
+        return self._property_level
+
+    @property_level.setter
+    def property_level(self, value):
+        """Sets the property level to fetch the subclients with, by default."""
+        self._property_level = value
+
 
 class Subclients(object):
     """Class for getting all the subclients associated with a client."""
 
-    def __init__(self, class_object):
+    def __init__(self, class_object, property_level=None):
         """Initialize the Subclients object for the given backupset.
 
             Args:
                 class_object    (object)    --  instance of the Agent / Instance / Backupset class
 
+                property_level  (int)       --  property level to fetch the subclients with,
+                **SubclientIndex.BASIC_PROPERTY_LEVEL** to list only the names and ids of the
+                subclients
+
+                    default: None, the property level of the subclient index of the client
+
             Returns:
                 object  -   instance of the Subclients class
 
@@ -200,27 +422,18 @@ class Subclients(object):
         self._agent_object = None
         self._instance_object = None
         self._backupset_object = None
-        self._url_param = ''
 
         if isinstance(class_object, Agent):
             self._agent_object = class_object
-            self._url_param += self._agent_object.agent_id
 
         elif isinstance(class_object, Instance):
             self._instance_object = class_object
             self._agent_object = self._instance_object._agent_object
-            self._url_param += '{0}&instanceId={1}'.format(
-                self._agent_object.agent_id, self._instance_object.instance_id
-            )
 
         elif isinstance(class_object, Backupset):
             self._backupset_object = class_object
             self._instance_object = class_object._instance_object
             self._agent_object = self._instance_object._agent_object
-            self._url_param += self._agent_object.agent_id
-            self._url_param += '&backupsetId={0}'.format(
-                self._backupset_object.backupset_id
-            )
         else:
             raise SDKException('Subclient', '115')
 
@@ -231,13 +444,15 @@ class Subclients(object):
         self._services = self._commcell_object._services
         self._update_response_ = self._commcell_object._update_response_
 
-        self._SUBCLIENTS = self._services['GET_ALL_SUBCLIENTS'] % (
-            self._client_object.client_id, self._url_param
-        )
-
         self._ADD_SUBCLIENT = self._services['ADD_SUBCLIENT']
 
+        self._property_level = property_level
+
         self._default_subclient = None
+        self._loaded_subclients = None
+        self._subclients_table = None
+        self._common_properties = {}
+        self._subclients_properties = {}
 
         from .subclients.fssubclient import FileSystemSubclient
         from .subclients.bigdataappssubclient import BigDataAppsSubclient
@@ -333,8 +548,6 @@ class Subclients(object):
                 self._agent_object, '_backupset_object'):
             self._backupset_object = self._agent_object._backupset_object
 
-        self.refresh()
-
     def __str__(self):
         """Representation string consisting of all subclients of the backupset.
 
@@ -406,16 +619,17 @@ class Subclients(object):
 
         if value in self.all_subclients:
             return self.all_subclients[value]
-        else:
-            try:
-                return list(
-                    filter(lambda x: x[1]['id'] == value, self.all_subclients.items())
-                )[0][0]
-            except IndexError:
-                raise IndexError('No subclient exists with the given Name / Id')
+
+        subclient_name = self._subclients_lookup.get('id', value)
+
+        if subclient_name is None:
+            raise IndexError('No subclient exists with the given Name / Id')
+
+        return subclient_name
 
     def _get_subclients(self):
-        """Gets all the subclients associated to the client specified by the backupset object.
+        """Gets all the subclients associated to the Agent / Instance / Backupset, from the
+            subclient index of the client.
 
             Returns:
                 dict - consists of all subclients in the backupset
@@ -436,107 +650,135 @@ class Subclients(object):
 
                     if response is not success
         """
-        flag, response = self._cvpysdk_object.make_request(
-            'GET', self._SUBCLIENTS)
+        instance_name = None
+        backupset_name = None
 
-        if flag:
-            if response.json() and 'subClientProperties' in response.json():
-                return_dict = {}
+        # filter the subclients by exact name of all the entities selected by the user earlier:
+        # Agent, Instance, and Backupset
+        if self._instance_object is not None:
+            instance_name = self._instance_object.instance_name
 
-                for dictionary in response.json()['subClientProperties']:
-                    # store the agent, instance, and backupset name for the current subclient
-                    # the API call returns the subclients for all Agents, so we need to filter
-                    # them out based on the Agent / Instance / Backupset that had been selected
-                    # by the user earlier
-                    agent = dictionary['subClientEntity']['appName'].lower()
-                    instance = dictionary['subClientEntity']['instanceName'].lower(
-                    )
-                    backupset = dictionary['subClientEntity']['backupsetName'].lower(
-                    )
+        if self._backupset_object is not None:
+            backupset_name = self._backupset_object.backupset_name
 
-                    # filter subclients for all entities: Agent, Instance, and Backupset
-                    # as the instance of the Backupset class was passed for Subclients instance
-                    # creation
-                    if self._backupset_object is not None:
-                        if (self._backupset_object.backupset_name in backupset and
-                                self._instance_object.instance_name in instance and
-                                self._agent_object.agent_name in agent):
-                            temp_name = dictionary['subClientEntity']['subclientName'].lower(
-                            )
-                            temp_id = str(
-                                dictionary['subClientEntity']['subclientId']).lower()
-
-                            return_dict[temp_name] = {
-                                "id": temp_id,
-                                "backupset": backupset
-                            }
+        subclients = self._client_object.subclient_index.get(
+            self._agent_object.agent_name,
+            instance_name,
+            backupset_name,
+            self._property_level
+        )
 
-                            if dictionary['commonProperties'].get(
-                                    'isDefaultSubclient'):
-                                self._default_subclient = temp_name
-
-                    elif self._instance_object is not None:
-                        if (self._instance_object.instance_name in instance and
-                                self._agent_object.agent_name in agent):
-                            temp_name = dictionary['subClientEntity']['subclientName'].lower(
-                            )
-                            temp_id = str(
-                                dictionary['subClientEntity']['subclientId']).lower()
-
-                            if len(
-                                    self._instance_object.backupsets.all_backupsets) > 1:
-                                temp_name = "{0}\\{1}".format(
-                                    backupset, temp_name)
-
-                            return_dict[temp_name] = {
-                                "id": temp_id,
-                                "backupset": backupset
-                            }
+        return_dict = {}
+        self._common_properties = {}
+        self._subclients_properties = {}
 
-                            if dictionary['commonProperties'].get(
-                                    'isDefaultSubclient'):
-                                self._default_subclient = temp_name
-
-                    elif self._agent_object is not None:
-                        if self._agent_object.agent_name in agent:
-                            temp_name = dictionary['subClientEntity']['subclientName'].lower(
-                            )
-                            temp_id = str(
-                                dictionary['subClientEntity']['subclientId']).lower()
-
-                            if len(self._agent_object.instances.all_instances) > 1:
-                                if len(
-                                        self._instance_object.backupsets.all_backupsets) > 1:
-                                    temp_name = "{0}\\{1}\\{2}".format(
-                                        instance, backupset, temp_name
-                                    )
-                                else:
-                                    temp_name = "{0}\\{1}".format(
-                                        instance, temp_name)
-                            else:
-                                if len(
-                                        self._instance_object.backupsets.all_backupsets) > 1:
-                                    temp_name = "{0}\\{1}".format(
-                                        backupset, temp_name)
-
-                            return_dict[temp_name] = {
-                                "id": temp_id,
-                                "backupset": backupset
-                            }
+        for dictionary in subclients:
+            instance = dictionary['subClientEntity']['instanceName'].lower()
+            backupset = dictionary['subClientEntity']['backupsetName'].lower()
+
+            temp_name = dictionary['subClientEntity']['subclientName'].lower()
+            temp_id = str(dictionary['subClientEntity']['subclientId']).lower()
 
-                            if dictionary['commonProperties'].get(
-                                    'isDefaultSubclient'):
-                                self._default_subclient = temp_name
+            # prefix the subclient name with the instance / backupset name, if the subclients
+            # are listed for the Agent / Instance, and it has more than one of them
+            if self._backupset_object is not None:
+                pass
+
+            elif self._instance_object is not None:
+                if len(self._instance_object.backupsets.all_backupsets) > 1:
+                    temp_name = "{0}\\{1}".format(backupset, temp_name)
 
-                return return_dict
             else:
-                raise SDKException('Response', '102')
-        else:
-            raise SDKException(
-                'Response',
-                '101',
-                self._update_response_(
-                    response.text))
+                if len(self._agent_object.instances.all_instances) > 1:
+                    if len(self._instance_object.backupsets.all_backupsets) > 1:
+                        temp_name = "{0}\\{1}\\{2}".format(instance, backupset, temp_name)
+                    else:
+                        temp_name = "{0}\\{1}".format(instance, temp_name)
+                else:
+                    if len(self._instance_object.backupsets.all_backupsets) > 1:
+                        temp_name = "{0}\\{1}".format(backupset, temp_name)
+
+            return_dict[temp_name] = {
+                "id": temp_id,
+                "backupset": backupset
+            }
+
+            # common properties are not returned with the basic property level
+            common_properties = dictionary.get('commonProperties', {})
+            self._common_properties[temp_name] = common_properties
+            self._subclients_properties[temp_name] = dictionary
+
+            if common_properties.get('isDefaultSubclient'):
+                self._default_subclient = temp_name
+
+        return return_dict
+
+    def _can_run_backup(self, subclient_name):
+        """Checks from the subclient properties already fetched with the list of subclients,
+            whether backup can be run for the subclient, i.e., backup activity is enabled and
+            storage policy is set for it.
+
+            Args:
+                subclient_name  (str)   --  name of the subclient
+
+            Returns:
+                bool    -   boolean specifying whether backup can be run for the subclient
+
+                None    -   if it can not be decided from the properties fetched
+
+        """
+        # the common properties are read along with the list of subclients
+        self._load_subclients(reload=False)
+
+        common_properties = self._common_properties.get(subclient_name.lower()) or {}
+
+        if common_properties.get('enableBackup') is False:
+            return False
+
+        storage_device = common_properties.get('storageDevice', {})
+        storage_policy = storage_device.get('dataBackupStoragePolicy', {})
+
+        if common_properties.get('enableBackup') and 'storagePolicyName' in storage_policy:
+            return True
+
+        return None
+
+    def _get_prefetched(self, subclient_name):
+        """Returns the Subclient object for the given subclient, initialized from the properties
+            already fetched with the list of subclients, instead of requesting them again.
+
+            The properties are requested as done by **get()**, if only the names and ids of the
+            subclients were fetched.
+
+            Args:
+                subclient_name  (str)   --  name of the subclient
+
+            Returns:
+                object  -   instance of the Subclient class for the given subclient name
+
+            Raises:
+                SDKException:
+                    if type of the subclient name argument is not string
+
+                    if no subclient exists with the given name
+
+        """
+        if not isinstance(subclient_name, basestring):
+            raise SDKException('Subclient', '101')
+
+        self._load_subclients(reload=False)
+
+        properties = self._subclients_properties.get(subclient_name.lower())
+
+        if not properties or 'commonProperties' not in properties:
+            return self.get(subclient_name)
+
+        _PREFETCHED_PROPERTIES.properties = properties
+
+        try:
+            return self.get(subclient_name)
+        finally:
+            _PREFETCHED_PROPERTIES.properties = None
 
     @property
     def all_subclients(self):
@@ -1362,13 +1604,49 @@ class Subclients(object):
                     subclient_name)
             )
 
+    def _load_subclients(self, reload=True):
+        """Loads the subclients associated with the Backupset / Instance from the subclient
+            index of the client.
+
+            Args:
+                reload  (bool)  --  whether to load the subclients again, if already loaded
+
+                    default: True
+
+        """
+        if reload or self._loaded_subclients is None:
+            subclients = self._get_subclients()
+            self._subclients_table = LookupTable.from_dict(subclients, 'id')
+            self._loaded_subclients = subclients
+
     def refresh(self):
-        """Refresh the subclients associated with the Backupset / Instance."""
-        self._subclients = self._get_subclients()
+        """Refresh the subclients associated with the Backupset / Instance.
+
+            The subclient index of the client is fetched again, and the subclients are loaded
+            from it on their next use.
+        """
+        self._client_object.subclient_index.refresh()
+        self._loaded_subclients = None
+        self._subclients_table = None
+
+    @property
+    def _subclients(self):
+        """Returns the subclients associated with the Backupset / Instance, loading them from
+            the subclient index of the client on the first use.
+        """
+        self._load_subclients(reload=False)
+        return self._loaded_subclients
+
+    @property
+    def _subclients_lookup(self):
+        """Returns the LookupTable of the subclients, loading them on the first use."""
+        self._load_subclients(reload=False)
+        return self._subclients_table
 
     @property
     def default_subclient(self):
         """Returns the name of the default subclient for the selected Agent and Backupset."""
+        self._load_subclients(reload=False)
         return self._default_subclient
 
 
@@ -1474,41 +1752,50 @@ class Subclient(object):
     def _get_subclient_properties(self):
         """Gets the subclient properties of this subclient.
 
+            The properties already fetched with the list of subclients are used instead, if the
+            subclient is being initialized by **Subclients._get_prefetched()**.
+
             Raises:
                 SDKException:
                     if response is empty
 
                     if response is not success
         """
+        prefetched = getattr(_PREFETCHED_PROPERTIES, 'properties', None)
 
-        flag, response = self._cvpysdk_object.make_request(
-            'GET', self._SUBCLIENT)
-
-        if flag:
-            if response.json() and 'subClientProperties' in response.json():
-                self._subclient_properties = response.json()[
-                    'subClientProperties'][0]
+        if (prefetched is not None and
+                str(prefetched['subClientEntity']['subclientId']) == self.subclient_id):
+            # used only once, for the initialization of this subclient
+            _PREFETCHED_PROPERTIES.properties = None
+            self._subclient_properties = copy.deepcopy(prefetched)
+        else:
+            flag, response = self._cvpysdk_object.make_request(
+                'GET', self._SUBCLIENT)
 
-                if 'commonProperties' in self._subclient_properties:
-                    self._commonProperties = self._subclient_properties['commonProperties']
+            if flag:
+                if response.json() and 'subClientProperties' in response.json():
+                    self._subclient_properties = response.json()[
+                        'subClientProperties'][0]
+                else:
+                    raise SDKException('Response', '102')
+            else:
+                raise SDKException(
+                    'Response',
+                    '101',
+                    self._update_response_(
+                        response.text))
 
-                if 'subClientEntity' in self._subclient_properties:
-                    self._subClientEntity = self._subclient_properties['subClientEntity']
+        if 'commonProperties' in self._subclient_properties:
+            self._commonProperties = self._subclient_properties['commonProperties']
 
-                if 'proxyClient' in self._subclient_properties:
-                    self._proxyClient = self._subclient_properties['proxyClient']
+        if 'subClientEntity' in self._subclient_properties:
+            self._subClientEntity = self._subclient_properties['subClientEntity']
 
-                if 'planEntity' in self._subclient_properties:
-                    self._planEntity = self._subclient_properties['planEntity']
+        if 'proxyClient' in self._subclient_properties:
+            self._proxyClient = self._subclient_properties['proxyClient']
 
-            else:
-                raise SDKException('Response', '102')
-        else:
-            raise SDKException(
-                'Response',
-                '101',
-                self._update_response_(
-                    response.text))
+        if 'planEntity' in self._subclient_properties:
+            self._planEntity = self._subclient_properties['planEntity']
 
     def _set_subclient_properties(self, attr_name, value):
         """sets the properties of this sub client.value is updated to instance once when post call
@@ -2400,6 +2687,22 @@ c
 
         return self._backupset_object.browse(options)
 
+    def browse_async(self, *args, **kwargs):
+        """Gets the content of the backup for this subclient in the background.
+
+            Args:
+                same as browse
+
+            Kwargs:
+                same as browse
+
+            Returns:
+                object  -   instance of the **concurrent.futures.Future** class, resolved with
+                the value returned by browse
+
+        """
+        return run_async(self.browse, *args, **kwargs)
+
     def find(self, *args, **kwargs):
         """Searches a file/folder in the backed up content of the subclient,
             and returns all the files matching the filters given.
@@ -2463,6 +2766,82 @@ c
 
         return self._backupset_object.find(options)
 
+    def iter_browse(self, *args, **kwargs):
+        """Generator to browse the content of the Subclient, one page at a time.
+
+            Args:
+                Dictionary of browse options, same as browse
+
+            Kwargs:
+                Keyword argument of browse options, same as browse
+
+                Additional options supported:
+                    page_size       (int)   --  number of items to fetch in a single request
+
+                        default: 1000
+
+                    prefetch        (int)   --  number of pages to fetch concurrently, ahead of
+                    the page being consumed
+
+                        default: 2
+
+            Yields:
+                tuple   -   (path, metadata) of each file / folder retrieved from browse
+
+            Refer `default_browse_options`_ for all the supported options.
+
+            .. _default_browse_options: https://github.com/CommvaultEngg/cvpysdk/blob/master/cvpysdk/backupset.py#L565
+
+        """
+        if args and isinstance(args[0], dict):
+            options = dict(args[0])
+        else:
+            options = kwargs
+
+        options['_subclient_id'] = self._subclient_id
+
+        return self._backupset_object.iter_browse(options)
+
+    def iter_find(self, *args, **kwargs):
+        """Generator to search a file/folder in the backed up content of the subclient,
+            one page at a time.
+
+            A find across the full content of the subclient is streamed in constant memory,
+            as only the pages being fetched are held in memory.
+
+            Args:
+                Dictionary of browse options, same as find
+
+            Kwargs:
+                Keyword argument of browse options, same as find
+
+                Additional options supported:
+                    page_size       (int)   --  number of items to fetch in a single request
+
+                        default: 1000
+
+                    prefetch        (int)   --  number of pages to fetch concurrently, ahead of
+                    the page being consumed
+
+                        default: 2
+
+            Yields:
+                tuple   -   (path, metadata) of each file / folder matching the filters given
+
+            Refer `default_browse_options`_ for all the supported options.
+
+            .. _default_browse_options: https://github.com/CommvaultEngg/cvpysdk/blob/master/cvpysdk/backupset.py#L565
+
+        """
+        if args and isinstance(args[0], dict):
+            options = dict(args[0])
+        else:
+            options = kwargs
+
+        options['_subclient_id'] = self._subclient_id
+
+        return self._backupset_object.iter_find(options)
+
     def restore_in_place(
             self,
             paths,
@@ -864,7 +864,7 @@ class UsermailboxSubclient(ExchangeSubclient):
             client_name = client_name.lower()
             client_obj = self._commcell_object.clients.get(client_name)
 
-            client_dict = {"commCellId": int(self._commcell_object._id),
+            client_dict = {"commCellId": int(self._commcell_object.commcell_id),
                            "commcellName": self._commcell_object.commserv_name,
                            "clientName": client_name,
                            "clientId": int(client_obj.client_id)
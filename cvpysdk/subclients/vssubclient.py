@@ -1140,7 +1140,8 @@ class VirtualServerSubclient(Subclient):
                vm_disk_browse=False,
                vm_files_browse=False,
                operation='browse',
-               copy_precedence=0
+               copy_precedence=0,
+               backoff=None
                ):
         """Gets the content of the backup for this subclient at the path
            specified.
@@ -1168,6 +1169,10 @@ class VirtualServerSubclient(Subclient):
 
                 copy_precedence      (int)   -- The copy precedence to do the operation from
 
+                backoff              (object)   -- instance of the Backoff class, to wait for
+                                                   the index to be ready with
+                                                   default: None
+
             Returns:
                 list - list of all folders or files with their full paths
                        inside the input path
@@ -1195,7 +1200,7 @@ class VirtualServerSubclient(Subclient):
                 browse_content = super(VirtualServerSubclient, self).browse(
                     show_deleted_files, vm_disk_browse, True, path=vm_path,
                     vs_file_browse=vm_files_browse, operation=operation,
-                    copy_precedence=copy_precedence
+                    copy_precedence=copy_precedence, backoff=backoff
                 )
                 vm_path_list += browse_content[0]
                 browse_content_dict.update(browse_content[1])
@@ -1205,7 +1210,7 @@ class VirtualServerSubclient(Subclient):
             vm_path = self._parse_vm_path(vm_names, vm_path)
             browse_content = super(VirtualServerSubclient, self).browse(
                 show_deleted_files, vm_disk_browse, True, path=vm_path,
-                vs_file_browse=vm_files_browse, operation=operation
+                vs_file_browse=vm_files_browse, operation=operation, backoff=backoff
             )
 
         if not vm_ids:
@@ -1313,7 +1318,8 @@ class VirtualServerSubclient(Subclient):
             to_date=0,
             copy_precedence=0,
             vm_files_browse=False,
-            media_agent=""):
+            media_agent="",
+            backoff=None):
         """Gets the content of the backup for this subclient
                 at the path specified in the time range specified.
 
@@ -1354,6 +1360,10 @@ class VirtualServerSubclient(Subclient):
                     media_agent         (str)   --  Browse MA via with Browse has to happen.
                                                     It can be MA different than Storage Policy MA
 
+                    backoff             (object)    --  instance of the Backoff class, to wait
+                                                    for the index to be ready with
+                                                    default: None
+
                 Returns:
                     list - list of all folders or files with their full paths
                            inside the input path
@@ -1382,7 +1392,8 @@ class VirtualServerSubclient(Subclient):
             show_deleted=show_deleted_files, restore_index=restore_index,
             vm_disk_browse=vm_disk_browse,
             from_time=from_date, to_time=to_date, copy_precedence=copy_precedence,
-            path=vm_path, vs_file_browse=vm_files_browse, media_agent=media_agent)
+            path=vm_path, vs_file_browse=vm_files_browse, media_agent=media_agent,
+            backoff=backoff)
         if not vm_ids:
             for key, val in browse_content[1].items():
                 vm_ids[val['snap_display_name']] = val['name']
@@ -1470,7 +1481,8 @@ class VirtualServerSubclient(Subclient):
             from_date=0,
             to_date=0,
             copy_precedence=0,
-            media_agent=""):
+            media_agent="",
+            backoff=None):
         """Browses the Files and Folders inside a Virtual Machine in the time
            range specified.
 
@@ -1507,6 +1519,10 @@ class VirtualServerSubclient(Subclient):
                 media_agent         (str)   --  Browse MA via with Browse has to happen.
                                                 It can be MA different than Storage Policy MA
 
+                backoff             (object)    --  instance of the Backoff class, to wait
+                                                for the index to be ready with
+                                                default: None
+
             Returns:
                 list - list of all folders or files with their full paths
                        inside the input path
@@ -1530,7 +1546,7 @@ class VirtualServerSubclient(Subclient):
         """
         return self.browse_in_time(
             vm_path, show_deleted_files, restore_index, False, from_date, to_date, copy_precedence,
-            vm_files_browse=True, media_agent=media_agent)
+            vm_files_browse=True, media_agent=media_agent, backoff=backoff)
 
     def _check_folder_in_browse(
             self,
@@ -460,7 +460,7 @@ class WorkFlows(object):
                 raise SDKException('Workflow', '103')
 
         flag, response = self._cvpysdk_object.make_request(
-            'POST', self._WORKFLOWS, workflow_xml
+            'POST', self._WORKFLOWS, workflow_xml, content_type='application/xml'
         )
 
         self.refresh()
@@ -57,6 +57,10 @@ setup(
     keywords='commvault, python, sdk, cv, simpana, commcell, cvlt, webconsole',
     include_package_data=True,
     install_requires=['requests', 'future', 'xmltodict'],
+    extras_require={
+        'fast-json': ['orjson'],
+        'stream-json': ['ijson']
+    },
     zip_safe=False,
     project_urls={
         'Bug Tracker': 'https://github.com/CommvaultEngg/cvpysdk/issues',
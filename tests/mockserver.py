@@ -0,0 +1,1017 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Local stand-in for the WebConsole REST API, to run the SDK without a live Commcell.
+
+MockCommServe is a threaded HTTP server, serving canned JSON responses for the REST APIs on the
+hot paths of the SDK, i.e., Login, RenewLoginToken, WhoAmI, Client, Agent, Backupset, Subclient,
+Subclient backup, Schedules, Job, Job actions, Jobs, JobDetails, DoBrowse, file upload, the
+Datacube APIs to list the datasources and the handlers, execute a handler, and import data, and
+the Solr select API of the Index server nodes. The number of entities returned by the APIs, and
+the latency of each response are configurable, and the number of requests received for each API
+is counted.
+
+The requests are authenticated with the Authtoken received on login. **expire_token()** expires
+the current token, after which the requests get the 401 response, until the token is renewed.
+
+**fail_requests()** fails the next requests to an API, with an error or a malformed response,
+**stall_requests()** delays the response of the next requests to an API, after processing them,
+and **set_job_status()** sets the status of a job, all the jobs are Completed by default.
+
+The Datacube has a single datasource **datasource1**, with the handlers **handler1** to
+**handler3**, and the documents imported to it are stored by the server.
+
+The Commcell has a single Index server **indexserver1**, with the configured number of nodes,
+**isnode1** onwards, which are served under the **IndexNode** API, e.g., IndexNode/1/solr/core1.
+The Solr documents are spread across the nodes round-robin, and every core of a node has the same
+documents. The select API supports the field:value clauses joined by AND, the sort, start, rows,
+cursorMark, fl, and facet.field params, and the parameters of each select request are recorded.
+
+Every client has a single **File System** agent, with the **DefaultInstanceName** instance,
+and the configured number of backupsets, each with the configured number of subclients.
+
+Usage:
+
+    >>> from mockserver import MockCommServe
+
+    >>> with MockCommServe(clients=100, jobs=1000, latency=0.005) as server:
+    ...     commcell = Commcell(**server.commcell_kwargs)
+    ...     client = commcell.clients.get('client1')
+    ...     print(server.request_counts)
+
+"""
+
+import json
+import sys
+import threading
+import time
+
+from base64 import b64decode
+from base64 import b64encode
+
+from socketserver import ThreadingMixIn
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+
+API_PREFIX = '/webconsole/api/'
+
+FS_APPLICATION_ID = 33
+DEFAULT_INSTANCE_ID = 1
+
+ID_FACTOR = 1000
+"""int:     factor to encode the id of the parent entity in the id of its child entities"""
+
+UNAUTHENTICATED_APIS = ('', 'Login', 'RenewLoginToken')
+"""tuple:   APIs served without validating the Authtoken of the request"""
+
+DATASOURCE_ID = 1
+DATASOURCE_NAME = 'datasource1'
+HANDLERS = 3
+
+INDEX_SERVER_NAME = 'indexserver1'
+SOLR_FILE_TYPES = ('pdf', 'docx', 'txt')
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    """HTTP server handling each request on a separate thread."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    # the default backlog of 5 drops the connections opened at once by a pool of workers
+    request_queue_size = 128
+
+    def handle_error(self, request, client_address):
+        """Ignores the connections closed by the client, e.g., after a read timeout."""
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            HTTPServer.handle_error(self, request, client_address)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Handler for the requests received by the MockCommServe server."""
+
+    protocol_version = 'HTTP/1.1'
+
+    # the headers and the body are written separately, and must not wait for the delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        """Suppresses the logging of every request to stderr."""
+
+    def _handle(self, method):
+        """Reads the request, and writes the response built by the MockCommServe server."""
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+
+        status, payload = self.server.commserve.handle(method, self.path, body, self.headers)
+
+        if isinstance(payload, (dict, list)):
+            content = json.dumps(payload).encode('utf-8')
+            content_type = 'application/json;charset=utf-8'
+        else:
+            content = payload.encode('utf-8')
+            content_type = 'text/plain;charset=utf-8'
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        """Handles the GET requests."""
+        self._handle('GET')
+
+    def do_POST(self):
+        """Handles the POST requests."""
+        self._handle('POST')
+
+
+class MockCommServe(object):
+    """Class for the local stand-in of the WebConsole REST API of a Commcell."""
+
+    def __init__(
+            self,
+            clients=10,
+            backupsets=1,
+            subclients=2,
+            jobs=100,
+            browse_items=1000,
+            index_nodes=2,
+            solr_documents=100,
+            latency=0.0,
+            host='127.0.0.1',
+            port=0):
+        """Initialize the MockCommServe object with the number of entities to serve.
+
+            Args:
+                clients         (int)   --  number of clients in the commcell
+
+                    default: 10
+
+                backupsets      (int)   --  number of backupsets of each client
+
+                    default: 1
+
+                subclients      (int)   --  number of subclients of each backupset
+
+                    default: 2
+
+                jobs            (int)   --  number of jobs in the commcell
+
+                    default: 100
+
+                browse_items    (int)   --  number of items returned by the browse of any path
+
+                    default: 1000
+
+                index_nodes     (int)   --  number of nodes of the Index server
+
+                    default: 2
+
+                solr_documents  (int)   --  number of Solr documents across all the nodes
+
+                    default: 100
+
+                latency         (float) --  seconds to wait for, before sending each response
+
+                    default: 0.0
+
+                host            (str)   --  address to run the server on
+
+                    default: 127.0.0.1
+
+                port            (int)   --  port to run the server on,
+                0 to pick any free port
+
+                    default: 0
+
+            Returns:
+                object  -   instance of the MockCommServe class
+
+        """
+        self.clients = clients
+        self.backupsets = backupsets
+        self.subclients = subclients
+        self.jobs = jobs
+        self.browse_items = browse_items
+        self.index_nodes = index_nodes
+        self.solr_documents = solr_documents
+        self.latency = latency
+
+        self._host = host
+        self._port = port
+
+        self._server = None
+        self._thread = None
+
+        self._request_counts = {}
+        self._lock = threading.Lock()
+
+        self._token_version = 0
+
+        self._job_statuses = {}
+        self._failures = {}
+        self._stalls = {}
+        self._documents = []
+        self._solr_queries = []
+        self._backups = []
+
+        self._routes = {
+            ('GET', ''): self._service,
+            ('POST', 'Login'): self._login,
+            ('POST', 'Logout'): self._logout,
+            ('POST', 'RenewLoginToken'): self._renew_login_token,
+            ('POST', 'WhoAmI'): self._who_am_i,
+            ('GET', 'CommServ'): self._commserv,
+            ('GET', 'Client'): self._client,
+            ('GET', 'Agent'): self._agent,
+            ('GET', 'Backupset'): self._backupset,
+            ('GET', 'Subclient'): self._subclient,
+            ('POST', 'Subclient'): self._subclient_backup,
+            ('GET', 'Schedules'): self._schedules,
+            ('GET', 'Job'): self._job,
+            ('POST', 'Job'): self._job_action,
+            ('POST', 'Jobs'): self._jobs,
+            ('POST', 'JobDetails'): self._job_details,
+            ('POST', 'DoBrowse'): self._browse,
+            ('POST', 'Client'): self._upload,
+            ('GET', 'dcube'): self._dcube,
+            ('POST', 'dcube'): self._dcube,
+            ('GET', 'IndexingGateway'): self._roles,
+            ('GET', 'IndexNode'): self._solr
+        }
+
+        # routes which get the raw body and the headers of the request, instead of the JSON
+        self._raw_routes = {
+            ('POST', 'Client'): self._upload
+        }
+
+        self._uploads = {}
+        self._uploaded_files = {}
+        self._upload_failures = 0
+        self._upload_failures_written = False
+        self._upload_failures_status = 500
+        self._upload_requests = 0
+
+    def __enter__(self):
+        """Starts the server, and returns the current instance."""
+        self.start()
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        """Stops the server."""
+        self.stop()
+
+    def start(self):
+        """Starts the server on a background thread."""
+        self._server = _ThreadingHTTPServer((self._host, self._port), _RequestHandler)
+        self._server.commserve = self
+
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stops the server, and waits for its thread to exit."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+
+            self._server = None
+            self._thread = None
+
+    def reset_counts(self):
+        """Resets the number of requests received for each API, and the Solr queries recorded."""
+        with self._lock:
+            self._request_counts = {}
+            self._solr_queries = []
+
+    def fail_uploads(self, count, written=False, status=500):
+        """Fails the given number of the next upload requests, with the given status, or with
+            an empty response after writing the chunk received, if **written** is True.
+        """
+        with self._lock:
+            self._upload_failures = count
+            self._upload_failures_written = written
+            self._upload_failures_status = status
+
+    def set_job_status(self, job_id, status):
+        """Sets the status of the job with the given id, all the jobs are Completed by default."""
+        with self._lock:
+            self._job_statuses[job_id] = status
+
+    def fail_requests(self, api, count, payload=None):
+        """Fails the given number of the next requests to the API, e.g., 'POST Jobs', with the
+            500 response, or with the given JSON payload, to return a malformed response.
+        """
+        with self._lock:
+            self._failures[api] = (count, payload)
+
+    def stall_requests(self, api, count, seconds):
+        """Delays the response of the given number of the next requests to the API, e.g.,
+            'POST dcube', by the given seconds, after the requests are processed.
+        """
+        with self._lock:
+            self._stalls[api] = (count, seconds)
+
+    def expire_token(self):
+        """Expires the current Authtoken, the requests made with it get the 401 response."""
+        with self._lock:
+            self._token_version += 1
+
+    def handle(self, method, path, body, headers=None):
+        """Returns the response for the request received by the server.
+
+            Args:
+                method  (str)   --  HTTP method of the request
+
+                path    (str)   --  path of the request, including the query string
+
+                body    (bytes) --  body of the request
+
+                headers (dict)  --  headers of the request
+
+            Returns:
+                tuple   -   (HTTP status code, JSON payload or text of the response)
+
+        """
+        url = urlparse(path)
+        api_path = url.path[len(API_PREFIX):] if url.path.startswith(API_PREFIX) else url.path
+        segments = [segment for segment in api_path.split('/') if segment]
+        api = segments[0] if segments else ''
+
+        with self._lock:
+            key = '{0} {1}'.format(method, api)
+            self._request_counts[key] = self._request_counts.get(key, 0) + 1
+
+            failures, failure_payload = self._failures.get(key, (0, None))
+
+            if failures:
+                self._failures[key] = (failures - 1, failure_payload)
+
+            stalls, stall_time = self._stalls.get(key, (0, 0))
+
+            if stalls:
+                self._stalls[key] = (stalls - 1, stall_time)
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if failures:
+            return (500, 'Request failed') if failure_payload is None else (200, failure_payload)
+
+        route = self._routes.get((method, api))
+
+        if route is None:
+            return 404, 'API not supported by the mock server: {0} {1}'.format(method, api)
+
+        headers = headers or {}
+
+        if api not in UNAUTHENTICATED_APIS and headers.get('Authtoken') != self._token():
+            return 401, 'Authtoken expired'
+
+        query = {key: value[0] for key, value in parse_qs(url.query).items()}
+
+        if (method, api) in self._raw_routes:
+            return self._raw_routes[(method, api)](segments[1:], query, body, headers)
+
+        request_json = json.loads(body.decode('utf-8')) if body else {}
+        result = route(segments[1:], query, request_json)
+
+        if stalls:
+            time.sleep(stall_time)
+
+        return result
+
+    @staticmethod
+    def _client_entity(client_id):
+        """Returns the entity JSON of the client with the given id."""
+        return {
+            'clientId': client_id,
+            'clientName': 'client{0}'.format(client_id),
+            'displayName': 'client{0}'.format(client_id),
+            'hostName': 'client{0}.mock.local'.format(client_id)
+        }
+
+    @staticmethod
+    def _backupset_entity(backupset_id):
+        """Returns the entity JSON of the backupset with the given id."""
+        client_id, index = divmod(backupset_id, ID_FACTOR)
+
+        return {
+            'clientId': client_id,
+            'clientName': 'client{0}'.format(client_id),
+            'appName': 'File System',
+            'applicationId': FS_APPLICATION_ID,
+            'instanceId': DEFAULT_INSTANCE_ID,
+            'instanceName': 'DefaultInstanceName',
+            'backupsetId': backupset_id,
+            'backupsetName': 'defaultBackupSet' if index == 1 else 'backupset{0}'.format(index)
+        }
+
+    def _subclient_entity(self, subclient_id):
+        """Returns the entity JSON of the subclient with the given id."""
+        backupset_id, index = divmod(subclient_id, ID_FACTOR)
+        entity = self._backupset_entity(backupset_id)
+
+        entity.update({
+            'subclientId': subclient_id,
+            'subclientName': 'default' if index == 1 else 'subclient{0}'.format(index)
+        })
+
+        return entity
+
+    def _backupset_ids(self, client_id):
+        """Returns the ids of the backupsets of the client with the given id."""
+        return [client_id * ID_FACTOR + index for index in range(1, self.backupsets + 1)]
+
+    def _subclient_ids(self, backupset_id):
+        """Returns the ids of the subclients of the backupset with the given id."""
+        return [backupset_id * ID_FACTOR + index for index in range(1, self.subclients + 1)]
+
+    def _service(self, segments, query, request_json):
+        """Response for the request to check if the service is running."""
+        return 200, 'true'
+
+    def _token(self):
+        """Returns the Authtoken valid for the requests."""
+        with self._lock:
+            return 'QSDK mocktoken{0}'.format(self._token_version or '')
+
+    def _login(self, segments, query, request_json):
+        """Response for the Login API."""
+        return 200, {
+            'userName': request_json.get('username', 'admin'),
+            'token': self._token()
+        }
+
+    def _renew_login_token(self, segments, query, request_json):
+        """Response for the RenewLoginToken API."""
+        return 200, {'token': self._token()}
+
+    def _logout(self, segments, query, request_json):
+        """Response for the Logout API."""
+        return 200, 'User logged out'
+
+    def _who_am_i(self, segments, query, request_json):
+        """Response for the WhoAmI API, to validate the Authtoken."""
+        return 200, {'user': {'userName': 'admin'}}
+
+    def _commserv(self, segments, query, request_json):
+        """Response for the CommServ API."""
+        return 200, {
+            'hostName': 'client1.mock.local',
+            'currentSPVersion': 24,
+            'csVersionInfo': '11.24.0',
+            'timeZone': '0:-330:(UTC+05:30) Chennai, Kolkata, Mumbai, New Delhi',
+            'csTimeZone': {'TimeZoneName': '(UTC+05:30) Chennai, Kolkata, Mumbai, New Delhi'},
+            'commcell': {
+                'csGUID': '00000000-0000-0000-0000-000000000000',
+                'commCellName': 'client1',
+                'commCellId': 2
+            }
+        }
+
+    def _client(self, segments, query, request_json):
+        """Response for the Client APIs, to list the clients, or get the properties of one."""
+        if query.get('PseudoClientType') == 'VSPseudo':
+            return 200, {'VSPseudoClientsList': []}
+
+        if not segments:
+            return 200, {
+                'clientProperties': [{
+                    'client': {'clientEntity': self._client_entity(client_id)}
+                } for client_id in range(1, self.clients + 1)]
+            }
+
+        client_id = int(segments[0])
+
+        if not 1 <= client_id <= self.clients:
+            return 200, {'errorCode': 2, 'errorMessage': 'Client not found'}
+
+        return 200, {
+            'clientProperties': [{
+                'client': {
+                    'clientEntity': self._client_entity(client_id),
+                    'cvdPort': 8400,
+                    'osInfo': {
+                        'Type': 'Windows',
+                        'SubType': 'Server',
+                        'OsDisplayInfo': {
+                            'ProcessorType': 'WinX64',
+                            'OSName': 'Windows Server 2019 Datacenter'
+                        }
+                    },
+                    'TimeZone': {'TimeZoneName': '(UTC) Coordinated Universal Time'},
+                    'versionInfo': {
+                        'version': 'ServicePack:24.0',
+                        'GalaxyRelease': {'ReleaseString': '11.0'}
+                    },
+                    'installDirectory': 'C:\\Program Files\\Commvault\\ContentStore',
+                    'jobResulsDir': {'path': 'C:\\Program Files\\Commvault\\JobResults'}
+                },
+                'clientProps': {
+                    'activityControl': {
+                        'EnableDataRecovery': True,
+                        'EnableDataManagement': True,
+                        'EnableOnlineContentIndex': False
+                    },
+                    'clientActivityControl': {
+                        'activityControlOptions': [
+                            {'activityType': 1, 'enableActivityType': True},
+                            {'activityType': 2, 'enableActivityType': True},
+                            {'activityType': 16, 'enableActivityType': True}
+                        ]
+                    },
+                    'EnableSnapBackups': False,
+                    'jobStartTime': 0
+                }
+            }]
+        }
+
+    def _agent(self, segments, query, request_json):
+        """Response for the Agent APIs, to list the agents of a client, or get one of them."""
+        client_id = int(query['clientId'])
+
+        return 200, {
+            'agentProperties': [{
+                'idaEntity': {
+                    'clientId': client_id,
+                    'clientName': 'client{0}'.format(client_id),
+                    'appName': 'File System',
+                    'applicationId': FS_APPLICATION_ID
+                },
+                'idaActivityControl': {
+                    'activityControlOptions': [
+                        {'activityType': 1, 'enableActivityType': True},
+                        {'activityType': 2, 'enableActivityType': True}
+                    ]
+                }
+            }]
+        }
+
+    def _backupset(self, segments, query, request_json):
+        """Response for the Backupset APIs, to list the backupsets, or get one of them."""
+        if segments:
+            backupset_ids = [int(segments[0])]
+        else:
+            backupset_ids = self._backupset_ids(int(query['clientId']))
+
+        return 200, {
+            'backupsetProperties': [{
+                'backupSetEntity': self._backupset_entity(backupset_id),
+                'commonBackupSet': {
+                    'isDefaultBackupSet': backupset_id % ID_FACTOR == 1,
+                    'onDemandBackupset': False
+                },
+                'planEntity': {}
+            } for backupset_id in backupset_ids]
+        }
+
+    def _subclient(self, segments, query, request_json):
+        """Response for the Subclient APIs, to list the subclients, or get one of them."""
+        if segments:
+            subclient_ids = [int(segments[0])]
+        else:
+            client_id = int(query['clientId'])
+
+            subclient_ids = [
+                subclient_id
+                for backupset_id in self._backupset_ids(client_id)
+                for subclient_id in self._subclient_ids(backupset_id)
+            ]
+
+        basic = not segments and int(query.get('propertyLevel', 20)) < 20
+        subclients = []
+
+        for subclient_id in subclient_ids:
+            subclient = {'subClientEntity': self._subclient_entity(subclient_id)}
+
+            if not basic:
+                subclient['commonProperties'] = {
+                    'isDefaultSubclient': subclient_id % ID_FACTOR == 1,
+                    'enableBackup': True,
+                    'storageDevice': {
+                        'dataBackupStoragePolicy': {'storagePolicyName': 'mockpolicy'}
+                    }
+                }
+
+            if segments:
+                subclient.update({
+                    'content': [{'path': 'C:\\data{0}'.format(subclient_id)}],
+                    'fsSubClientProp': {},
+                    'planEntity': {}
+                })
+
+            subclients.append(subclient)
+
+        return 200, {'subClientProperties': subclients}
+
+    def _subclient_backup(self, segments, query, request_json):
+        """Response for the Subclient backup API, i.e., Subclient/{id}/action/backup."""
+        with self._lock:
+            self._backups.append(int(segments[0]))
+            job_id = (len(self._backups) - 1) % self.jobs + 1
+
+        return 200, {'jobIds': [str(job_id)]}
+
+    def _schedules(self, segments, query, request_json):
+        """Response for the Schedules API, as no schedules are configured for any entity."""
+        return 200, {'taskDetail': []}
+
+    def _job_summary(self, job_id):
+        """Returns the summary JSON of the job with the given id."""
+        subclient_id = ((1 * ID_FACTOR + 1) * ID_FACTOR) + 1
+        entity = self._subclient_entity(subclient_id)
+        start_time = 1600000000 + job_id * 60
+
+        with self._lock:
+            status = self._job_statuses.get(job_id, 'Completed')
+
+        return {
+            'jobId': job_id,
+            'status': status,
+            'isVisible': True,
+            'jobType': 'Backup',
+            'localizedOperationName': 'Backup',
+            'appTypeName': 'Windows File System',
+            'backupLevelName': 'Incremental',
+            'percentComplete': 100,
+            'pendingReason': '',
+            'jobStartTime': start_time,
+            'jobEndTime': start_time + 30,
+            'lastUpdateTime': start_time + 30,
+            'subclient': entity,
+            'destClientName': entity['clientName']
+        }
+
+    def _job(self, segments, query, request_json):
+        """Response for the Job API, to get the summary of a job."""
+        job_id = int(segments[0])
+
+        if not 1 <= job_id <= self.jobs:
+            return 200, {'totalRecordsWithoutPaging': 0}
+
+        return 200, {
+            'totalRecordsWithoutPaging': 1,
+            'jobs': [{'jobSummary': self._job_summary(job_id)}]
+        }
+
+    def _upload(self, segments, query, body, headers):
+        """Response for the file upload API of a client, i.e., Client/{clientId}/file/action/upload,
+            storing the full file or the chunks of the file received.
+        """
+        with self._lock:
+            failed = self._upload_failures > 0
+
+            if failed:
+                self._upload_failures -= 1
+
+                if not self._upload_failures_written:
+                    return self._upload_failures_status, 'Upload failed'
+
+            file_path = '/'.join([
+                b64decode(headers['ParentFolderPath']).decode('utf-8').replace('\\', '/'),
+                b64decode(headers['FileName']).decode('utf-8')
+            ])
+
+            if query.get('uploadType') == 'fullFile':
+                self._uploaded_files[file_path] = body
+                return 200, {'errorCode': 0}
+
+            if query.get('requestId'):
+                request_id = query['requestId']
+            else:
+                self._upload_requests += 1
+                request_id = str(self._upload_requests)
+            contents = self._uploads.setdefault(request_id, bytearray())
+            contents.extend(body)
+
+            if headers.get('FileEOF') == '1':
+                self._uploaded_files[file_path] = bytes(self._uploads.pop(request_id))
+
+            if failed:
+                return 200, {}
+
+            return 200, {'errorCode': 0, 'requestId': request_id, 'chunkOffset': len(contents)}
+
+    def _job_action(self, segments, query, request_json):
+        """Response for the action APIs of a job, i.e., Job/{jobId}/action/{action}."""
+        job_id = int(segments[0])
+
+        if not 1 <= job_id <= self.jobs:
+            error_message = 'Job [{0}] does not exist'.format(job_id)
+        else:
+            error_message = ''
+
+        return 200, {
+            'errors': [{
+                'errList': [{
+                    'errorCode': 1 if error_message else 0,
+                    'errLogMessage': error_message
+                }]
+            }]
+        }
+
+    def _jobs(self, segments, query, request_json):
+        """Response for the Jobs API, to get a page of the list of jobs."""
+        paging = request_json.get('pagingConfig', {})
+        offset = int(paging.get('offset', 0))
+        limit = int(paging.get('limit', 20))
+
+        job_id_list = request_json.get('jobFilter', {}).get('jobIdList')
+
+        if job_id_list:
+            job_ids = sorted(
+                (job_id for job_id in job_id_list if 1 <= job_id <= self.jobs), reverse=True
+            )
+            total = len(job_ids)
+            job_ids = job_ids[offset:offset + limit]
+        else:
+            # most recent jobs first, as sorted by the commcell
+            job_ids = range(self.jobs - offset, max(self.jobs - offset - limit, 0), -1)
+            total = self.jobs
+
+        return 200, {
+            'totalRecordsWithoutPaging': total,
+            'jobs': [{'jobSummary': self._job_summary(job_id)} for job_id in job_ids]
+        }
+
+    def _job_details(self, segments, query, request_json):
+        """Response for the JobDetails API."""
+        job_id = int(request_json.get('jobId', 0))
+
+        if not 1 <= job_id <= self.jobs:
+            return 200, {
+                'error': {'errList': [{'errorCode': 2, 'errLogMessage': 'Job not found'}]}
+            }
+
+        return 200, {
+            'job': {
+                'jobDetail': {
+                    'generalInfo': {'subclient': self._job_summary(job_id)['subclient']},
+                    'progressInfo': {'reasonForJobDelay': ''},
+                    'detailInfo': {'numOfObjects': 100, 'sizeOfApplication': 1048576}
+                }
+            }
+        }
+
+    def _browse(self, segments, query, request_json):
+        """Response for the DoBrowse API, to get a page of the items at the browse path."""
+        path = request_json.get('paths', [{}])[0].get('path', '\\').rstrip('\\')
+        paging = request_json['queries'][0]['dataParam']['paging']
+        skip_node = int(paging.get('skipNode', 0))
+        page_size = int(paging.get('pageSize', 100000))
+
+        items = []
+
+        for index in range(skip_node, min(skip_node + page_size, self.browse_items)):
+            name = 'file{0}.txt'.format(index)
+            items.append({
+                'displayName': name,
+                'name': name,
+                'path': '{0}\\{1}'.format(path, name),
+                'size': 1024,
+                'modificationTime': 1600000000,
+                'flags': {'file': True},
+                'advancedData': {'backupTime': 1600000000}
+            })
+
+        return 200, {
+            'browseResponses': [{
+                'respType': 0,
+                'browseResult': {
+                    'totalItemsFound': self.browse_items,
+                    'dataResultSet': items
+                }
+            }]
+        }
+
+    def _dcube(self, segments, query, request_json):
+        """Response for the Datacube APIs, i.e., dcube/{operation}."""
+        operation = segments[0].lower()
+
+        if operation == 'getanalyticsengine':
+            return 200, {
+                'listOfCIServer': [{
+                    'cloudID': 1,
+                    'engineName': INDEX_SERVER_NAME,
+                    'internalCloudName': '{0}_cloud'.format(INDEX_SERVER_NAME),
+                    'serverType': 1,
+                    'type': 1,
+                    'indexServerClientId': 100,
+                    'version': 1,
+                    'clientId': 100 + node,
+                    'clientName': 'isnode{0}'.format(node),
+                    'hostName': 'isnode{0}.mock.local'.format(node),
+                    'cIServerURL': 'http://{0}/IndexNode/{1}'.format(self.hostname, node),
+                    'basePort': 20000
+                } for node in range(1, self.index_nodes + 1)]
+            }
+
+        if operation == 'getdatasources':
+            return 200, {
+                'collections': [{
+                    'computedCoreName': '{0}_core'.format(DATASOURCE_NAME),
+                    'cloudId': 1,
+                    'datasources': [{
+                        'datasourceId': DATASOURCE_ID,
+                        'datasourceName': DATASOURCE_NAME,
+                        'datasourceType': 5
+                    }]
+                }]
+            }
+
+        if operation == 'gethandler':
+            return 200, {
+                'handlerInfos': [{
+                    'handlerId': handler_id,
+                    'handlerName': 'handler{0}'.format(handler_id)
+                } for handler_id in range(1, HANDLERS + 1)]
+            }
+
+        if operation == 'handler':
+            with self._lock:
+                documents = len(self._documents)
+
+            return 200, {
+                'response': {
+                    'handlerId': int(segments[1]),
+                    'handlerName': segments[2],
+                    'filter': query,
+                    'numFound': documents
+                }
+            }
+
+        if operation == 'post':
+            with self._lock:
+                self._documents.extend(request_json)
+
+            return 200, {'errorCode': 0}
+
+        return 404, 'Datacube API not supported by the mock server: {0}'.format(operation)
+
+    def _roles(self, segments, query, request_json):
+        """Response for the IndexingGateway API, to get the roles of the Index servers."""
+        return 200, {'rolesInfo': [{'roleId': 1, 'roleName': 'Data Analytics', 'roleVersion': 1}]}
+
+    def _solr_node_documents(self, node):
+        """Returns the Solr documents of the Index server node with the given number."""
+        return [{
+            'id': 'doc{0:04d}'.format(index),
+            'size': index * 37 % 50,
+            'type': SOLR_FILE_TYPES[index % len(SOLR_FILE_TYPES)]
+        } for index in range(node, self.solr_documents + 1, self.index_nodes)]
+
+    def _solr(self, segments, query, request_json):
+        """Response for the Solr APIs of an Index server node, i.e.,
+            IndexNode/{node}/solr/{core}/select and IndexNode/{node}/solr/{core}/schema/uniquekey.
+        """
+        node = int(segments[0])
+
+        if segments[3:] == ['schema', 'uniquekey']:
+            return 200, {'responseHeader': {'status': 0}, 'uniqueKey': 'id'}
+
+        if segments[3:] != ['select']:
+            return 404, 'Solr API not supported by the mock server: {0}'.format(segments[3:])
+
+        with self._lock:
+            self._solr_queries.append(dict(query, node=node))
+
+        documents = self._solr_node_documents(node)
+
+        if query.get('q', '*:*') != '*:*':
+            for clause in query['q'].split(' AND '):
+                field, _, value = clause.partition(':')
+                documents = [document for document in documents if str(document[field]) == value]
+
+        # sort on the last field first, as the sort is stable
+        for clause in reversed(query.get('sort', '').split(',') if query.get('sort') else []):
+            field, _, order = clause.strip().partition(' ')
+            documents.sort(key=lambda document: document[field], reverse=order == 'desc')
+
+        start = int(query.get('start', 0))
+        rows = int(query.get('rows', 10))
+        result = {'responseHeader': {'status': 0, 'QTime': node}}
+
+        if 'cursorMark' in query:
+            if 'id asc' not in query.get('sort', '') or start:
+                return 400, 'Cursor functionality requires a sort containing the uniqueKey field'
+
+            # the cursor mark is opaque to the client, here the offset of the next page
+            cursor_mark = query['cursorMark']
+            start = 0 if cursor_mark == '*' else int(b64decode(cursor_mark).decode()[5:])
+            end = min(start + rows, len(documents))
+            result['nextCursorMark'] = (
+                cursor_mark if end == start else b64encode('next={0}'.format(end).encode()).decode()
+            )
+
+        result['response'] = {
+            'numFound': len(documents),
+            'start': start,
+            'docs': documents[start:start + rows]
+        }
+
+        if query.get('fl'):
+            fields = query['fl'].split(',')
+            result['response']['docs'] = [
+                {field: document[field] for field in fields if field in document}
+                for document in result['response']['docs']
+            ]
+
+        if query.get('facet') == 'true' and query.get('facet.field'):
+            field = query['facet.field']
+            counts = {}
+
+            for document in documents:
+                counts[document[field]] = counts.get(document[field], 0) + 1
+
+            result['facet_counts'] = {
+                'facet_queries': {},
+                'facet_fields': {
+                    field: [
+                        value for item in sorted(counts.items(), key=lambda item: -item[1])
+                        for value in item
+                    ]
+                },
+                'facet_ranges': {}
+            }
+
+        return 200, result
+
+    @property
+    def hostname(self):
+        """Returns the hostname to connect to the server with, as hostname:port."""
+        host, port = self._server.server_address[:2]
+        return '{0}:{1}'.format(host, port)
+
+    @property
+    def commcell_kwargs(self):
+        """Returns the keyword arguments to initialize the Commcell object with,
+            for connecting to this server.
+        """
+        return {
+            'webconsole_hostname': self.hostname,
+            'commcell_username': 'admin',
+            'commcell_password': 'password'
+        }
+
+    @property
+    def uploaded_files(self):
+        """Returns the contents of the files uploaded to the clients, as a dict of
+            the destination path of each file, joined with "/", and its contents.
+        """
+        with self._lock:
+            return dict(self._uploaded_files)
+
+    @property
+    def documents(self):
+        """Returns the list of the documents imported to the datasource."""
+        with self._lock:
+            return list(self._documents)
+
+    @property
+    def solr_documents_list(self):
+        """Returns the list of the Solr documents of all the Index server nodes."""
+        return [
+            document for node in range(1, self.index_nodes + 1)
+            for document in self._solr_node_documents(node)
+        ]
+
+    @property
+    def solr_queries(self):
+        """Returns the params of the Solr select requests received, with the node number of
+            each request as the **node** param.
+        """
+        with self._lock:
+            return list(self._solr_queries)
+
+    @property
+    def backups(self):
+        """Returns the ids of the subclients backed up, in the order of the requests."""
+        with self._lock:
+            return list(self._backups)
+
+    @property
+    def request_counts(self):
+        """Returns the number of requests received for each API, as a dict."""
+        with self._lock:
+            return dict(self._request_counts)
+
+    @property
+    def total_requests(self):
+        """Returns the total number of requests received by the server."""
+        with self._lock:
+            return sum(self._request_counts.values())
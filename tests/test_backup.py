@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the bulk backup of the subclients of a backupset, run against the local mock
+CommServe."""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from unittest import mock
+
+from mockserver import MockCommServe
+
+from cvpysdk.commcell import Commcell
+from cvpysdk.job import Job
+from cvpysdk.job_submitter import JobSubmitter
+
+
+SUBCLIENTS = 20
+
+
+class BackupsetBackupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockCommServe(clients=1, subclients=SUBCLIENTS)
+        self.server.start()
+        self.commcell = Commcell(**self.server.commcell_kwargs)
+        self.backupset = self.commcell.clients.get('client1').agents.get(
+            'file system'
+        ).backupsets.get('defaultbackupset')
+        self.server.reset_counts()
+
+    def tearDown(self):
+        self.commcell.logout()
+        self.server.stop()
+
+    def test_bounded_submitter(self):
+        with mock.patch('cvpysdk.backupset.JobSubmitter', wraps=JobSubmitter) as submitter:
+            submitter.DEFAULT_MAX_WORKERS = JobSubmitter.DEFAULT_MAX_WORKERS
+            submitter.DEFAULT_RATE = 500
+
+            jobs = self.backupset.backup(rate=1000)
+
+            # the workers of the call are capped, instead of a thread for every subclient
+            submitter.assert_called_once_with(
+                max_workers=JobSubmitter.DEFAULT_MAX_WORKERS, rate=1000
+            )
+
+            futures = self.backupset.backup_async(max_workers=3)
+            submitter.assert_called_with(max_workers=3, rate=500)
+
+            for future in futures.values():
+                future.result()
+
+        self.assertEqual(len(jobs), SUBCLIENTS)
+        self.assertTrue(all(isinstance(job, Job) for job in jobs))
+
+        subclient_ids = [
+            int(subclient['id']) for subclient in self.backupset.subclients.all_subclients.values()
+        ]
+        self.assertEqual(sorted(self.server.backups), sorted(subclient_ids * 2))
+
+    def test_prefetched_properties(self):
+        self.backupset.backup(rate=1000)
+
+        # the subclients are initialized from the list of subclients, fetched once
+        self.assertEqual(self.server.request_counts.get('GET Subclient'), 1)
+        self.assertEqual(self.server.request_counts.get('POST Subclient'), SUBCLIENTS)
+
+        subclients = self.backupset.subclients
+        subclient = subclients._get_prefetched('subclient2')
+
+        self.assertEqual(subclient.subclient_id, '1001002')
+        self.assertTrue(subclient.is_backup_enabled)
+        self.assertEqual(subclient.storage_policy, 'mockpolicy')
+        self.assertEqual(self.server.request_counts.get('GET Subclient'), 1)
+
+        # the properties are requested for the subclients initialized otherwise
+        self.assertEqual(subclients.get('subclient2').storage_policy, 'mockpolicy')
+        self.assertEqual(self.server.request_counts.get('GET Subclient'), 2)
+
+    def test_submitter(self):
+        with JobSubmitter(max_workers=2, rate=None) as submitter:
+            futures = self.backupset.backup_async(submitter=submitter, backup_level='Full')
+
+        self.assertEqual(len(futures), SUBCLIENTS)
+        self.assertTrue(all(isinstance(future.result(), Job) for future in futures.values()))
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
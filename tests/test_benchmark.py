@@ -0,0 +1,354 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Offline benchmarks for the REST hot paths of the SDK, run against the local mock CommServe.
+
+Every benchmark is run at each of the scales given in the **CVPYSDK_BENCHMARK_SCALES**
+environment variable, as a comma separated list of entity counts (default: 100), with the
+latency in seconds given in the **CVPYSDK_BENCHMARK_LATENCY** environment variable added to
+every response (default: 0).
+
+    CVPYSDK_BENCHMARK_SCALES=100,10000,100000 python -m unittest test_benchmark
+
+At a scale of N entities, the commcell has N clients, N jobs, and N items in the browse result.
+The tree walk covers N subclients, i.e., the first N / 10 clients, with 2 backupsets of
+5 subclients each.
+
+The wall time, and the number of requests made to the server are reported for each benchmark.
+For the import time of the SDK, the number of its modules loaded is reported instead.
+The content type sniffing of the request payloads is compared with the full XML parse, for
+payloads of the sizes in MB given as the scale.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from mockserver import MockCommServe
+
+import xmltodict
+
+from cvpysdk.commcell import Commcell
+from cvpysdk.cvpysdk import _sniff_content_type
+
+
+SCALES = [
+    int(scale) for scale in os.environ.get('CVPYSDK_BENCHMARK_SCALES', '100').split(',')
+]
+LATENCY = float(os.environ.get('CVPYSDK_BENCHMARK_LATENCY', '0'))
+
+# the scripts run in a new interpreter import the SDK from the root of the repository
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BACKUPSETS = 2
+SUBCLIENTS = 5
+
+WORKERS = 64
+
+XML_SIZES = [1, 8]
+
+UPLOAD_FILES = 8
+UPLOAD_FILE_SIZE = 3 * 1024 ** 2
+
+
+class BenchmarkTest(unittest.TestCase):
+
+    results = []
+
+    @classmethod
+    def tearDownClass(cls):
+        report = ['', '{:<24}{:>10}{:>12}{:>12}'.format(
+            'Benchmark', 'Scale', 'Requests', 'Seconds'
+        )]
+
+        for name, scale, requests, seconds in cls.results:
+            report.append('{:<24}{:>10}{:>12}{:>12.3f}'.format(name, scale, requests, seconds))
+
+        sys.stderr.write('\n'.join(report) + '\n')
+        logging.info('\n'.join(report))
+
+    def _run_benchmark(self, name, function):
+        """Runs the function against the mock CommServe at every scale, and records the wall
+            time and the number of requests made for each.
+        """
+        for scale in SCALES:
+            with self.subTest(scale=scale):
+                server = MockCommServe(
+                    clients=scale,
+                    backupsets=BACKUPSETS,
+                    subclients=SUBCLIENTS,
+                    jobs=scale,
+                    browse_items=scale,
+                    latency=LATENCY
+                )
+
+                with server:
+                    commcell = Commcell(**server.commcell_kwargs)
+                    server.reset_counts()
+
+                    start_time = time.time()
+                    function(commcell, scale)
+                    elapsed_time = time.time() - start_time
+
+                    self.results.append((name, scale, server.total_requests, elapsed_time))
+                    commcell.logout()
+
+    def test_import_time(self):
+        script = (
+            'import sys, time; start_time = time.time(); import cvpysdk.commcell; '
+            'print(time.time() - start_time); '
+            'print(",".join(name for name in sys.modules if name.startswith("cvpysdk")))'
+        )
+        output = subprocess.check_output(
+            [sys.executable, '-c', script], cwd=ROOT_PATH
+        ).decode().splitlines()
+        modules = output[1].split(',')
+
+        for module in ('cvpysdk.client', 'cvpysdk.agent', 'cvpysdk.subclient', 'cvpysdk.plan'):
+            self.assertNotIn(module, modules)
+
+        self.results.append(('import cvpysdk.commcell', 0, len(modules), float(output[0])))
+
+    def test_lazy_import_names(self):
+        script = (
+            'import sys; import cvpysdk.commcell; '
+            'print("cvpysdk.client" in sys.modules); '
+            'from cvpysdk.commcell import Clients, UserGroup, report; '
+            'print(Clients.__module__, UserGroup.__module__, report.__name__)'
+        )
+        output = subprocess.check_output(
+            [sys.executable, '-c', script], cwd=ROOT_PATH
+        ).decode().splitlines()
+
+        # the classes imported by the module earlier are still importable from it, on demand
+        self.assertEqual(output[0], 'False')
+        self.assertEqual(
+            output[1], 'cvpysdk.client cvpysdk.security.usergroup cvpysdk.reports.report'
+        )
+
+        with self.assertRaises(ImportError):
+            exec('from cvpysdk.commcell import NoSuchClass')
+
+    def test_content_type_sniff(self):
+        for size in XML_SIZES:
+            items = ''.join(
+                '<item id="{0}" name="item{0}"><path>C:\\data\\file{0}.txt</path></item>'.format(
+                    index
+                ) for index in range(size * 1024 ** 2 // 64)
+            )
+            payload = '<?xml version="1.0"?>\n<App_Request>{0}</App_Request>\n'.format(
+                items
+            ).encode()
+
+            start_time = time.time()
+            xmltodict.parse(payload)
+            self.results.append(('xmltodict.parse (MB)', size, 0, time.time() - start_time))
+
+            start_time = time.time()
+            self.assertEqual(_sniff_content_type(payload), 'application/xml')
+            self.results.append(('_sniff_content_type (MB)', size, 0, time.time() - start_time))
+
+        self.assertEqual(_sniff_content_type(b'{"key": "<value>"}'), 'text/plain')
+        self.assertEqual(_sniff_content_type(b'<unclosed'), 'text/plain')
+
+    def test_commcell_init(self):
+        server = MockCommServe(latency=LATENCY)
+
+        with server:
+            start_time = time.time()
+            commcell = Commcell(**server.commcell_kwargs)
+            elapsed_time = time.time() - start_time
+
+            self.assertEqual(commcell.commserv_name, 'client1')
+            self.assertLessEqual(server.total_requests, 3)
+            self.results.append(('Commcell()', 0, server.total_requests, elapsed_time))
+
+            commcell.logout()
+
+    def test_commcell_fast_start(self):
+        session_file = os.path.join(tempfile.mkdtemp(), 'session.json')
+        server = MockCommServe(latency=LATENCY)
+
+        with server:
+            for name in ('Commcell(fast_start)', 'Commcell(session_file)'):
+                server.reset_counts()
+
+                start_time = time.time()
+                commcell = Commcell(
+                    fast_start=True, session_file=session_file, **server.commcell_kwargs
+                )
+                elapsed_time = time.time() - start_time
+
+                self.assertLessEqual(server.total_requests, 2)
+                self.results.append((name, 0, server.total_requests, elapsed_time))
+
+            self.assertEqual(commcell.commserv_name, 'client1')
+            commcell.logout()
+
+        shutil.rmtree(os.path.dirname(session_file))
+
+    def test_shared_commcell(self):
+        server = MockCommServe(clients=WORKERS, latency=LATENCY)
+
+        def get_client(index):
+            return commcell.clients, commcell.clients.get('client{0}'.format(index))
+
+        with server, ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            commcell = Commcell(**server.commcell_kwargs)
+            server.reset_counts()
+
+            start_time = time.time()
+            results = list(executor.map(get_client, range(1, WORKERS + 1)))
+
+            # all the threads must get the same collection, initialized only once
+            self.assertEqual(len(set(id(clients) for clients, _ in results)), 1)
+
+            server.expire_token()
+            results = list(executor.map(get_client, range(1, WORKERS + 1)))
+            elapsed_time = time.time() - start_time
+
+            self.assertEqual(server.request_counts.get('POST RenewLoginToken'), 1)
+            self.assertEqual(
+                [client.client_id for _, client in results],
+                [str(index) for index in range(1, WORKERS + 1)]
+            )
+
+            self.results.append(
+                ('shared Commcell', WORKERS, server.total_requests, elapsed_time)
+            )
+            commcell.logout()
+
+    def test_clients_get(self):
+        def get_clients(commcell, scale):
+            for index in range(1, min(scale, 10) + 1):
+                client = commcell.clients.get('client{0}'.format(index))
+                self.assertEqual(client.client_id, str(index))
+
+        self._run_benchmark('Clients.get', get_clients)
+
+    def test_tree_walk(self):
+        def walk_tree(commcell, scale):
+            client_names = ['client{0}'.format(index) for index in range(1, scale // 10 + 1)]
+            subclients = 0
+
+            for client in commcell.clients.iter_objects(client_names or ['client1']):
+                for agent_name in client.agents.all_agents:
+                    agent = client.agents.get(agent_name)
+
+                    for backupset_name in agent.backupsets.all_backupsets:
+                        backupset = agent.backupsets.get(backupset_name)
+
+                        for subclient_name in backupset.subclients.all_subclients:
+                            backupset.subclients.get(subclient_name)
+                            subclients += 1
+
+            self.assertEqual(subclients, max(len(client_names), 1) * BACKUPSETS * SUBCLIENTS)
+
+        self._run_benchmark('tree walk', walk_tree)
+
+    def test_jobs_list(self):
+        def list_jobs(commcell, scale):
+            jobs = commcell.job_controller.all_jobs(lookup_time=100000, limit=scale)
+            self.assertEqual(len(jobs), scale)
+
+        self._run_benchmark('JobController.all_jobs', list_jobs)
+
+    def test_iter_jobs(self):
+        def iter_jobs(commcell, scale):
+            jobs = commcell.job_controller.iter_jobs(lookup_time=100000, page_size=1000)
+            self.assertEqual(sum(1 for _ in jobs), scale)
+
+        self._run_benchmark('JobController.iter_jobs', iter_jobs)
+
+    def test_bulk_action(self):
+        def suspend_jobs(commcell, scale):
+            results = commcell.job_controller.bulk_action(
+                list(range(1, scale + 2)), 'suspend', workers=16
+            )
+
+            self.assertEqual(len(results), scale + 1)
+            self.assertEqual(results['1'], (True, None))
+            self.assertFalse(results[str(scale + 1)][0])
+
+        self._run_benchmark('JobController.bulk_action', suspend_jobs)
+
+    def test_upload_folder(self):
+        source_dir = os.path.join(tempfile.mkdtemp(), 'bundle')
+        contents = {}
+
+        for index in range(UPLOAD_FILES):
+            file_path = os.path.join('sub{0}'.format(index % 2), 'file{0}.bin'.format(index))
+            contents[file_path.replace(os.sep, '/')] = os.urandom(UPLOAD_FILE_SIZE + index)
+
+            os.makedirs(os.path.join(source_dir, os.path.dirname(file_path)), exist_ok=True)
+
+            with open(os.path.join(source_dir, file_path), 'wb') as file_object:
+                file_object.write(contents[file_path.replace(os.sep, '/')])
+
+        server = MockCommServe(latency=LATENCY)
+
+        with server:
+            commcell = Commcell(**server.commcell_kwargs)
+            client = commcell.clients.get('client1')
+            server.reset_counts()
+
+            # the upload must resume from the last chunk acknowledged, after a failure
+            server.fail_uploads(2)
+
+            start_time = time.time()
+            client.upload_folder(source_dir, 'C:\\dest', workers=4, chunk_size=1024 ** 2)
+            elapsed_time = time.time() - start_time
+
+            uploaded_files = server.uploaded_files
+
+            for file_path, content in contents.items():
+                self.assertEqual(uploaded_files['C:/dest/bundle/' + file_path], content)
+
+            self.results.append(
+                ('Client.upload_folder', UPLOAD_FILES, server.total_requests, elapsed_time)
+            )
+            commcell.logout()
+
+        shutil.rmtree(os.path.dirname(source_dir))
+
+    def test_browse(self):
+        def browse(commcell, scale):
+            backupset = commcell.clients.get('client1').agents.get(
+                'file system').backupsets.get('defaultbackupset')
+
+            paths, _ = backupset.browse(path='c:\\', page_size=scale)
+            self.assertEqual(len(paths), scale)
+
+        self._run_benchmark('Backupset.browse', browse)
+
+    def test_iter_browse(self):
+        def iter_browse(commcell, scale):
+            backupset = commcell.clients.get('client1').agents.get(
+                'file system').backupsets.get('defaultbackupset')
+
+            items = backupset.iter_browse(path='c:\\', page_size=1000)
+            self.assertEqual(sum(1 for _ in items), scale)
+
+        self._run_benchmark('Backupset.iter_browse', iter_browse)
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for paging through the browse / find results, run against the local mock CommServe."""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from mockserver import MockCommServe
+
+from cvpysdk.commcell import Commcell
+
+
+class IterBrowseTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockCommServe(browse_items=2500)
+        self.server.start()
+        self.commcell = Commcell(**self.server.commcell_kwargs)
+        self.backupset = self.commcell.clients.get('client1').agents.get(
+            'file system').backupsets.get('defaultbackupset')
+        self.server.reset_counts()
+
+    def tearDown(self):
+        self.commcell.logout()
+        self.server.stop()
+
+    def test_pages(self):
+        for prefetch in (0, 2, 8):
+            self.server.reset_counts()
+            items = list(self.backupset.iter_browse(path='c:\\', page_size=1000, prefetch=prefetch))
+
+            self.assertEqual(len(items), 2500)
+            self.assertEqual(items[-1][0], 'c:\\file2499.txt')
+
+            # no page is requested past the short last page
+            self.assertEqual(self.server.request_counts, {'POST DoBrowse': 3})
+
+    def test_empty_last_page(self):
+        self.server.browse_items = 2000
+
+        items = list(self.backupset.iter_browse(path='c:\\', page_size=1000, prefetch=1))
+
+        self.assertEqual(len(items), 2000)
+        self.assertEqual(self.server.request_counts, {'POST DoBrowse': 3})
+
+    def test_stop_early(self):
+        items = self.backupset.iter_browse(path='c:\\', page_size=100, prefetch=2)
+
+        for _ in range(150):
+            next(items)
+
+        items.close()
+
+        self.assertLessEqual(self.server.request_counts['POST DoBrowse'], 4)
+
+    def test_options_not_modified(self):
+        options = {'path': 'c:\\', 'page_size': 1000, 'prefetch': 2, 'filters': []}
+
+        self.assertEqual(len(list(self.backupset.iter_browse(options))), 2500)
+        self.assertEqual(len(list(self.backupset.iter_find(options))), 2500)
+        self.assertEqual(
+            options, {'path': 'c:\\', 'page_size': 1000, 'prefetch': 2, 'filters': []}
+        )
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for fetching the Client objects in parallel, run against the local mock CommServe."""
+
+import threading
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from mockserver import MockCommServe
+
+from cvpysdk.commcell import Commcell
+from cvpysdk.exception import SDKException
+
+
+class ClientObjectsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockCommServe(clients=100, latency=0.01)
+        self.server.start()
+        self.commcell = Commcell(**self.server.commcell_kwargs)
+        self.clients = self.commcell.clients
+        self.server.reset_counts()
+
+    def tearDown(self):
+        self.commcell.logout()
+        self.server.stop()
+
+    def test_get_many(self):
+        names = ['client{0}'.format(index) for index in range(1, 101)]
+        clients = self.clients.get_many(names, workers=16)
+
+        self.assertEqual(sorted(clients), sorted(names))
+        self.assertEqual(clients['client50'].client_id, '50')
+        self.assertEqual(self.server.request_counts, {'GET Client': 100})
+
+        with self.assertRaises(SDKException):
+            self.clients.get_many(['client1', 'missing'])
+
+    def test_stop_early(self):
+        client_objects = self.clients.iter_objects(workers=4)
+
+        for _ in range(3):
+            next(client_objects)
+
+        client_objects.close()
+
+        # only the requests within the window of the workers are sent
+        self.assertLessEqual(self.server.request_counts['GET Client'], 3 + 4)
+
+    def test_lookups_during_refresh(self):
+        refreshed = threading.Event()
+
+        def refresh():
+            for _ in range(5):
+                self.clients.refresh()
+
+            refreshed.set()
+
+        thread = threading.Thread(target=refresh)
+        thread.start()
+
+        # the clients loaded earlier are used, until the refresh replaces them all together
+        while not refreshed.is_set():
+            self.assertEqual(self.clients[42], 'client42')
+            self.assertTrue(self.clients.has_client('client42.mock.local'))
+            self.assertEqual(self.clients._get_client_from_display_name('client42'), 'client42')
+
+        thread.join()
+
+    def test_concurrent_lazy_init(self):
+        client = self.clients.get('client1')
+        barrier = threading.Barrier(8)
+        results = []
+
+        def access():
+            barrier.wait()
+            results.append((client.agents, client.subclient_index))
+
+        threads = [threading.Thread(target=access) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        # all the threads get the same collections, initialized only once
+        self.assertEqual(len(set(id(agents) for agents, _ in results)), 1)
+        self.assertEqual(len(set(id(index) for _, index in results)), 1)
+        self.assertEqual(self.server.request_counts.get('GET Agent'), 1)
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
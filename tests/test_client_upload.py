@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the chunked file upload to a client, run against the local mock CommServe."""
+
+import os
+import shutil
+import tempfile
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from mockserver import MockCommServe
+
+from cvpysdk.backoff import Backoff
+from cvpysdk.commcell import Commcell
+from cvpysdk.exception import SDKException
+
+
+CHUNK_SIZE = 1024
+
+
+class UploadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, 'file.bin')
+        self.content = os.urandom(CHUNK_SIZE * 4 + 100)
+
+        with open(self.file_path, 'wb') as file_object:
+            file_object.write(self.content)
+
+        self.server = MockCommServe()
+        self.server.start()
+
+        self.commcell = Commcell(**self.server.commcell_kwargs)
+        self.client = self.commcell.clients.get('client1')
+        self.delays = []
+        self.backoff = Backoff(
+            initial_delay=0.01, max_delay=0.05, max_attempts=3,
+            callback=lambda attempt, delay, reason: self.delays.append(delay)
+        )
+
+    def tearDown(self):
+        self.commcell.logout()
+        self.server.stop()
+        shutil.rmtree(self.directory)
+
+    def _upload(self, progress_callback=None):
+        self.client.upload_file(
+            self.file_path,
+            'C:\\dest',
+            chunk_size=CHUNK_SIZE,
+            progress_callback=progress_callback,
+            backoff=self.backoff
+        )
+
+    def test_retry_rejected_chunk(self):
+        self.server.fail_uploads(2)
+        self._upload()
+
+        self.assertEqual(self.server.uploaded_files['C:/dest/file.bin'], self.content)
+        self.assertEqual(len(self.delays), 2)
+
+    def test_retry_unavailable(self):
+        self.server.reset_counts()
+
+        def fail_next_chunk(file_path, uploaded, file_size, throughput):
+            if uploaded == CHUNK_SIZE:
+                self.server.fail_uploads(2, status=503)
+
+        # the chunk rejected by the server is sent again, after waiting for the backoff
+        self._upload(fail_next_chunk)
+
+        self.assertEqual(self.server.uploaded_files['C:/dest/file.bin'], self.content)
+        self.assertEqual(self.server.request_counts['POST Client'], 7)
+        self.assertEqual(len(self.delays), 2)
+
+    def test_retries_exhausted(self):
+        self.server.fail_uploads(4, status=429)
+
+        with self.assertRaises(SDKException):
+            self._upload()
+
+        self.assertEqual(len(self.delays), 3)
+        self.assertNotIn('C:/dest/file.bin', self.server.uploaded_files)
+
+    def test_retry_first_chunk(self):
+        # the first chunk is uploaded again with a new request, if its response is lost
+        self.server.fail_uploads(1, written=True)
+        self._upload()
+
+        self.assertEqual(self.server.uploaded_files['C:/dest/file.bin'], self.content)
+
+    def test_no_retry_written_chunk(self):
+        self.server.reset_counts()
+
+        def fail_next_chunk(file_path, uploaded, file_size, throughput):
+            if uploaded == CHUNK_SIZE:
+                self.server.fail_uploads(1, written=True)
+
+        # the second chunk must not be appended twice to the file
+        with self.assertRaises(SDKException):
+            self._upload(fail_next_chunk)
+
+        self.assertEqual(self.server.request_counts['POST Client'], 2)
+        self.assertNotIn('C:/dest/file.bin', self.server.uploaded_files)
+
+    def test_no_retry_proxy_error(self):
+        self.server.reset_counts()
+
+        def fail_next_chunk(file_path, uploaded, file_size, throughput):
+            if uploaded == CHUNK_SIZE:
+                self.server.fail_uploads(1, status=502)
+
+        # a proxy may have failed after the server wrote the chunk
+        with self.assertRaises(SDKException):
+            self._upload(fail_next_chunk)
+
+        self.assertEqual(self.server.request_counts['POST Client'], 2)
+        self.assertEqual(self.delays, [])
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the Datacube datasources and handlers, run against the local mock CommServe."""
+
+import functools
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import requests
+
+from mockserver import MockCommServe
+
+from cvpysdk.backoff import Backoff
+from cvpysdk.commcell import Commcell
+from cvpysdk.datacube.handler import HandlerResultCache
+from cvpysdk.exception import SDKException
+
+
+def fast_backoff(max_attempts=3):
+    """Returns the Backoff to retry with, without waiting for long."""
+    return Backoff(initial_delay=0.01, max_delay=0.01, max_attempts=max_attempts)
+
+
+class DatacubeTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockCommServe()
+        self.server.start()
+        self.commcell = Commcell(**self.server.commcell_kwargs)
+        self.datasource = self.commcell.datacube.datasources.get('datasource1')
+        self.server.reset_counts()
+
+    def tearDown(self):
+        self.commcell.logout()
+        self.server.stop()
+
+
+class ImportDataStreamTest(DatacubeTestCase):
+
+    def test_batches(self):
+        progress = []
+        documents = ({'id': index, 'name': 'file{0}'.format(index)} for index in range(2500))
+
+        summary = self.datasource.import_data_stream(
+            documents,
+            batch_size=1000,
+            workers=2,
+            progress_callback=lambda count, rate: progress.append(count)
+        )
+
+        self.assertEqual(summary['documents'], 2500)
+        self.assertEqual(summary['batches'], 3)
+        self.assertEqual(len(progress), 3)
+        self.assertEqual(progress[-1], 2500)
+        self.assertEqual(self.server.request_counts, {'POST dcube': 3})
+        self.assertEqual(
+            sorted(document['id'] for document in self.server.documents), list(range(2500))
+        )
+
+    def test_batch_bytes(self):
+        documents = [{'id': index, 'data': 'x' * 100} for index in range(100)]
+
+        summary = self.datasource.import_data_stream(documents, batch_bytes=1024)
+
+        # a batch holds as many documents of 120 bytes as fit in 1 KB
+        self.assertEqual(summary['batches'], 13)
+        self.assertEqual(len(self.server.documents), 100)
+
+    def test_retry_failed_request(self):
+        self.server.fail_requests('POST dcube', 2)
+
+        summary = self.datasource.import_data_stream(
+            [{'id': index} for index in range(10)], backoff=fast_backoff()
+        )
+
+        self.assertEqual(summary['documents'], 10)
+        self.assertEqual(self.server.request_counts, {'POST dcube': 3})
+        self.assertEqual(len(self.server.documents), 10)
+
+        self.server.fail_requests('POST dcube', 10)
+
+        with self.assertRaises(SDKException):
+            self.datasource.import_data_stream([{'id': 1}], backoff=fast_backoff())
+
+    def test_no_retry_document_errors(self):
+        self.server.fail_requests(
+            'POST dcube', 1, {'errorCode': 1, 'errLogMessage': 'Invalid document'}
+        )
+
+        with self.assertRaises(SDKException):
+            self.datasource.import_data_stream([{'id': 1}], backoff=fast_backoff())
+
+        self.assertEqual(self.server.request_counts, {'POST dcube': 1})
+
+    def test_read_timeout(self):
+        session = self.commcell._cvpysdk_object._session
+        session.request = functools.partial(session.request, timeout=0.5)
+
+        # the server imports the batch, but the response is not received in time
+        self.server.stall_requests('POST dcube', 1, 1)
+
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            self.datasource.import_data_stream(
+                [{'id': 1}, {'name': 'no key'}], unique_key='id', backoff=fast_backoff()
+            )
+
+        self.assertEqual(len(self.server.documents), 2)
+
+        # the batch is imported again, once all the documents have the unique key
+        self.server.stall_requests('POST dcube', 1, 1)
+
+        summary = self.datasource.import_data_stream(
+            [{'id': 2}, {'id': 3}], unique_key='id', backoff=fast_backoff()
+        )
+
+        self.assertEqual(summary['documents'], 2)
+        self.assertEqual([document['id'] for document in self.server.documents[2:]], [2, 3, 2, 3])
+
+
+class HandlersTest(DatacubeTestCase):
+
+    def setUp(self):
+        super(HandlersTest, self).setUp()
+        self.handlers = self.datasource.ds_handlers
+        self.server.reset_counts()
+
+    def test_result_cache(self):
+        self.handlers.result_cache = HandlerResultCache(ttl=60, max_size=2)
+        handler = self.handlers.get('handler1')
+
+        result = handler.get_handler_data('rows=10')
+        self.assertEqual(result['filter'], {'rows': '10'})
+
+        # the result served from the cache is not shared with the earlier callers
+        result['filter'] = 'modified'
+        self.assertEqual(handler.get_handler_data('rows=10')['filter'], {'rows': '10'})
+        handler.get_handler_data('rows=10')['filter'] = 'modified'
+        self.assertEqual(handler.get_handler_data('rows=10')['filter'], {'rows': '10'})
+
+        self.assertEqual(self.server.request_counts, {'GET dcube': 1})
+
+        # least recently used result is evicted
+        handler.get_handler_data('rows=20')
+        handler.get_handler_data('rows=30')
+        handler.get_handler_data('rows=10')
+        self.assertEqual(self.server.request_counts, {'GET dcube': 4})
+
+    def test_result_cache_expiry(self):
+        self.handlers.result_cache = HandlerResultCache(ttl=0)
+        handler = self.handlers.get('handler1')
+
+        handler.get_handler_data('rows=10')
+        handler.get_handler_data('rows=10')
+
+        self.assertEqual(self.server.request_counts, {'GET dcube': 2})
+
+    def test_execute_many(self):
+        results = self.handlers.execute_many(
+            ['handler1', ('handler2', 'rows=10'), ('handler3', ''), ('handler1', '')], workers=4
+        )
+
+        self.assertEqual(
+            sorted(results), [('handler1', ''), ('handler2', 'rows=10'), ('handler3', '')]
+        )
+        self.assertEqual(results[('handler2', 'rows=10')]['handlerName'], 'handler2')
+        self.assertEqual(results[('handler2', 'rows=10')]['filter'], {'rows': '10'})
+
+        # the same handler and filter is executed only once
+        self.assertEqual(self.server.request_counts, {'GET dcube': 3})
+
+    def test_execute_many_errors(self):
+        with self.assertRaises(SDKException):
+            self.handlers.execute_many(['handler1', 'missing'])
+
+        self.server.fail_requests('GET dcube', 1)
+
+        results = self.handlers.execute_many(['handler1'], raise_on_error=False)
+        self.assertIsInstance(results[('handler1', '')], SDKException)
+
+        self.server.fail_requests('GET dcube', 1)
+
+        with self.assertRaises(SDKException):
+            self.handlers.execute_many(['handler1'])
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the Solr queries of the IndexServer, run against the local mock CommServe."""
+
+import io
+import json
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from mockserver import MockCommServe
+from mockserver import INDEX_SERVER_NAME
+
+from cvpysdk.commcell import Commcell
+from cvpysdk.exception import SDKException
+
+
+CORE_NAME = 'core1'
+
+
+class IndexServerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockCommServe(index_nodes=2, solr_documents=100)
+        self.server.start()
+        self.commcell = Commcell(**self.server.commcell_kwargs)
+        self.index_server = self.commcell.index_servers.get(INDEX_SERVER_NAME)
+        self.server.reset_counts()
+
+    def tearDown(self):
+        self.commcell.logout()
+        self.server.stop()
+
+    def node_documents(self, node):
+        return [
+            document for document in self.server.solr_documents_list
+            if int(document['id'][3:]) % self.server.index_nodes == node % self.server.index_nodes
+        ]
+
+
+class IterSolrQueryTest(IndexServerTestCase):
+
+    def test_cursor_paging(self):
+        documents = list(self.index_server.iter_solr_query(CORE_NAME, page_size=7))
+
+        # all the documents of the first node, in the order of the unique key
+        self.assertEqual(documents, self.node_documents(1))
+
+        queries = self.server.solr_queries
+
+        # 50 documents in 8 pages, and the last request returns the same cursor mark
+        self.assertEqual(len(queries), 9)
+        self.assertEqual(self.server.request_counts, {'GET IndexNode': 10})
+        self.assertEqual(queries[0]['cursorMark'], '*')
+        self.assertEqual(len(set(query['cursorMark'] for query in queries)), 9)
+
+        for query in queries:
+            self.assertEqual(query['sort'], 'id asc')
+            self.assertEqual(query['rows'], '7')
+            self.assertNotIn('start', query)
+
+    def test_sort_and_filter(self):
+        documents = list(self.index_server.iter_solr_query(
+            CORE_NAME,
+            select_dict={'type': 'pdf'},
+            attr_list=['id', 'size'],
+            op_params={'sort': 'size desc', 'start': 20, 'rows': 5},
+            page_size=4,
+            unique_key='id',
+            prefetch=False
+        ))
+
+        expected = sorted(
+            (document for document in self.node_documents(1) if document['type'] == 'pdf'),
+            key=lambda document: (-document['size'], document['id'])
+        )
+
+        # the unique key is added to the sort, and the start and rows are ignored
+        self.assertEqual(
+            documents, [{'id': doc['id'], 'size': doc['size']} for doc in expected]
+        )
+        self.assertEqual(self.server.solr_queries[0]['sort'], 'size desc,id asc')
+        self.assertEqual(self.server.solr_queries[0]['rows'], '4')
+
+        # the unique key given is used, instead of fetching it from the schema
+        self.assertEqual(len(self.server.solr_queries), self.server.total_requests)
+
+    def test_early_exit(self):
+        documents = self.index_server.iter_solr_query(CORE_NAME, page_size=10, unique_key='id')
+
+        self.assertEqual([next(documents) for _ in range(3)], self.node_documents(1)[:3])
+        documents.close()
+
+        # only the current page, and the prefetched page are fetched
+        self.assertLessEqual(len(self.server.solr_queries), 2)
+
+    def test_errors(self):
+        with self.assertRaises(SDKException):
+            list(self.index_server.iter_solr_query(CORE_NAME, page_size=0))
+
+        self.server.fail_requests('GET IndexNode', 1)
+
+        with self.assertRaises(SDKException):
+            list(self.index_server.iter_solr_query(CORE_NAME, unique_key='id'))
+
+    def test_export(self):
+        sink = io.StringIO()
+        count = self.index_server.export_solr_query(CORE_NAME, sink, page_size=16)
+
+        self.assertEqual(count, 50)
+        self.assertEqual(
+            [json.loads(line) for line in sink.getvalue().splitlines()], self.node_documents(1)
+        )
+
+        sink = io.StringIO()
+        count = self.index_server.export_solr_query(
+            CORE_NAME, sink, 'csv', attr_list=['id', 'type'], select_dict={'type': 'txt'}
+        )
+
+        lines = sink.getvalue().splitlines()
+        self.assertEqual(lines[0], 'id,type')
+        self.assertGreater(count, 0)
+        self.assertEqual(len(lines), count + 1)
+        self.assertTrue(all(line.endswith(',txt') for line in lines[1:]))
+
+        with self.assertRaises(SDKException):
+            self.index_server.export_solr_query(CORE_NAME, sink, 'xml')
+
+
+class DistributedQueryTest(IndexServerTestCase):
+
+    def test_sorted_merge(self):
+        result = self.index_server.execute_solr_query_distributed(
+            CORE_NAME,
+            attr_list=['id', 'size'],
+            op_params={'sort': 'size desc,id asc', 'start': 5, 'rows': 20}
+        )
+
+        expected = sorted(
+            self.server.solr_documents_list,
+            key=lambda document: (-document['size'], document['id'])
+        )[5:25]
+
+        # the documents of the nodes are merged as if they were a single index
+        self.assertEqual(
+            result['response']['docs'], [{'id': doc['id'], 'size': doc['size']} for doc in expected]
+        )
+        self.assertEqual(result['response']['numFound'], 100)
+        self.assertEqual(result['response']['start'], 5)
+        self.assertEqual(result['responseHeader']['QTime'], 2)
+        self.assertNotIn('facet_counts', result)
+
+        # every node is queried once, for its first start + rows documents
+        queries = self.server.solr_queries
+        self.assertEqual(sorted(query['node'] for query in queries), [1, 2])
+
+        for query in queries:
+            self.assertEqual((query['start'], query['rows']), ('0', '25'))
+
+    def test_unsorted_merge(self):
+        result = self.index_server.execute_solr_query_distributed(
+            CORE_NAME, select_dict={'type': 'docx'}
+        )
+
+        docx = [doc for doc in self.server.solr_documents_list if doc['type'] == 'docx']
+
+        self.assertEqual(result['response']['numFound'], len(docx))
+        self.assertEqual(len(result['response']['docs']), 10)
+        self.assertTrue(all(doc['type'] == 'docx' for doc in result['response']['docs']))
+
+    def test_facet_merge(self):
+        result = self.index_server.execute_solr_query_distributed(
+            CORE_NAME, op_params={'rows': 0, 'facet': 'true', 'facet.field': 'type'}
+        )
+
+        counts = {}
+
+        for document in self.server.solr_documents_list:
+            counts[document['type']] = counts.get(document['type'], 0) + 1
+
+        facet_pairs = result['facet_counts']['facet_fields']['type']
+
+        # the counts are added up across the nodes, and ordered by the count
+        self.assertEqual(dict(zip(facet_pairs[::2], facet_pairs[1::2])), counts)
+        self.assertEqual(facet_pairs[1::2], sorted(counts.values(), reverse=True))
+        self.assertEqual(result['response']['docs'], [])
+
+    def test_merge_facet_counts(self):
+        merged = self.index_server._merge_facet_counts([
+            {
+                'facet_queries': {'size:[0 TO 10]': 3},
+                'facet_fields': {'type': ['pdf', 5, 'txt', 1]},
+                'facet_ranges': {'mtime': {'counts': ['2020', 1, '2021', 4]}}
+            },
+            {
+                'facet_queries': {'size:[0 TO 10]': 2},
+                'facet_fields': {'type': ['txt', 7, 'docx', 2]},
+                'facet_ranges': {'mtime': {'counts': ['2020', 2, '2022', 1]}}
+            }
+        ])
+
+        self.assertEqual(merged['facet_queries'], {'size:[0 TO 10]': 5})
+        self.assertEqual(merged['facet_fields'], {'type': ['txt', 8, 'pdf', 5, 'docx', 2]})
+
+        # the ranges keep the order of their values, instead of the count
+        self.assertEqual(
+            merged['facet_ranges'], {'mtime': {'counts': ['2020', 3, '2021', 4, '2022', 1]}}
+        )
+
+    def test_solr_clients(self):
+        result = self.index_server.execute_solr_query_distributed(
+            CORE_NAME, op_params={'sort': 'id asc'}, solr_clients=['isnode2']
+        )
+
+        self.assertEqual(result['response']['numFound'], 50)
+        self.assertEqual(result['response']['docs'], self.node_documents(2)[:10])
+        self.assertEqual([query['node'] for query in self.server.solr_queries], [2])
+
+        with self.assertRaises(SDKException):
+            self.index_server.execute_solr_query_distributed(CORE_NAME, solr_clients=['isnode3'])
+
+        self.server.fail_requests('GET IndexNode', 1)
+
+        with self.assertRaises(SDKException):
+            self.index_server.execute_solr_query_distributed(CORE_NAME)
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the request hooks and the StatsCollector, run against the local mock CommServe."""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from mockserver import MockCommServe
+
+from cvpysdk.commcell import Commcell
+from cvpysdk.instrumentation import StatsCollector
+
+
+class StatsCollectorTest(unittest.TestCase):
+
+    def test_prometheus_histogram(self):
+        collector = StatsCollector(buckets=(0.1, 1, 10))
+
+        for elapsed in (0.05, 0.05, 0.5, 5, 50):
+            collector.after_request('GET', 'http://host/webconsole/api/Client', None, elapsed)
+
+        lines = collector.to_prometheus().splitlines()
+
+        # the buckets are cumulative, the samples above the largest bound count only in +Inf
+        for line in (
+                'cvpysdk_request_duration_seconds_bucket{service="GET_ALL_CLIENTS",le="0.1"} 2',
+                'cvpysdk_request_duration_seconds_bucket{service="GET_ALL_CLIENTS",le="1"} 3',
+                'cvpysdk_request_duration_seconds_bucket{service="GET_ALL_CLIENTS",le="10"} 4',
+                'cvpysdk_request_duration_seconds_bucket{service="GET_ALL_CLIENTS",le="+Inf"} 5',
+                'cvpysdk_request_duration_seconds_sum{service="GET_ALL_CLIENTS"} 55.6',
+                'cvpysdk_request_duration_seconds_count{service="GET_ALL_CLIENTS"} 5',
+                'cvpysdk_requests_total{service="GET_ALL_CLIENTS"} 5',
+                'cvpysdk_request_errors_total{service="GET_ALL_CLIENTS"} 5',
+                'cvpysdk_retries_total 0'):
+            self.assertIn(line, lines)
+
+        self.assertEqual(
+            collector.stats['GET_ALL_CLIENTS']['buckets'], {0.1: 2, 1: 1, 10: 1, '+Inf': 1}
+        )
+
+    def test_collect_stats(self):
+        with MockCommServe() as server:
+            commcell = Commcell(**server.commcell_kwargs)
+
+            with StatsCollector(commcell_object=commcell) as collector:
+                commcell.clients.get('client1')
+
+                server.expire_token()
+                commcell.clients.refresh()
+
+            stats = collector.stats
+
+            self.assertEqual(stats['GET_ALL_CLIENTS']['count'], 3)
+            self.assertEqual(stats['GET_ALL_CLIENTS']['errors'], 1)
+            self.assertEqual(collector.token_renewals, 1)
+            self.assertGreater(stats['GET_ALL_CLIENTS']['bytes_received'], 0)
+
+            commcell.logout()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
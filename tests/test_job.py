@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the JobHandle and the JobWatcher, run against the local mock CommServe."""
+
+import time
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from mockserver import MockCommServe
+
+from cvpysdk.commcell import Commcell
+from cvpysdk.exception import SDKException
+from cvpysdk.job import Job
+from cvpysdk.job import JobHandle
+from cvpysdk.job import JobWatcher
+
+
+INTERVAL = 0.05
+
+
+class JobTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockCommServe(jobs=1000)
+        self.server.start()
+        self.commcell = Commcell(**self.server.commcell_kwargs)
+        self.server.reset_counts()
+
+    def tearDown(self):
+        self.commcell.logout()
+        self.server.stop()
+
+
+class JobHandleTest(JobTestCase):
+
+    def test_lazy_summary(self):
+        handle = JobHandle(self.commcell, 5)
+
+        self.assertEqual(self.server.total_requests, 0)
+        self.assertEqual(handle.status, 'Completed')
+        self.assertTrue(handle.is_finished)
+        self.assertEqual(handle.client_name, 'client1')
+        self.assertEqual(handle.start_timestamp, 1600000000 + 5 * 60)
+        self.assertEqual(self.server.request_counts, {'GET Job': 1})
+
+        self.server.set_job_status(5, 'Running')
+        self.assertTrue(handle.is_finished)
+
+        handle.refresh()
+        self.assertEqual(handle.status, 'Running')
+        self.assertFalse(handle.is_finished)
+
+    def test_from_summary(self):
+        handles = self.commcell.job_controller.all_jobs(
+            lookup_time=100000, limit=10, job_summary='handle'
+        )
+
+        self.assertEqual(len(handles), 10)
+        self.assertTrue(all(isinstance(handle, JobHandle) for handle in handles.values()))
+
+        self.server.reset_counts()
+        self.assertEqual(handles[1000].job_id, '1000')
+        self.assertEqual(handles[1000].backup_level, 'Incremental')
+        self.assertEqual(self.server.total_requests, 0)
+
+        self.assertIsInstance(handles[1000].to_job(), Job)
+
+    def test_invalid_job(self):
+        with self.assertRaises(SDKException):
+            JobHandle(self.commcell, 'abc')
+
+        with self.assertRaises(SDKException):
+            JobHandle(self.commcell, 5000).refresh()
+
+
+class JobWatcherTest(JobTestCase):
+
+    def test_single_query(self):
+        watcher = JobWatcher(self.commcell, interval=INTERVAL)
+
+        for job_id in (10, 500, 999):
+            watcher.watch(job_id)
+
+        self.assertEqual(
+            watcher.wait(), {'10': 'Completed', '500': 'Completed', '999': 'Completed'}
+        )
+
+        # the jobs are fetched by their ids, even if they are not the most recent ones
+        self.assertEqual(self.server.request_counts.get('POST Jobs'), 1)
+        self.assertNotIn('GET Job', self.server.request_counts)
+
+    def test_status_changes(self):
+        changes = []
+        self.server.set_job_status(1, 'Running')
+
+        with JobWatcher(self.commcell, interval=INTERVAL, max_interval=INTERVAL) as watcher:
+            future = watcher.watch(1, lambda *args: changes.append(args[:2]))
+
+            time.sleep(INTERVAL * 4)
+            self.assertFalse(future.done())
+            self.assertEqual(watcher.jobs, {'1': 'Running'})
+
+            self.server.set_job_status(1, 'Completed')
+            result = future.result(timeout=5)
+
+        self.assertEqual(result['status'], 'Completed')
+        self.assertIn('jobDetail', result['details'])
+        self.assertEqual(changes, [('1', 'Running'), ('1', 'Completed')])
+
+    def test_poll_errors(self):
+        self.server.set_job_status(1, 'Running')
+
+        def failing_callback(job_id, status, summary):
+            raise ValueError('callback failed')
+
+        with JobWatcher(self.commcell, interval=INTERVAL, max_interval=INTERVAL) as watcher:
+            future = watcher.watch(1, failing_callback)
+
+            # error response, and a malformed response, failing with a KeyError
+            self.server.fail_requests('POST Jobs', 2)
+            time.sleep(INTERVAL * 4)
+            self.server.fail_requests('POST Jobs', 2, {'jobs': [{'jobSummary': {'jobId': 1}}]})
+            time.sleep(INTERVAL * 4)
+
+            self.server.set_job_status(1, 'Completed')
+
+            # the loop survives the failed polls, and the exceptions raised by the callbacks
+            self.assertEqual(future.result(timeout=5)['status'], 'Completed')
+            self.assertIsInstance(watcher.last_error, ValueError)
+
+    def test_loop_exit(self):
+        self.server.set_job_status(1, 'Running')
+        watcher = JobWatcher(self.commcell, interval=INTERVAL)
+        future = watcher.watch(1)
+
+        def exit_loop():
+            raise SystemExit()
+
+        watcher.poll = exit_loop
+        watcher.start()
+
+        # the futures of the jobs are failed, instead of never being resolved
+        self.assertIsInstance(future.exception(timeout=5), SDKException)
+        watcher.stop()
+
+    def test_wait_timeout(self):
+        self.server.set_job_status(1, 'Running')
+        watcher = JobWatcher(self.commcell, interval=INTERVAL, max_interval=INTERVAL)
+
+        start_time = time.time()
+        self.assertEqual(watcher.wait([1, 2], timeout=0.5), {'2': 'Completed'})
+        self.assertLess(time.time() - start_time, 2)
+        self.assertEqual(watcher.jobs, {'1': 'Running'})
+
+        self.server.fail_requests('POST Jobs', 100)
+        self.assertEqual(watcher.wait([1], timeout=0.3), {})
+        self.assertIsInstance(watcher.last_error, SDKException)
+
+    def test_wait_timeout_backoff(self):
+        self.server.set_job_status(1, 'Running')
+        watcher = JobWatcher(self.commcell, interval=2, max_interval=60)
+
+        # the interval between the polls does not extend the wait past the timeout
+        start_time = time.time()
+        self.assertEqual(watcher.wait([1], timeout=0.3), {})
+        self.assertLess(time.time() - start_time, 1)
+
+    def test_wait_failed_jobs(self):
+        self.server.set_job_status(1, 'Running')
+        watcher = JobWatcher(self.commcell, interval=INTERVAL)
+        watcher.watch(1)
+
+        def exit_loop():
+            time.sleep(INTERVAL * 2)
+            raise SystemExit()
+
+        watcher.poll = exit_loop
+        watcher.start()
+
+        # the jobs failed by the exit of the poll loop are left out, instead of raising
+        self.assertEqual(watcher.wait([1], timeout=5), {})
+        self.assertIsInstance(watcher.last_error, SDKException)
+        watcher.stop()
+
+
+class JobControllerTest(JobTestCase):
+
+    def test_bulk_action(self):
+        job_controller = self.commcell.job_controller
+
+        self.assertEqual(
+            job_controller.bulk_action([1, 2, 5000], 'suspend'),
+            {'1': (True, None), '2': (True, None), '5000': (False, 'Job [5000] does not exist')}
+        )
+        self.assertEqual(self.server.request_counts, {'POST Job': 3})
+
+    def test_bulk_action_invalid_response(self):
+        # response which is not a JSON, and a JSON with an unexpected structure
+        self.server.fail_requests('POST Job', 1, 'Service unavailable')
+        result = self.commcell.job_controller.bulk_action([1], 'kill', workers=1)
+        self.assertFalse(result['1'][0])
+        self.assertIn('Service unavailable', result['1'][1])
+
+        self.server.fail_requests('POST Job', 1, {'errors': []})
+        result = self.commcell.job_controller.bulk_action([1, 2], 'resume', workers=1)
+        self.assertFalse(result['1'][0])
+        self.assertEqual(result['2'], (True, None))
+
+        with self.assertRaises(SDKException):
+            self.commcell.job_controller.bulk_action([1], 'restart')
+
+    def test_iter_jobs_offset(self):
+        jobs = self.commcell.job_controller.iter_jobs(
+            lookup_time=100000, page_size=400, offset=100, prefetch=False
+        )
+
+        # the jobs are listed from the offset given, most recent first
+        self.assertEqual([int(job_id) for job_id, _ in jobs], list(range(900, 0, -1)))
+        self.assertEqual(self.server.request_counts, {'POST Jobs': 3})
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
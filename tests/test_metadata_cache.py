@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the MetadataCache and the DiskMetadataCache, run against the local mock CommServe."""
+
+import os
+import pickle
+import shutil
+import tempfile
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from mockserver import MockCommServe
+
+from cvpysdk.commcell import Commcell
+from cvpysdk.metadata_cache import DiskMetadataCache
+from cvpysdk.metadata_cache import MetadataCache
+
+
+class _Exploit(object):
+    """Object running a callable when unpickled, which the cache must never do."""
+
+    executed = False
+
+    def __reduce__(self):
+        return (setattr, (_Exploit, 'executed', True))
+
+
+class MetadataCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockCommServe()
+        self.server.start()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.directory)
+
+    def _client_requests(self):
+        return self.server.request_counts.get('GET Client', 0)
+
+    def test_cache_hit(self):
+        commcell = Commcell(metadata_cache=MetadataCache(ttl=60), **self.server.commcell_kwargs)
+        commcell.clients.refresh()
+        self.server.reset_counts()
+
+        commcell.clients.refresh()
+
+        self.assertEqual(self._client_requests(), 0)
+        self.assertTrue(commcell.clients.has_client('client1'))
+        self.assertGreater(commcell.metadata_cache.stats['hits'], 0)
+        commcell.logout()
+
+    def test_invalidate_with_custom_headers(self):
+        commcell = Commcell(metadata_cache=MetadataCache(ttl=60), **self.server.commcell_kwargs)
+        commcell.clients
+        self.server.reset_counts()
+
+        commcell.metadata_cache.clear()
+        commcell.clients.refresh()
+        refresh_requests = self._client_requests()
+        self.server.reset_counts()
+
+        # a write with custom headers must invalidate the cache as well
+        commcell._cvpysdk_object.make_request(
+            'POST', commcell._services['SUSPEND_JOB'] % 1, headers=commcell._headers.copy()
+        )
+        commcell.clients.refresh()
+
+        self.assertEqual(self._client_requests(), refresh_requests)
+        self.assertEqual(commcell.metadata_cache.stats['invalidations'], 1)
+
+        # the read only requests do not invalidate the cache
+        commcell.job_controller.all_jobs(lookup_time=100000)
+        commcell.clients.refresh()
+
+        self.assertEqual(self._client_requests(), refresh_requests)
+        commcell.logout()
+
+    def test_disk_cache(self):
+        commcell = Commcell(
+            metadata_cache=DiskMetadataCache(self.directory, ttl=60), **self.server.commcell_kwargs
+        )
+        commcell.clients.refresh()
+        token = commcell._headers['Authtoken']
+
+        file_names = [name for name in os.listdir(self.directory) if name.endswith('.cache')]
+        self.assertTrue(file_names)
+
+        for file_name in file_names:
+            with open(os.path.join(self.directory, file_name), 'rb') as cache_file:
+                self.assertNotIn(token.split()[-1].encode(), cache_file.read())
+
+        # a new cache on the same directory serves the response from the disk
+        cache = DiskMetadataCache(self.directory, ttl=60)
+        url = commcell._services['GET_ALL_CLIENTS']
+        response = cache.get(commcell._user, url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('clientProperties', response.json())
+
+        # the entries written by another process are never unpickled
+        with open(cache._path(cache._make_key('mallory', url)), 'wb') as cache_file:
+            pickle.dump((0, _Exploit()), cache_file)
+
+        self.assertIsNone(cache.get('mallory', url))
+        self.assertFalse(_Exploit.executed)
+
+        commcell.logout()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the decoding of the JSON body of the responses, with the json module and orjson."""
+
+import copy
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from cvpysdk import response as response_module
+from cvpysdk.response import JSONResponse
+
+
+def make_response(content, encoding='utf-8'):
+    """Returns a JSONResponse with the given body."""
+    response = JSONResponse()
+    response.status_code = 200
+    response.encoding = encoding
+    response._content = content
+    response._content_consumed = True
+    return response
+
+
+class JSONResponseTest(unittest.TestCase):
+
+    def tearDown(self):
+        response_module.use_orjson(False)
+
+    def check_decode(self):
+        self.assertEqual(make_response(b'{"a": [1, 2.5, null]}').json(), {'a': [1, 2.5, None]})
+
+        # byte order mark, and integers larger than 64 bits
+        self.assertEqual(make_response(b'\xef\xbb\xbf{"a": 1}').json(), {'a': 1})
+        self.assertEqual(make_response(b'{"a": 123456789012345678901234567890}').json(),
+                         {'a': 123456789012345678901234567890})
+
+        self.assertEqual(make_response('{"a": "é"}'.encode('latin-1'), 'ISO-8859-1').json(),
+                         {'a': 'é'})
+
+        with self.assertRaises(ValueError):
+            make_response(b'<html></html>').json()
+
+    def test_default_decoder(self):
+        self.assertIs(response_module.get_json_decoder(), response_module._decode)
+        self.check_decode()
+
+    @unittest.skipIf(response_module.orjson is None, 'orjson is not installed')
+    def test_orjson_decoder(self):
+        self.assertTrue(response_module.use_orjson())
+        self.assertIsNot(response_module.get_json_decoder(), response_module._decode)
+        self.check_decode()
+
+        self.assertFalse(response_module.use_orjson(False))
+        self.assertIs(response_module.get_json_decoder(), response_module._decode)
+
+    def test_decode_once(self):
+        response = make_response(b'{"a": {"b": 1}}')
+        self.assertIs(response.json(), response.json())
+
+        # the copies decode their body again, and do not share the decoded value
+        response.json()['a']['b'] = 2
+        self.assertEqual(copy.copy(response).json(), {'a': {'b': 1}})
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for reusing the session saved to the session file, run against the local mock CommServe."""
+
+import json
+import os
+import shutil
+import tempfile
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from mockserver import MockCommServe
+
+from cvpysdk.commcell import Commcell
+
+
+class SessionFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session_file = os.path.join(tempfile.mkdtemp(), 'session.json')
+        self.server = MockCommServe()
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(os.path.dirname(self.session_file))
+
+    def commcell(self):
+        return Commcell(
+            fast_start=True, session_file=self.session_file, **self.server.commcell_kwargs
+        )
+
+    def saved_tokens(self):
+        with open(self.session_file) as session_file:
+            return [session['authtoken'] for session in json.load(session_file).values()]
+
+    def test_reuse_session(self):
+        self.commcell()
+        self.assertEqual(self.server.request_counts['POST Login'], 1)
+
+        self.server.reset_counts()
+        commcell = self.commcell()
+        self.assertNotIn('POST Login', self.server.request_counts)
+
+        commcell.logout()
+        self.assertEqual(self.saved_tokens(), [])
+
+    def test_renewed_token(self):
+        commcell = self.commcell()
+        self.server.expire_token()
+
+        self.assertEqual(commcell.clients.get('client1').client_id, '1')
+        self.assertEqual(self.saved_tokens(), [commcell._headers['Authtoken']])
+
+        # the renewed token is reused, instead of logging in again
+        self.server.reset_counts()
+        self.commcell()
+        self.assertNotIn('POST Login', self.server.request_counts)
+        self.assertNotIn('POST RenewLoginToken', self.server.request_counts)
+
+        commcell.logout()
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
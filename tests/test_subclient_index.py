@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the subclient index shared by the backupsets of a client, run against the local
+mock CommServe.
+"""
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from mockserver import MockCommServe
+
+from cvpysdk.commcell import Commcell
+
+
+class SubclientIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockCommServe(backupsets=2, subclients=2)
+        self.server.start()
+
+        self.commcell = Commcell(**self.server.commcell_kwargs)
+        self.agent = self.commcell.clients.get('client1').agents.get('file system')
+
+    def tearDown(self):
+        self.commcell.logout()
+        self.server.stop()
+
+    def _subclient_requests(self):
+        return self.server.request_counts.get('GET Subclient', 0)
+
+    def test_lazy_shared_index(self):
+        self.server.reset_counts()
+
+        backupsets = [
+            self.agent.backupsets.get(name) for name in self.agent.backupsets.all_backupsets
+        ]
+
+        # the subclients are not fetched until they are used
+        self.assertEqual(self._subclient_requests(), 0)
+
+        for backupset in backupsets:
+            self.assertEqual(len(backupset.subclients.all_subclients), 2)
+
+        # and are then fetched once for all the backupsets of the client
+        self.assertEqual(self._subclient_requests(), 1)
+
+    def test_refresh(self):
+        backupset = self.agent.backupsets.get('defaultbackupset')
+        self.assertEqual(len(backupset.subclients.all_subclients), 2)
+
+        # subclients added outside of the SDK
+        self.server.subclients = 3
+
+        self.assertEqual(len(backupset.subclients.all_subclients), 2)
+
+        backupset.refresh()
+        self.assertEqual(len(backupset.subclients.all_subclients), 3)
+        self.assertTrue(backupset.subclients.has_subclient('subclient3'))
+
+        self.server.subclients = 1
+
+        backupset.subclients.refresh()
+        self.assertEqual(list(backupset.subclients.all_subclients), ['default'])
+        self.assertEqual(backupset.subclients.default_subclient, 'default')
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()